@@ -1,11 +1,11 @@
 import logging
+import sys
 from pathlib import Path
 
 from src.config import AppConfig
-from src.analysis import DataAnalyzer
-from src.cli import run_cli # Import the CLI runner function
-from src.data_loader import DataLoaderError
-from src.report_saver import ReportSaverError
+from src.cli import run_cli, build_arg_parser, run_script, read_queries, emit_records # Import the CLI runner functions
+# src.analysis (pandas) and src.service are imported in the modes that need them,
+# so the '--server' thin client and '--help' do not load pandas
 
 
 log_format = '%(asctime)s - [%(levelname)s] - %(module)s:%(lineno)d - %(message)s'
@@ -30,17 +30,59 @@ except Exception as log_setup_err:
     logging.error(f"Failed to configure file logging: {log_setup_err}", exc_info=True)
 
 
-def main():
+def run_scripted(args) -> int:
+    """
+    Scripted mode: processes the data once, runs every query of one
+    subcommand and prints the results (JSON/CSV) instead of the menu.
+    With --server the queries go to a running analysis service instead,
+    and 'serve' runs that service.
+    """
+    # Only warnings go to the console, so that the output can be piped
+    for handler in logging.getLogger().handlers:
+        if not isinstance(handler, logging.FileHandler):
+            handler.setLevel(logging.WARNING)
+    try:
+        if args.command == 'serve':
+            from src.service import serve
+            serve(AppConfig(), args.host, args.port, Path(args.output_dir))
+            return 0
+        if args.server:
+            # Thin client: the service already holds the processed data
+            from src.service_client import query_service
+            records = query_service(args.server, args.command, read_queries(args), kind=getattr(args, 'kind', None))
+            return emit_records(records, args)
+        from src.analysis import DataAnalyzer
+        analyzer = DataAnalyzer(AppConfig())
+        analyzer.process_data()
+        return run_script(analyzer, args)
+    except Exception as e:
+        logging.critical(f"Scripted command '{args.command}' failed: {e}", exc_info=True)
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 2
+
+
+def main(argv=None):
     """
     Main function to initialize the data analyzer, process data,
     and run the command-line interface (CLI).
+
+    With a subcommand (student, group, scholars, plot, pdf) the application
+    runs non-interactively; 'serve' starts the analysis service that these
+    subcommands can query with --server. See src.cli.build_arg_parser.
     """
+    args = build_arg_parser().parse_args(argv)
+    if args.command is not None:
+        return run_scripted(args)
+
     # Log the start of the application run
     separator = "=" * 40
     logging.info(separator)
     logging.info("Starting Student Performance Analysis Application")
     logging.info(separator)
 
+    from src.analysis import DataAnalyzer
+    from src.data_loader import DataLoaderError
+
     analyzer = None 
 
     try:
@@ -98,4 +140,4 @@ def main():
     logging.info(separator)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,182 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from .config import AppConfig
+from . import plotting
+
+# Bump when the look of the charts changes, so that existing files are re-rendered
+RENDER_VERSION = 1
+HASH_FILE_NAME = "plot_hashes.json"
+FIGURE_SIZES = {'group': (8, 8), 'student': (10, 6)}
+
+# One template figure per chart kind, created once in each worker process
+_templates: Dict[str, Tuple[Figure, object]] = {}
+# tight_layout result per set of bar labels (the margins only depend on the tick labels)
+_bar_layouts: Dict[Tuple[str, ...], Dict[str, float]] = {}
+
+
+def _get_template(kind: str) -> Tuple[Figure, object]:
+    """Returns the worker's reusable Agg figure and axes for a chart kind (cleared)."""
+    if kind not in _templates:
+        fig = Figure(figsize=FIGURE_SIZES[kind])
+        FigureCanvasAgg(fig) # Headless canvas, no pyplot / GUI backend involved
+        _templates[kind] = (fig, fig.add_subplot())
+    fig, ax = _templates[kind]
+    ax.clear()
+    return fig, ax
+
+
+def _render_task(task: Dict) -> str:
+    """Renders one chart (task prepared by _build_tasks) with the template figure."""
+    fig, ax = _get_template(task['kind'])
+    values = pd.Series(dict(task['values']))
+    if task['kind'] == 'group':
+        plotting.draw_group_performance_pie(ax, values, task['title'])
+        fig.savefig(task['output_file'])
+    else:
+        plotting.draw_student_scores_bar(ax, values, task['title'])
+        labels = tuple(values.index)
+        if labels not in _bar_layouts:
+            fig.tight_layout()
+            params = fig.subplotpars
+            _bar_layouts[labels] = {'left': params.left, 'right': params.right, 'bottom': params.bottom, 'top': params.top}
+        else:
+            fig.subplots_adjust(**_bar_layouts[labels])
+        fig.savefig(task['output_file'])
+    return task['output_file']
+
+
+def _render_chunk(tasks: List[Dict]) -> List[Tuple[str, Optional[str]]]:
+    """Renders a chunk of tasks; returns (output_file, error message or None) for each."""
+    results = []
+    for task in tasks:
+        try:
+            _render_task(task)
+            results.append((task['output_file'], None))
+        except Exception as e:
+            logging.error(f"Failed to render {task['output_file']}: {e}", exc_info=True)
+            results.append((task['output_file'], str(e)))
+    return results
+
+
+def _data_hash(task: Dict) -> str:
+    """Hash of everything that determines the chart image."""
+    payload = json.dumps([RENDER_VERSION, task['kind'], task['title'], task['values']], ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _build_tasks(df: pd.DataFrame, config: AppConfig, output_dir: Path) -> List[Dict]:
+    """Prepares the plot data of every group and every student (only picklable values)."""
+    tasks = []
+    group_counts = plotting.prepare_pie_chart_matrix(df, config) # All groups in one pass
+    for group_id, counts in zip(group_counts.index, group_counts.to_numpy()):
+        score_counts = plotting.pie_chart_series(counts)
+        if score_counts.empty:
+            logging.warning(f"No valid scores found for group {group_id} to generate pie chart.")
+            continue
+        tasks.append({
+            'kind': 'group',
+            'title': str(group_id),
+            'values': [(label, int(count)) for label, count in score_counts.items()],
+            'output_file': str(plotting.group_plot_filename(output_dir, group_id)),
+        })
+
+    score_columns = [col for col in config.subject_score_columns if col in df.columns]
+    subjects = [col.replace('(бали)', '').replace('(Бали)', '').strip() for col in score_columns]
+    names = df[config.name_column].tolist()
+    score_rows = df[score_columns].to_numpy(dtype=float, na_value=float('nan')).tolist()
+    for name, row in zip(names, score_rows):
+        if pd.isna(name):
+            continue
+        values = [(subject, score) for subject, score in zip(subjects, row) if pd.notna(score)]
+        if not values:
+            logging.warning(f"No valid scores found for student {name} to generate bar chart.")
+            continue
+        tasks.append({
+            'kind': 'student',
+            'title': str(name),
+            'values': values,
+            'output_file': str(plotting.student_plot_filename(output_dir, name)),
+        })
+    return tasks
+
+
+def _load_hashes(hash_file: Path) -> Dict[str, str]:
+    try:
+        with open(hash_file, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def render_all_plots(df: pd.DataFrame, config: AppConfig, output_dir: Path,
+                     max_workers: Optional[int] = None, force: bool = False,
+                     chunk_size: int = 32) -> Dict[str, List[str]]:
+    """
+    Renders the pie chart of every group and the bar chart of every student
+    headlessly (Agg) with a process pool.
+
+    Each worker draws into one template figure per chart kind instead of
+    creating a new figure per chart. A chart whose data hash matches the one
+    recorded in output_dir/plot_hashes.json (and whose file exists) is not
+    rendered again.
+
+    Args:
+        df: The processed DataFrame.
+        config: Application configuration.
+        output_dir: Directory to save the plots.
+        max_workers: Number of worker processes (None: CPU count, 1: render in this process).
+        force: If True, re-render every chart regardless of the hashes.
+        chunk_size: Number of charts sent to a worker at once.
+
+    Returns:
+        A dictionary with lists of files: 'rendered', 'skipped' and 'failed'.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    hash_file = output_dir / HASH_FILE_NAME
+    old_hashes = {} if force else _load_hashes(hash_file)
+
+    # Students with the same name share a file name; the last one wins, as with single plots
+    tasks = {task['output_file']: task for task in _build_tasks(df, config, output_dir)}
+    new_hashes = {output_file: _data_hash(task) for output_file, task in tasks.items()}
+    summary = {'rendered': [], 'skipped': [], 'failed': []}
+    pending = []
+    for output_file, task in tasks.items():
+        if old_hashes.get(output_file) == new_hashes[output_file] and Path(output_file).exists():
+            summary['skipped'].append(output_file)
+        else:
+            pending.append(task)
+    logging.info(f"Batch plotting: {len(tasks)} charts, {len(pending)} to render, {len(summary['skipped'])} unchanged.")
+
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    workers = min(max_workers or os.cpu_count() or 1, len(chunks)) if chunks else 0
+    if workers <= 1:
+        results = [result for chunk in chunks for result in _render_chunk(chunk)]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = [result for chunk_results in executor.map(_render_chunk, chunks) for result in chunk_results]
+
+    hashes = {key: value for key, value in old_hashes.items() if key not in new_hashes}
+    for output_file, error in results:
+        if error is None:
+            summary['rendered'].append(output_file)
+        else:
+            summary['failed'].append(output_file)
+    for output_file in summary['rendered'] + summary['skipped']:
+        hashes[output_file] = new_hashes[output_file]
+
+    with open(hash_file, 'w', encoding='utf-8') as f:
+        json.dump(hashes, f, ensure_ascii=False, indent=1)
+
+    logging.info(f"Batch plotting finished: {len(summary['rendered'])} rendered, "
+                 f"{len(summary['skipped'])} skipped, {len(summary['failed'])} failed.")
+    return summary
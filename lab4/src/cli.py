@@ -1,14 +1,22 @@
+import argparse
+import csv
+import json
 import logging
-import pandas as pd
+import math
+import sys
 from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, TYPE_CHECKING
 
-from .analysis import DataAnalyzer
-from .plotting import plot_group_performance_pie, plot_student_scores_bar
-from .pdf_reporter import generate_group_report_pdf
+# pandas, matplotlib and ReportLab are imported where first used, so that
+# '--help' and the '--server' thin client start without loading them
+if TYPE_CHECKING:
+    import pandas as pd
+    from .analysis import DataAnalyzer
 
 
-def display_student_info(student_data: pd.Series, config):
+def display_student_info(student_data: "pd.Series", config):
     """Formats and prints student details."""
+    import pandas as pd
     print("\n--- Student Details ---")
     print(f"Name: {student_data.get(config.name_column, 'N/A')}")
     print(f"Group: {student_data.get(config.group_column, 'N/A')}")
@@ -38,7 +46,7 @@ def display_group_info(group_stats: dict):
     print("-" * 22)
 
 
-def display_scholarship_list(scholars_df: pd.DataFrame, config):
+def display_scholarship_list(scholars_df: "pd.DataFrame", config):
     """Prints the list of students receiving scholarships."""
     if scholars_df is None or scholars_df.empty:
         print("\nNo students found receiving scholarships.")
@@ -50,7 +58,7 @@ def display_scholarship_list(scholars_df: pd.DataFrame, config):
     print("-" * 28)
 
 
-def run_cli(analyzer: DataAnalyzer):
+def run_cli(analyzer: "DataAnalyzer"):
     """Runs the main command-line interface loop."""
     
     if not analyzer._is_processed or analyzer.processed_df is None:
@@ -68,6 +76,7 @@ def run_cli(analyzer: DataAnalyzer):
         print("  4. Generate Group Performance Plot (Pie Chart)")
         print("  5. Generate Student Score Plot (Bar Chart)")
         print("  6. Generate Group PDF Report")
+        print("  7. Generate All Group and Student Plots")
         print("  0. Exit")
         
         choice = input("Enter command number: ").strip()
@@ -114,6 +123,7 @@ def run_cli(analyzer: DataAnalyzer):
                      print(f"Error: Group '{group_id}' not found or has no data.")
                      continue
 
+                from .plotting import plot_group_performance_pie
                 output_file = plot_group_performance_pie(group_df, group_id, analyzer.config, Path("output"))
                 if output_file:
                     print(f"Group performance pie chart saved to: {output_file}")
@@ -138,6 +148,7 @@ def run_cli(analyzer: DataAnalyzer):
                      # For now, we'll just skip plotting if multiple found
                      
                  if selected_student_data is not None:
+                     from .plotting import plot_student_scores_bar
                      output_file = plot_student_scores_bar(selected_student_data, analyzer.config, Path("output"))
                      if output_file:
                          print(f"Student score bar chart saved to: {output_file}")
@@ -157,6 +168,7 @@ def run_cli(analyzer: DataAnalyzer):
                         print(f"Error: Group '{group_id}' not found or has no data.")
                         continue
 
+                    from .pdf_reporter import generate_group_report_pdf
                     output_file = generate_group_report_pdf(group_df, group_stats, group_id, analyzer.config, Path("output"))
                     if output_file:
                         print(f"Group PDF report saved to: {output_file}")
@@ -170,6 +182,13 @@ def run_cli(analyzer: DataAnalyzer):
                      logging.error("PDF generation failed", exc_info=True)
 
 
+            elif choice == '7':
+                from .batch_plotting import render_all_plots
+                print("Rendering plots for all groups and students... Please wait.")
+                summary = render_all_plots(analyzer.processed_df, analyzer.config, Path("output") / "plots")
+                print(f"Plots rendered: {len(summary['rendered'])}, unchanged (skipped): {len(summary['skipped'])}, failed: {len(summary['failed'])}.")
+                print(f"Plots saved to: {Path('output') / 'plots'}")
+
             elif choice == '0':
                 print("Exiting CLI. Goodbye!")
                 break
@@ -182,4 +201,273 @@ def run_cli(analyzer: DataAnalyzer):
              break
         except Exception as e:
             print(f"\nAn unexpected error occurred: {e}")
-            logging.error("CLI Error", exc_info=True)
\ No newline at end of file
+            logging.error("CLI Error", exc_info=True)
+
+
+# === Scripted (non-interactive) mode ===
+
+SCRIPT_COMMANDS = ('student', 'group', 'scholars', 'plot', 'pdf')
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Builds the parser of the scripted mode (no subcommand = interactive menu)."""
+    parser = argparse.ArgumentParser(
+        description="Student performance analysis. Run without a command for the interactive menu."
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('-f', '--queries-file', help="File with one query per line ('-' for stdin); adds to the queries given as arguments.")
+    common.add_argument('--format', choices=('json', 'csv'), default='json', help="Output format (default: json).")
+    common.add_argument('-o', '--output', help="Write the results to this file instead of stdout.")
+    common.add_argument('--server', metavar='URL',
+                        help="Ask a running analysis service (see 'serve') instead of processing the data here. "
+                             "Charts and reports are then written to the service's output directory.")
+
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    student = subparsers.add_parser('student', parents=[common], help="Look up students by full or partial name.")
+    student.add_argument('queries', nargs='*', metavar='NAME')
+
+    group = subparsers.add_parser('group', parents=[common], help="Statistics of groups (default: the target group).")
+    group.add_argument('queries', nargs='*', metavar='GROUP')
+
+    subparsers.add_parser('scholars', parents=[common], help="List all scholarship recipients.")
+
+    plot = subparsers.add_parser('plot', parents=[common], help="Save group pie charts or student bar charts.")
+    plot.add_argument('kind', choices=('group', 'student', 'all'), help="'all' renders every group and student chart.")
+    plot.add_argument('queries', nargs='*', metavar='QUERY')
+    plot.add_argument('--output-dir', default='output', help="Directory for the charts (default: output).")
+
+    pdf = subparsers.add_parser('pdf', parents=[common], help="Generate group PDF reports (default: the target group).")
+    pdf.add_argument('queries', nargs='*', metavar='GROUP')
+    pdf.add_argument('--output-dir', default='output', help="Directory for the reports (default: output).")
+
+    serve = subparsers.add_parser('serve', help="Keep the processed data in memory and answer queries over local HTTP.")
+    serve.add_argument('--host', help="Address to bind (default: config.service_host, this machine only).")
+    serve.add_argument('--port', type=int, help="Port (default: config.service_port).")
+    serve.add_argument('--output-dir', default='output', help="Directory for charts and reports (default: output).")
+    return parser
+
+
+def read_queries(args: argparse.Namespace) -> List[str]:
+    """Queries from the command line followed by those from --queries-file (blank lines and # comments skipped)."""
+    queries = list(getattr(args, 'queries', None) or [])
+    if getattr(args, 'queries_file', None):
+        if args.queries_file == '-':
+            lines = sys.stdin.read().splitlines()
+        else:
+            lines = Path(args.queries_file).read_text(encoding='utf-8').splitlines()
+        queries.extend(line.strip() for line in lines if line.strip() and not line.lstrip().startswith('#'))
+    return queries
+
+
+def _to_plain(value: Any) -> Any:
+    """Converts numpy/pandas scalars to JSON/CSV friendly values (missing -> None)."""
+    # A value can only be a numpy/pandas scalar if that library is loaded (not so in the thin client)
+    np, pd = sys.modules.get('numpy'), sys.modules.get('pandas')
+    if np is not None and isinstance(value, np.generic):
+        value = value.item()
+    if value is None or (isinstance(value, float) and math.isnan(value)) or (pd is not None and value is pd.NA):
+        return None
+    return value
+
+
+def _student_record(student_data: "pd.Series", config) -> Dict[str, Any]:
+    record = {
+        'name': student_data.get(config.name_column),
+        'group': student_data.get(config.group_column),
+        'gpa': student_data.get(config.gpa_column),
+        'scholarship': student_data.get(config.scholarship_column) == config.scholarship_marker,
+    }
+    for score_col in config.subject_score_columns:
+        record[score_col] = student_data.get(score_col)
+        grade_col = config.get_national_scale_column_name(score_col)
+        record[grade_col] = student_data.get(grade_col)
+    return {key: _to_plain(value) for key, value in record.items()}
+
+
+def _student_queries(analyzer: "DataAnalyzer", queries: List[str]) -> List[Dict[str, Any]]:
+    records = []
+    for query in queries:
+        results = analyzer.find_student_by_name(query)
+        if results is None or results.empty:
+            records.append({'query': query, 'error': 'not found'})
+            continue
+        for _, student_data in results.iterrows():
+            records.append({'query': query, **_student_record(student_data, analyzer.config)})
+    return records
+
+
+def _resolve_group_ids(analyzer: "DataAnalyzer", queries: List[str]) -> List[Any]:
+    """
+    Maps group queries (always text) to the group values of the data, which
+    may be numbers (e.g. 342) when the column mixes numeric and text groups.
+    """
+    groups = analyzer.processed_df[analyzer.config.group_column].dropna().unique()
+    groups_by_text = {str(group): group for group in groups}
+    return [groups_by_text.get(query, query) for query in queries]
+
+
+def _group_queries(analyzer: "DataAnalyzer", queries: List[str]) -> List[Dict[str, Any]]:
+    records = []
+    for query, group_id in zip(queries, _resolve_group_ids(analyzer, queries)):
+        try:
+            stats = analyzer.get_group_stats(group_id)
+        except ValueError as e: # Group not found
+            records.append({'query': query, 'error': str(e)})
+            continue
+        records.append({'query': query, **{key: _to_plain(value) for key, value in stats.items()}})
+    return records
+
+
+def _scholars(analyzer: "DataAnalyzer") -> List[Dict[str, Any]]:
+    scholars_df = analyzer.get_scholarship_students()
+    if scholars_df is None:
+        return []
+    return [_student_record(student_data, analyzer.config) for _, student_data in scholars_df.iterrows()]
+
+
+def _plot_queries(analyzer: "DataAnalyzer", kind: str, queries: List[str], output_dir: Path) -> List[Dict[str, Any]]:
+    from .plotting import plot_group_performance_pie, plot_student_scores_bar
+    from .batch_plotting import render_all_plots
+
+    config = analyzer.config
+    if kind == 'all':
+        summary = render_all_plots(analyzer.processed_df, config, output_dir)
+        return [{'query': 'all', 'output_file': output_file, 'status': status}
+                for status in ('rendered', 'skipped', 'failed') for output_file in summary[status]]
+
+    records = []
+    group_ids = _resolve_group_ids(analyzer, queries) if kind == 'group' else queries
+    for query, group_id in zip(queries, group_ids):
+        if kind == 'group':
+            group_df = analyzer.get_group_data(group_id)
+            if group_df is None:
+                records.append({'query': query, 'error': f"Group '{query}' not found or has no data."})
+                continue
+            output_file = plot_group_performance_pie(group_df, query, config, output_dir)
+            records.append({'query': query, 'output_file': output_file} if output_file
+                           else {'query': query, 'error': 'no valid scores to plot'})
+        else:
+            results = analyzer.find_student_by_name(query)
+            if results is None or results.empty:
+                records.append({'query': query, 'error': 'not found'})
+                continue
+            for _, student_data in results.iterrows():
+                output_file = plot_student_scores_bar(student_data, config, output_dir)
+                record = {'query': query, 'name': student_data.get(config.name_column)}
+                record.update({'output_file': output_file} if output_file else {'error': 'no valid scores to plot'})
+                records.append(record)
+    return records
+
+
+def _pdf_queries(analyzer: "DataAnalyzer", queries: List[str], output_dir: Path) -> List[Dict[str, Any]]:
+    from .pdf_reporter import generate_group_report_pdf
+
+    records = []
+    for query, group_id in zip(queries, _resolve_group_ids(analyzer, queries)):
+        try:
+            group_stats = analyzer.get_group_stats(group_id)
+        except ValueError as e:
+            records.append({'query': query, 'error': str(e)})
+            continue
+        output_file = generate_group_report_pdf(analyzer.get_group_data(group_id), group_stats, query, analyzer.config, output_dir)
+        records.append({'query': query, 'output_file': output_file} if output_file
+                       else {'query': query, 'error': 'PDF generation failed'})
+    return records
+
+
+def write_records(records: List[Dict[str, Any]], output_format: str, stream: TextIO) -> None:
+    """Writes result records as a JSON array or as CSV (columns: union of all record keys)."""
+    if output_format == 'json':
+        json.dump(records, stream, ensure_ascii=False, indent=2, default=str)
+        stream.write('\n')
+        return
+    fieldnames: Dict[str, None] = {}
+    for record in records:
+        fieldnames.update(dict.fromkeys(record))
+    writer = csv.DictWriter(stream, fieldnames=list(fieldnames), lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(records)
+
+
+def execute_command(analyzer: "DataAnalyzer", command: str, queries: List[str],
+                    kind: Optional[str] = None, output_dir: Path = Path("output")) -> List[Dict[str, Any]]:
+    """
+    Runs one scripted command with all its queries against the processed data.
+    Shared by the scripted CLI and the analysis service.
+
+    Args:
+        analyzer: A DataAnalyzer with processed data.
+        command: One of SCRIPT_COMMANDS.
+        queries: Student names or group IDs (group/pdf default to the target group).
+        kind: Chart kind for 'plot': 'group', 'student' or 'all'.
+        output_dir: Directory for the files of 'plot' and 'pdf'.
+
+    Returns:
+        One result record (dict) per result; failed lookups have an 'error' key.
+
+    Raises:
+        ValueError: If the command is unknown or required queries are missing.
+    """
+    if command in ('group', 'pdf') and not queries:
+        queries = [analyzer.config.target_group]
+    if command == 'student' or (command == 'plot' and kind != 'all'):
+        if not queries:
+            raise ValueError(f"'{command}' needs at least one query (arguments or --queries-file).")
+
+    logging.info(f"Scripted command '{command}' with {len(queries)} queries.")
+    if command == 'student':
+        return _student_queries(analyzer, queries)
+    elif command == 'group':
+        return _group_queries(analyzer, queries)
+    elif command == 'scholars':
+        return _scholars(analyzer)
+    elif command == 'plot':
+        if kind not in ('group', 'student', 'all'):
+            raise ValueError(f"Unknown plot kind: {kind}. Use 'group', 'student' or 'all'.")
+        return _plot_queries(analyzer, kind, queries, output_dir)
+    elif command == 'pdf':
+        return _pdf_queries(analyzer, queries, output_dir)
+    raise ValueError(f"Unknown command: {command}")
+
+
+def count_failed(records: List[Dict[str, Any]]) -> int:
+    """Number of result records that report a failure."""
+    return sum(1 for record in records if 'error' in record or record.get('status') == 'failed')
+
+
+def emit_records(records: List[Dict[str, Any]], args: argparse.Namespace, stream: Optional[TextIO] = None) -> int:
+    """
+    Writes the records to args.output (or stream/stdout) in args.format.
+
+    Returns:
+        Exit code: 0 if every query succeeded, 1 otherwise.
+    """
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8', newline='') as f:
+            write_records(records, args.format, f)
+    else:
+        write_records(records, args.format, stream or sys.stdout)
+
+    failed = count_failed(records)
+    if failed:
+        logging.warning(f"{failed} of {len(records)} results of '{args.command}' failed.")
+    return 1 if failed else 0
+
+
+def run_script(analyzer: "DataAnalyzer", args: argparse.Namespace, stream: Optional[TextIO] = None) -> int:
+    """
+    Runs one scripted command (see build_arg_parser) with all its queries
+    against the already processed data and writes the results.
+
+    Args:
+        analyzer: A DataAnalyzer with processed data.
+        args: Parsed command line arguments.
+        stream: Output stream when args.output is not set (default: stdout).
+
+    Returns:
+        Exit code: 0 if every query succeeded, 1 otherwise.
+    """
+    records = execute_command(analyzer, args.command, read_queries(args),
+                              kind=getattr(args, 'kind', None), output_dir=Path(getattr(args, 'output_dir', 'output')))
+    return emit_records(records, args, stream)
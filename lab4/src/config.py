@@ -43,6 +43,10 @@ class AppConfig:
     scholarship_marker: str = '*'
     national_scale_suffix: str = ' (нац шкала)' # Suffix for new grade columns
 
+    # --- Analysis Service (main.py serve) ---
+    service_host: str = '127.0.0.1' # Local only: the service has no authentication
+    service_port: int = 8765
+
     # --- Group Specific Analysis ---
     target_group: str = "536ст" # <<< ЗАМІНИ НА НОМЕР СВОЄЇ ГРУПИ! 
                                # Можна передавати через аргумент командного рядка пізніше
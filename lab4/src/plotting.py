@@ -16,6 +16,48 @@ SCORE_MAP_345 = {
 # Create bins and labels for pd.cut based on the map
 BINS_345 = [59] + [upper for lower, upper in sorted(SCORE_MAP_345.keys())]
 LABELS_345 = [score for (lower, upper), score in sorted(SCORE_MAP_345.items(), key=lambda item: item[0][0])]
+PIE_LABELS_345 = {3: 'Satisfactory (3)', 4: 'Good (4)', 5: 'Excellent (5)'}
+
+# Position in LABELS_345 of every integer score 0..100 (-1: not on the 3/4/5 scale),
+# same right-closed bins as pd.cut(bins=BINS_345)
+_LOOKUP_345 = np.searchsorted(BINS_345, np.arange(BINS_345[-1] + 1), side='left') - 1
+
+
+def _score_block(df: pd.DataFrame, config: AppConfig) -> np.ndarray:
+    """The numeric subject score columns of df as one float matrix (NaN for missing)."""
+    score_cols = [col for col in config.subject_score_columns
+                  if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+    return df[score_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _score_codes_345(block: np.ndarray) -> np.ndarray:
+    """
+    Maps a block of scores to positions in LABELS_345 (-1 for missing scores
+    and scores outside 60-100). Integer scores go through the lookup table,
+    fractional ones through a binary search over the same bins.
+    """
+    codes = np.full(block.shape, -1, dtype=np.intp)
+    with np.errstate(invalid='ignore'):
+        in_table = (block >= 0) & (block <= BINS_345[-1]) & (block == np.floor(block))
+    codes[in_table] = _LOOKUP_345[block[in_table].astype(np.intp)]
+
+    other = ~in_table & ~np.isnan(block)
+    if other.any():
+        values = block[other]
+        other_codes = np.searchsorted(BINS_345, values, side='left') - 1
+        other_codes[values > BINS_345[-1]] = -1
+        codes[other] = other_codes
+    return codes
+
+
+def pie_chart_series(counts: np.ndarray) -> pd.Series:
+    """Turns counts of 3/4/5 into the pie chart Series (labels as index, zero counts dropped)."""
+    present = np.flatnonzero(counts)
+    if present.size == 0:
+        return pd.Series(dtype=int) # Return empty series if no valid scores
+    labels = [PIE_LABELS_345[LABELS_345[i]] for i in present]
+    return pd.Series(counts[present], index=labels, name='count')
+
 
 def _prepare_pie_chart_data(group_df: pd.DataFrame, config: AppConfig) -> pd.Series:
     """
@@ -29,26 +71,76 @@ def _prepare_pie_chart_data(group_df: pd.DataFrame, config: AppConfig) -> pd.Ser
     Returns:
         A pandas Series with counts for each simplified score (3, 4, 5).
     """
-    all_scores_345 = []
-    for score_col in config.subject_score_columns:
-        if score_col in group_df.columns and pd.api.types.is_numeric_dtype(group_df[score_col]):
-            # Apply pd.cut using the defined bins and labels
-            simplified_scores = pd.cut(
-                group_df[score_col],
-                bins=BINS_345,
-                labels=LABELS_345,
-                right=True,
-                include_lowest=False # Scores exactly 59 or lower won't be included
-            ).dropna().astype(int) # Drop NaN results (scores outside 60-100) and convert labels (3,4,5) to int
-            all_scores_345.extend(simplified_scores.tolist())
-
-    if not all_scores_345:
-        return pd.Series(dtype=int) # Return empty series if no valid scores
+    codes = _score_codes_345(_score_block(group_df, config)).ravel()
+    counts = np.bincount(codes[codes >= 0], minlength=len(LABELS_345))
+    return pie_chart_series(counts)
+
+
+def prepare_pie_chart_matrix(df: pd.DataFrame, config: AppConfig) -> pd.DataFrame:
+    """
+    Counts the simplified scores (3/4/5) of all groups at once with a single
+    bincount over (group, score) pairs.
+
+    Args:
+        df: The processed DataFrame with all groups.
+        config: Application configuration.
 
-    # Count occurrences of 3, 4, 5
-    score_counts = pd.Series(all_scores_345).value_counts().sort_index()
-    score_counts.index = score_counts.index.map({3: 'Satisfactory (3)', 4: 'Good (4)', 5: 'Excellent (5)'})
-    return score_counts
+    Returns:
+        A DataFrame of counts: one row per group (sorted), one column per
+        simplified score label. Rows without a group are not counted.
+    """
+    group_codes, groups = pd.factorize(df[config.group_column], sort=True)
+    codes = _score_codes_345(_score_block(df, config))
+    keys = group_codes[:, np.newaxis] * len(LABELS_345) + codes
+    valid = (codes >= 0) & (group_codes[:, np.newaxis] >= 0)
+    counts = np.bincount(keys[valid], minlength=len(groups) * len(LABELS_345))
+    return pd.DataFrame(
+        counts.reshape(len(groups), len(LABELS_345)),
+        index=pd.Index(groups, name=config.group_column),
+        columns=[PIE_LABELS_345[score] for score in LABELS_345],
+    )
+
+
+def _student_scores_series(student_data: pd.Series, config: AppConfig) -> pd.Series:
+    """Returns the student's valid scores indexed by cleaned subject name."""
+    scores = {}
+    for col in config.subject_score_columns:
+        subject_name = col.replace('(бали)', '').replace('(Бали)', '').strip() # Use cleaned name for label
+        scores[subject_name] = student_data[col] if col in student_data.index else np.nan # NaN if column missing for student
+    return pd.Series(scores).dropna() # Remove subjects with NaN scores
+
+
+def group_plot_filename(output_dir: Path, group_id: str) -> Path:
+    """Path of the pie chart file for a group."""
+    return output_dir / f"group_{group_id}_performance_pie.png"
+
+
+def student_plot_filename(output_dir: Path, student_name: str) -> Path:
+    """Path of the bar chart file for a student (name sanitized for the filename)."""
+    safe_student_name = "".join(c if c.isalnum() else "_" for c in str(student_name))
+    return output_dir / f"student_{safe_student_name}_scores_bar.png"
+
+
+def draw_group_performance_pie(ax, score_counts: pd.Series, group_id: str) -> None:
+    """Draws the group performance pie chart onto ax."""
+    ax.pie(score_counts, labels=score_counts.index, autopct='%1.1f%%', startangle=90, counterclock=False)
+    ax.axis('equal') # Equal aspect ratio ensures that pie is drawn as a circle.
+    ax.set_title(f'Overall Performance Distribution (Simplified Scale) - Group {group_id}')
+
+
+def draw_student_scores_bar(ax, scores_series: pd.Series, student_name: str) -> None:
+    """Draws the student scores bar chart onto ax."""
+    bars = ax.bar(scores_series.index, scores_series.values, color='skyblue')
+    ax.set_ylabel('Score')
+    ax.set_xlabel('Subject')
+    ax.set_title(f'Scores for {student_name}')
+    ax.set_ylim(0, 105) # Set Y axis limit slightly above max score
+    for label in ax.get_xticklabels(): # Rotate labels if they overlap
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
+
+    # Add score labels on top of bars
+    ax.bar_label(bars, fmt='%.0f') # Display integer scores
 
 
 def plot_group_performance_pie(group_df: pd.DataFrame, group_id: str, config: AppConfig, output_dir: Path) -> Optional[str]:
@@ -74,13 +166,11 @@ def plot_group_performance_pie(group_df: pd.DataFrame, group_id: str, config: Ap
             return None
 
         fig, ax = plt.subplots(figsize=(8, 8))
-        ax.pie(score_counts, labels=score_counts.index, autopct='%1.1f%%', startangle=90, counterclock=False)
-        ax.axis('equal') # Equal aspect ratio ensures that pie is drawn as a circle.
-        ax.set_title(f'Overall Performance Distribution (Simplified Scale) - Group {group_id}')
+        draw_group_performance_pie(ax, score_counts, group_id)
 
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
-        output_filename = output_dir / f"group_{group_id}_performance_pie.png"
+        output_filename = group_plot_filename(output_dir, group_id)
 
         plt.savefig(output_filename)
         plt.close(fig) # Close the figure to free memory
@@ -109,38 +199,19 @@ def plot_student_scores_bar(student_data: pd.Series, config: AppConfig, output_d
     logging.info(f"Generating scores bar chart for student: {student_name}")
 
     try:
-        # Extract scores for relevant columns, handling potential missing ones
-        scores = {}
-        for col in config.subject_score_columns:
-            if col in student_data.index:
-                scores[col.replace('(бали)', '').replace('(Бали)', '').strip()] = student_data[col] # Use cleaned name for label
-            else:
-                 scores[col.replace('(бали)', '').replace('(Бали)', '').strip()] = np.nan # Mark as NaN if column missing for student
-
-        scores_series = pd.Series(scores).dropna() # Remove subjects with NaN scores
+        scores_series = _student_scores_series(student_data, config)
 
         if scores_series.empty:
             logging.warning(f"No valid scores found for student {student_name} to generate bar chart.")
             return None
 
         fig, ax = plt.subplots(figsize=(10, 6))
-        bars = ax.bar(scores_series.index, scores_series.values, color='skyblue')
-        ax.set_ylabel('Score')
-        ax.set_xlabel('Subject')
-        ax.set_title(f'Scores for {student_name}')
-        ax.set_ylim(0, 105) # Set Y axis limit slightly above max score
-        plt.xticks(rotation=45, ha='right') # Rotate labels if they overlap
-
-        # Add score labels on top of bars
-        ax.bar_label(bars, fmt='%.0f') # Display integer scores
-
-        plt.tight_layout() # Adjust layout
+        draw_student_scores_bar(ax, scores_series, student_name)
+        fig.tight_layout() # Adjust layout
 
         # Ensure output directory exists
         output_dir.mkdir(parents=True, exist_ok=True)
-        # Sanitize student name for filename
-        safe_student_name = "".join(c if c.isalnum() else "_" for c in student_name)
-        output_filename = output_dir / f"student_{safe_student_name}_scores_bar.png"
+        output_filename = student_plot_filename(output_dir, student_name)
 
         plt.savefig(output_filename)
         plt.close(fig) # Close the figure
@@ -0,0 +1,189 @@
+import json
+import logging
+import threading
+import time
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .config import AppConfig
+from .analysis import DataAnalyzer
+from .cli import SCRIPT_COMMANDS, execute_command, count_failed
+
+# Commands that draw with pyplot / ReportLab, which are not thread-safe
+RENDER_COMMANDS = ('plot', 'pdf')
+
+
+class AnalysisService:
+    """
+    Keeps one processed dataset in memory and answers the scripted CLI
+    commands (student, group, scholars, plot, pdf) against it.
+
+    Queries only read the DataFrame and run concurrently; chart and PDF
+    rendering is serialized. Lab 4 only: the lab5 GUI keeps its data for the
+    whole session and warm-starts from its processed-data snapshot instead. reload() processes the workbook again and swaps
+    the analyzer in one assignment, so running requests finish on the old data.
+    """
+    def __init__(self, config: AppConfig, output_dir: Path = Path("output")):
+        self.config = config
+        self.output_dir = output_dir
+        self.analyzer: Optional[DataAnalyzer] = None
+        self.loaded_at: Optional[datetime] = None
+        self.requests_served = 0
+        self._render_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+
+    def reload(self) -> None:
+        """Runs the full processing pipeline and replaces the served dataset."""
+        with self._reload_lock:
+            started = time.perf_counter()
+            analyzer = DataAnalyzer(self.config)
+            analyzer.process_data()
+            self.analyzer = analyzer
+            self.loaded_at = datetime.now()
+            logging.info(f"Service dataset loaded: {len(analyzer.processed_df)} students in {time.perf_counter() - started:.2f}s.")
+
+    def health(self) -> Dict[str, Any]:
+        analyzer = self.analyzer
+        return {
+            'status': 'ok' if analyzer is not None else 'loading',
+            'students': len(analyzer.processed_df) if analyzer is not None else 0,
+            'loaded_at': self.loaded_at.isoformat(timespec='seconds') if self.loaded_at else None,
+            'requests_served': self.requests_served,
+        }
+
+    def run_command(self, command: str, queries: List[str], kind: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Runs one command against the current dataset.
+
+        Raises:
+            RuntimeError: If no dataset is loaded yet.
+            ValueError: For unknown commands or missing queries.
+        """
+        analyzer = self.analyzer # The dataset of this request, even if a reload swaps it meanwhile
+        if analyzer is None:
+            raise RuntimeError("The dataset is not loaded yet.")
+        if command in RENDER_COMMANDS:
+            with self._render_lock:
+                records = execute_command(analyzer, command, queries, kind=kind, output_dir=self.output_dir)
+        else:
+            records = execute_command(analyzer, command, queries, kind=kind, output_dir=self.output_dir)
+        with self._counter_lock:
+            self.requests_served += 1
+        return {'command': command, 'records': records, 'failed': count_failed(records)}
+
+    def handle(self, method: str, path: str, params: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Routes a request to the service.
+
+        Args:
+            method: 'GET' or 'POST'.
+            path: The command ('student', ...), 'health' or 'reload'.
+            params: 'queries' (list of strings) and optional 'kind'.
+
+        Returns:
+            HTTP status code and the JSON payload.
+        """
+        try:
+            if path == 'health':
+                return 200, self.health()
+            if path == 'reload':
+                if method != 'POST':
+                    return 405, {'error': "Use POST to reload the dataset."}
+                self.reload()
+                return 200, self.health()
+            if path not in SCRIPT_COMMANDS:
+                return 404, {'error': f"Unknown command: '{path}'. Available: {', '.join(SCRIPT_COMMANDS)}, health, reload."}
+            queries = params.get('queries') or []
+            if not isinstance(queries, list) or not all(isinstance(query, str) for query in queries):
+                return 400, {'error': "'queries' must be a list of strings."}
+            return 200, self.run_command(path, queries, kind=params.get('kind'))
+        except ValueError as e:
+            return 400, {'error': str(e)}
+        except RuntimeError as e:
+            return 503, {'error': str(e)}
+        except Exception as e:
+            logging.error(f"Service request '{path}' failed: {e}", exc_info=True)
+            return 500, {'error': str(e)}
+
+
+class _ServiceRequestHandler(BaseHTTPRequestHandler):
+    """
+    JSON over HTTP. GET /student?q=Name&q=Other or POST /student with a JSON
+    body {"queries": [...], "kind": "group"}; the body form suits long query lists.
+    """
+    server: "AnalysisHTTPServer"
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        query_string = parse_qs(url.query)
+        params = {'queries': query_string.get('q', [])}
+        if 'kind' in query_string:
+            params['kind'] = query_string['kind'][0]
+        self._respond(*self.server.service.handle('GET', url.path.strip('/'), params))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            params = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError as e:
+            self._respond(400, {'error': f"Invalid JSON body: {e}"})
+            return
+        if not isinstance(params, dict):
+            self._respond(400, {'error': "The JSON body must be an object."})
+            return
+        self._respond(*self.server.service.handle('POST', url.path.strip('/'), params))
+
+    def _respond(self, status: int, payload: Dict[str, Any]) -> None:
+        body = json.dumps(payload, ensure_ascii=False, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logging.debug(f"Service request from {self.address_string()}: {format % args}")
+
+
+class AnalysisHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server (one thread per request) bound to an AnalysisService."""
+    daemon_threads = True
+
+    def __init__(self, service: AnalysisService, host: str, port: int):
+        super().__init__((host, port), _ServiceRequestHandler)
+        self.service = service
+
+
+def create_server(config: AppConfig, host: Optional[str] = None, port: Optional[int] = None,
+                  output_dir: Path = Path("output")) -> AnalysisHTTPServer:
+    """
+    Processes the data once and creates (but does not start) the HTTP server.
+    port=0 picks a free port (see server.server_address).
+    """
+    host = host or config.service_host
+    port = config.service_port if port is None else port
+    if host not in ('127.0.0.1', 'localhost', '::1'):
+        logging.warning(f"The analysis service is bound to '{host}', not only to this machine. It has no authentication.")
+    service = AnalysisService(config, output_dir)
+    service.reload()
+    return AnalysisHTTPServer(service, host, port)
+
+
+def serve(config: AppConfig, host: Optional[str] = None, port: Optional[int] = None,
+          output_dir: Path = Path("output")) -> None:
+    """Runs the analysis service until interrupted (Ctrl+C)."""
+    server = create_server(config, host, port, output_dir)
+    host, port = server.server_address[:2]
+    logging.info(f"Analysis service listening on http://{host}:{port}")
+    print(f"Analysis service listening on http://{host}:{port} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logging.info("Analysis service stopped by user.")
+    finally:
+        server.server_close()
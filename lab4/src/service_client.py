@@ -0,0 +1,56 @@
+import json
+import logging
+from typing import Any, Dict, List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+
+class ServiceError(Exception):
+    """Raised when the analysis service cannot be reached or rejects a request."""
+    pass
+
+
+def _request(url: str, payload: Optional[Dict[str, Any]], timeout: float) -> Dict[str, Any]:
+    data = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else None
+    request = Request(url, data=data, headers={'Content-Type': 'application/json'})
+    try:
+        with urlopen(request, timeout=timeout) as response:
+            return json.loads(response.read().decode('utf-8'))
+    except HTTPError as e:
+        try:
+            message = json.loads(e.read().decode('utf-8')).get('error', e.reason)
+        except ValueError:
+            message = e.reason
+        raise ServiceError(f"Service error {e.code}: {message}") from e
+    except (URLError, OSError) as e:
+        raise ServiceError(f"Analysis service at {url} is not reachable: {e}") from e
+
+
+def query_service(base_url: str, command: str, queries: List[str], kind: Optional[str] = None,
+                  timeout: float = 60.0) -> List[Dict[str, Any]]:
+    """
+    Runs a scripted command on a running analysis service (see src.service).
+
+    Args:
+        base_url: Service address, e.g. 'http://127.0.0.1:8765'.
+        command: One of the scripted commands ('student', 'group', ...).
+        queries: The queries; all are sent in one request.
+        kind: Chart kind for 'plot'.
+        timeout: Seconds to wait for the answer.
+
+    Returns:
+        The result records, as returned by the scripted mode.
+
+    Raises:
+        ServiceError: If the service is unreachable or rejects the request.
+    """
+    payload: Dict[str, Any] = {'queries': queries}
+    if kind is not None:
+        payload['kind'] = kind
+    logging.info(f"Sending '{command}' with {len(queries)} queries to {base_url}")
+    return _request(f"{base_url.rstrip('/')}/{command}", payload, timeout)['records']
+
+
+def service_health(base_url: str, timeout: float = 2.0) -> Dict[str, Any]:
+    """Returns the service status (students loaded, load time, requests served)."""
+    return _request(f"{base_url.rstrip('/')}/health", None, timeout)
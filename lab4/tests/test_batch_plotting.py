@@ -0,0 +1,68 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src import batch_plotting
+from src.batch_plotting import render_all_plots
+
+
+@pytest.fixture
+def test_config():
+    return AppConfig(
+        name_column='Name',
+        group_column='Group',
+        subject_score_columns=['Math', 'Physics'],
+    )
+
+@pytest.fixture
+def processed_df(test_config):
+    return pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David'],
+        'Group': ['GroupA', 'GroupB', 'GroupA', 'GroupB'],
+        'Math': [100, 90, 80, np.nan],
+        'Physics': [90, 61, 70, 75],
+    })
+
+
+def test_render_all_plots_writes_group_and_student_charts(tmp_path, test_config, processed_df):
+    """Перевіряє, що пакетний рендеринг створює графіки всіх груп і студентів."""
+    summary = render_all_plots(processed_df, test_config, tmp_path, max_workers=1)
+
+    assert summary['failed'] == []
+    assert len(summary['rendered']) == 2 + 4
+    for name in ['group_GroupA_performance_pie.png', 'group_GroupB_performance_pie.png',
+                 'student_Alice_scores_bar.png', 'student_David_scores_bar.png']:
+        assert (tmp_path / name).stat().st_size > 0
+    assert (tmp_path / batch_plotting.HASH_FILE_NAME).exists()
+
+def test_render_all_plots_skips_unchanged(tmp_path, test_config, processed_df):
+    """Перевіряє, що незмінені графіки не перемальовуються, а змінені - перемальовуються."""
+    render_all_plots(processed_df, test_config, tmp_path, max_workers=1)
+
+    summary = render_all_plots(processed_df, test_config, tmp_path, max_workers=1)
+    assert summary['rendered'] == []
+    assert len(summary['skipped']) == 6
+
+    processed_df.loc[1, 'Math'] = 70 # Змінюються графік Bob і графік GroupB
+    (tmp_path / 'student_Alice_scores_bar.png').unlink() # Видалений файл теж малюється знову
+    summary = render_all_plots(processed_df, test_config, tmp_path, max_workers=1)
+    assert sorted(summary['rendered']) == sorted(str(tmp_path / name) for name in [
+        'group_GroupB_performance_pie.png', 'student_Bob_scores_bar.png', 'student_Alice_scores_bar.png'])
+
+    summary = render_all_plots(processed_df, test_config, tmp_path, max_workers=1, force=True)
+    assert len(summary['rendered']) == 6
+
+def test_render_all_plots_with_process_pool(tmp_path, test_config, processed_df):
+    """Перевіряє рендеринг у кількох процесах."""
+    summary = render_all_plots(processed_df, test_config, tmp_path, max_workers=2, chunk_size=2)
+    assert summary['failed'] == []
+    assert len(summary['rendered']) == 6
+    assert all((tmp_path / f).exists() for f in summary['rendered'])
+
+def test_template_figure_is_reused():
+    """Перевіряє, що в межах процесу використовується одна фігура на тип графіка."""
+    fig_first, ax_first = batch_plotting._get_template('student')
+    fig_second, ax_second = batch_plotting._get_template('student')
+    assert fig_first is fig_second
+    assert ax_first is ax_second
@@ -0,0 +1,105 @@
+import io
+import csv
+import json
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.analysis import DataAnalyzer
+from src.cli import build_arg_parser, run_script
+
+
+@pytest.fixture
+def test_config():
+    return AppConfig(
+        name_column='Name',
+        group_column='Group',
+        subject_score_columns=['Math', 'Physics'],
+        gpa_column='GPA',
+        scholarship_column='Scholarship',
+        scholarship_marker='*',
+        target_group='GroupA'
+    )
+
+@pytest.fixture
+def analyzer_with_data(test_config):
+    """Аналізатор з уже "обробленими" даними (група 101 - числова, як у реальному файлі)."""
+    analyzer = DataAnalyzer(test_config)
+    analyzer.processed_df = pd.DataFrame({
+        'Name': ['Alice Smith', 'Bob Stone', 'Charlie Smith', 'David Brown'],
+        'Group': ['GroupA', 'GroupB', 'GroupA', 101],
+        'Math': [100, 90, 80, np.nan],
+        'Physics': [90, 80, 70, 75],
+        'GPA': [95.0, 85.0, 75.0, 75.0],
+        'Scholarship': ['*', '*', '', ''],
+    })
+    analyzer._is_processed = True
+    return analyzer
+
+def _run(analyzer, argv):
+    args = build_arg_parser().parse_args(argv)
+    stream = io.StringIO()
+    exit_code = run_script(analyzer, args, stream=stream)
+    return exit_code, stream.getvalue()
+
+
+def test_parser_without_command_means_interactive():
+    """Перевіряє, що без підкоманди запускається інтерактивне меню."""
+    assert build_arg_parser().parse_args([]).command is None
+
+def test_student_queries_json(analyzer_with_data):
+    """Перевіряє кілька запитів студентів за один виклик і вивід у JSON."""
+    exit_code, output = _run(analyzer_with_data, ['student', 'smith', 'nobody'])
+    records = json.loads(output)
+
+    assert exit_code == 1 # Один із запитів не знайдено
+    assert [r['name'] for r in records if 'name' in r] == ['Alice Smith', 'Charlie Smith']
+    assert records[0]['scholarship'] is True
+    assert records[-1] == {'query': 'nobody', 'error': 'not found'}
+
+def test_queries_file_and_csv(analyzer_with_data, tmp_path):
+    """Перевіряє читання запитів з файлу (з коментарями) і вивід у CSV."""
+    queries_file = tmp_path / 'queries.txt'
+    queries_file.write_text("GroupA\n# коментар\n\n101\n", encoding='utf-8')
+    exit_code, output = _run(analyzer_with_data, ['group', '--queries-file', str(queries_file), '--format', 'csv'])
+    rows = list(csv.DictReader(io.StringIO(output)))
+
+    assert exit_code == 0
+    assert [row['query'] for row in rows] == ['GroupA', '101'] # Числова група знаходиться за текстом запиту
+    assert [row['students_in_group'] for row in rows] == ['2', '1']
+
+def test_group_defaults_to_target_group(analyzer_with_data):
+    """Перевіряє, що без запитів group використовує цільову групу з конфігурації."""
+    exit_code, output = _run(analyzer_with_data, ['group'])
+    assert exit_code == 0
+    assert [r['group_id'] for r in json.loads(output)] == ['GroupA']
+
+def test_scholars_to_output_file(analyzer_with_data, tmp_path):
+    """Перевіряє список стипендіатів із записом у файл."""
+    output_file = tmp_path / 'out' / 'scholars.json'
+    exit_code, output = _run(analyzer_with_data, ['scholars', '-o', str(output_file)])
+
+    assert exit_code == 0
+    assert output == ''
+    assert [r['name'] for r in json.loads(output_file.read_text(encoding='utf-8'))] == ['Alice Smith', 'Bob Stone']
+
+def test_plot_and_pdf_commands(analyzer_with_data, tmp_path, mocker):
+    """Перевіряє, що plot і pdf викликають генерацію для кожного запиту."""
+    mock_pie = mocker.patch('src.plotting.plot_group_performance_pie', return_value='pie.png')
+    mock_pdf = mocker.patch('src.pdf_reporter.generate_group_report_pdf', return_value=None)
+
+    exit_code, output = _run(analyzer_with_data, ['plot', 'group', 'GroupA', '101', '--output-dir', str(tmp_path)])
+    assert exit_code == 0
+    assert mock_pie.call_count == 2
+    assert [r['output_file'] for r in json.loads(output)] == ['pie.png', 'pie.png']
+
+    exit_code, output = _run(analyzer_with_data, ['pdf', 'GroupB', '--output-dir', str(tmp_path)])
+    assert exit_code == 1
+    assert json.loads(output) == [{'query': 'GroupB', 'error': 'PDF generation failed'}]
+    mock_pdf.assert_called_once()
+
+def test_student_command_requires_queries(analyzer_with_data):
+    """Перевіряє помилку, коли для student не задано жодного запиту."""
+    with pytest.raises(ValueError):
+        _run(analyzer_with_data, ['student'])
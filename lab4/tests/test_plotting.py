@@ -0,0 +1,54 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src import plotting
+
+
+@pytest.fixture
+def plot_config():
+    return AppConfig(
+        name_column='Name',
+        group_column='Group',
+        subject_score_columns=['Math (бали)', 'Physics (бали)'],
+    )
+
+
+def _reference_pie_counts(group_df, config):
+    """Підрахунок 3/4/5 через pd.cut по кожному стовпцю (попередня реалізація)."""
+    scores = []
+    for col in config.subject_score_columns:
+        scores += pd.cut(group_df[col], bins=plotting.BINS_345, labels=plotting.LABELS_345, right=True).dropna().astype(int).tolist()
+    if not scores:
+        return pd.Series(dtype=int)
+    counts = pd.Series(scores).value_counts().sort_index()
+    counts.index = counts.index.map(plotting.PIE_LABELS_345)
+    return counts
+
+def test_prepare_pie_chart_data_matches_pd_cut(plot_config):
+    """Перевіряє, що bincount по таблиці відповідностей дає ті самі підсумки, що й pd.cut."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Group': rng.choice(['A', 'B', 'C'], 300),
+        'Math (бали)': rng.integers(50, 101, 300).astype(float),
+        'Physics (бали)': rng.uniform(55, 105, 300), # Дробові бали та бали поза шкалою
+    })
+    df.loc[::7, 'Math (бали)'] = np.nan
+
+    result = plotting._prepare_pie_chart_data(df, plot_config)
+    reference = _reference_pie_counts(df, plot_config)
+    assert result.index.tolist() == reference.index.tolist()
+    assert result.tolist() == reference.tolist()
+
+    matrix = plotting.prepare_pie_chart_matrix(df, plot_config)
+    assert matrix.index.tolist() == ['A', 'B', 'C']
+    for group_id, group_df in df.groupby('Group'):
+        expected = _reference_pie_counts(group_df, plot_config)
+        assert plotting.pie_chart_series(matrix.loc[group_id].to_numpy()).to_dict() == expected.to_dict()
+
+def test_prepare_pie_chart_data_without_valid_scores(plot_config):
+    """Перевіряє порожній результат, коли немає балів у межах 60-100."""
+    df = pd.DataFrame({'Group': ['A', 'A'], 'Math (бали)': [np.nan, 40], 'Physics (бали)': [59, 101]})
+    assert plotting._prepare_pie_chart_data(df, plot_config).empty
+    assert plotting.prepare_pie_chart_matrix(df, plot_config).to_numpy().sum() == 0
@@ -0,0 +1,107 @@
+import threading
+import pytest
+import pandas as pd
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from src.config import AppConfig
+from src.analysis import DataAnalyzer
+from src.service import AnalysisService, AnalysisHTTPServer
+from src.service_client import query_service, service_health, ServiceError
+
+
+@pytest.fixture
+def test_config():
+    return AppConfig(
+        name_column='Name',
+        group_column='Group',
+        subject_score_columns=['Math', 'Physics'],
+        gpa_column='GPA',
+        scholarship_column='Scholarship',
+        scholarship_marker='*',
+        target_group='GroupA'
+    )
+
+@pytest.fixture
+def processed_dataframe(test_config):
+    return pd.DataFrame({
+        'Name': ['Alice Smith', 'Bob Stone', 'Charlie Smith', 'David Brown'],
+        'Group': ['GroupA', 'GroupB', 'GroupA', 'GroupB'],
+        'Math': [100, 90, 80, np.nan],
+        'Physics': [90, 80, 70, 75],
+        'GPA': [95.0, 85.0, 75.0, 75.0],
+        'Scholarship': ['*', '*', '', ''],
+    })
+
+@pytest.fixture
+def service(test_config, processed_dataframe, mocker, tmp_path):
+    """Сервіс, у якого "обробка даних" повертає готовий DataFrame."""
+    def fake_process(analyzer):
+        analyzer.processed_df = processed_dataframe.copy()
+        analyzer._is_processed = True
+    mocker.patch.object(DataAnalyzer, 'process_data', autospec=True, side_effect=fake_process)
+    service = AnalysisService(test_config, tmp_path)
+    service.reload()
+    return service
+
+@pytest.fixture
+def server_url(service):
+    """Запускає HTTP-сервер на вільному порту у фоновому потоці."""
+    server = AnalysisHTTPServer(service, '127.0.0.1', 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_service_answers_queries(server_url):
+    """Перевіряє відповіді сервісу на запити студентів, груп і стипендіатів."""
+    records = query_service(server_url, 'student', ['smith', 'nobody'])
+    assert [r.get('name') for r in records] == ['Alice Smith', 'Charlie Smith', None]
+    assert records[-1]['error'] == 'not found'
+
+    groups = query_service(server_url, 'group', [])
+    assert groups[0]['group_id'] == 'GroupA' # Цільова група за замовчуванням
+    assert groups[0]['students_in_group'] == 2
+
+    scholars = query_service(server_url, 'scholars', [])
+    assert [r['name'] for r in scholars] == ['Alice Smith', 'Bob Stone']
+
+def test_service_handles_concurrent_requests(server_url):
+    """Перевіряє одночасні запити від багатьох клієнтів."""
+    names = ['Alice', 'Bob', 'Charlie', 'David'] * 10
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda name: query_service(server_url, 'student', [name]), names))
+    assert [records[0]['name'].split()[0] for records in results] == names
+    assert service_health(server_url)['requests_served'] == len(names)
+
+def test_service_errors(server_url, service):
+    """Перевіряє коди помилок: невідома команда, відсутні запити, недоступний сервіс."""
+    with pytest.raises(ServiceError, match='404'):
+        query_service(server_url, 'unknown', [])
+    with pytest.raises(ServiceError, match='400'):
+        query_service(server_url, 'student', [])
+    assert service.handle('GET', 'reload', {})[0] == 405
+    with pytest.raises(ServiceError, match='not reachable'):
+        query_service('http://127.0.0.1:9', 'student', ['Alice'], timeout=1)
+
+def test_service_reload_swaps_dataset(service, processed_dataframe):
+    """Перевіряє, що перезавантаження замінює набір даних, а попередній аналізатор не змінюється."""
+    old_analyzer = service.analyzer
+    status, payload = service.handle('POST', 'reload', {})
+    assert status == 200
+    assert payload['students'] == len(processed_dataframe)
+    assert service.analyzer is not old_analyzer
+    assert old_analyzer.processed_df is not None
+
+def test_service_serializes_rendering(service, mocker):
+    """Перевіряє, що генерація графіків виконується під блокуванням."""
+    def fake_plot(*args):
+        assert service._render_lock.locked()
+        return 'pie.png'
+    mocker.patch('src.plotting.plot_group_performance_pie', side_effect=fake_plot)
+    status, payload = service.handle('POST', 'plot', {'queries': ['GroupA'], 'kind': 'group'})
+    assert status == 200
+    assert payload['records'] == [{'query': 'GroupA', 'output_file': 'pie.png'}]
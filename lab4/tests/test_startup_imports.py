@@ -0,0 +1,39 @@
+import subprocess
+import sys
+from pathlib import Path
+
+LAB_ROOT = Path(__file__).parent.parent
+
+# matplotlib and ReportLab are loaded by the first chart or report, pandas by the data processing
+CHART_MODULES = ('matplotlib', 'reportlab')
+DATA_MODULES = ('pandas', 'numpy')
+# Generous bound for a slow CI machine; locally 'import main' takes about 0.06 s (about 0.75 s with eager imports)
+IMPORT_TIME_BUDGET_S = 0.5
+
+
+def _import_profile(module: str, cwd: Path) -> dict:
+    """Imports a module of the lab in a fresh interpreter with -X importtime; returns {module: cumulative seconds}."""
+    code = f"import sys; sys.path.insert(0, {str(LAB_ROOT)!r}); import {module}"
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            cwd=cwd, capture_output=True, text=True, check=True)
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        profile[name.strip()] = int(cumulative_us) / 1e6
+    return profile
+
+
+def test_main_import_loads_no_heavy_modules(tmp_path):
+    """Перевіряє, що запуск (до обробки даних) не завантажує pandas, matplotlib і reportlab."""
+    profile = _import_profile('main', tmp_path) # main створює output/ з логом у поточному каталозі
+    loaded = sorted(name for name in profile if name.split('.')[0] in CHART_MODULES + DATA_MODULES)
+    assert loaded == []
+    assert profile['main'] < IMPORT_TIME_BUDGET_S, f"import main took {profile['main']:.3f}s"
+
+def test_analysis_import_does_not_load_chart_modules(tmp_path):
+    """Перевіряє, що обробка даних і меню CLI не тягнуть matplotlib і reportlab."""
+    profile = _import_profile('src.cli, src.analysis', tmp_path)
+    assert 'pandas' in profile
+    assert sorted(name for name in profile if name.split('.')[0] in CHART_MODULES) == []
@@ -1,11 +1,8 @@
 import logging
-import pandas as pd
-import matplotlib.pyplot as plt 
 import sys 
 import tkinter as tk 
 from typing import Optional
 from pathlib import Path
-from matplotlib.figure import Figure
 from tkinter import messagebox
 
 # --- Налаштування логування (важливо зробити це ДО імпорту інших модулів src) ---
@@ -1,12 +1,21 @@
 import pandas as pd
+import numpy as np
 from .config import AppConfig
 from .data_loader import DataLoader, DataLoaderError 
 from .report_saver import ReportSaver, ReportSaverError
-from .data_cleaner import DataCleaner
+from .pipeline import Pipeline, PipelineReport, PipelineCancelled
+from .group_index import GroupIndex
+from .name_index import NameSearchIndex
+from .stats_cache import StatsCache
+from .data_cleaner import DataCleaner, DuplicateTracker
 from .grade_calculator import GradeCalculator
 from .scholarship import ScholarshipDeterminer
+from .what_if import ScholarshipRanking
+from .report_aggregates import GroupReportAggregates, compute_group_report_aggregates
+from . import snapshot
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Hashable, Iterable, List, Callable
 
 
 class DataAnalyzer:
@@ -22,43 +31,181 @@ class DataAnalyzer:
             config: The application configuration object.
         """
         self.config = config
+        # Derived structures, rebuilt lazily for the current processed_df. The GUI reads them
+        # from the Tk thread and from background jobs, so lazy builds happen under a lock
+        self._stats_cache = StatsCache()
+        self._derived_lock = threading.RLock()
+        self._group_index: Optional[GroupIndex] = None
+        self._name_index: Optional[NameSearchIndex] = None
+        # Not in the stats cache: its lookups return copies, and this map is read once per report
+        self._report_aggregates: Optional[Dict[Hashable, GroupReportAggregates]] = None
+        self._ranking: Optional[ScholarshipRanking] = None
+        self._ranking_key = None
+
         self.raw_df: Optional[pd.DataFrame] = None      # Loaded data
         self.processed_df: Optional[pd.DataFrame] = None # Fully processed data
         self._is_processed = False
+        self.pipeline = Pipeline.default() # Stages can be added, replaced or skipped before process_data
+        self.last_pipeline_report: Optional[PipelineReport] = None
+        self.loaded_from_snapshot = False
+
+    @property
+    def processed_df(self) -> Optional[pd.DataFrame]:
+        return self._processed_df
+
+    @processed_df.setter
+    def processed_df(self, df: Optional[pd.DataFrame]) -> None:
+        self._processed_df = df
+        self.invalidate_caches()
+
+    @property
+    def dataset_version(self) -> int:
+        """Incremented every time processed_df changes."""
+        return self._stats_cache.version
 
-    def process_data(self) -> None:
+    def invalidate_caches(self, keep_name_index: bool = False) -> None:
         """
-        Executes the full data processing pipeline:
-        Load -> Clean -> Calculate Grades -> Determine Scholarships.
-        Stores the final DataFrame in self.processed_df.
+        Drops cached statistics, search indexes and the GPA ranking. Called
+        automatically when processed_df is replaced; call it manually after
+        modifying it in place.
+
+        Args:
+            keep_name_index: Keep the name index (valid while rows and names
+                             are unchanged, e.g. after a score update).
         """
-        if self._is_processed:
+        self._ranking = None
+        self._invalidate_derived(keep_name_index)
+
+    def _invalidate_derived(self, keep_name_index: bool = False) -> None:
+        """Like invalidate_caches, but keeps the ranking, which the what-if methods update themselves."""
+        with self._derived_lock:
+            self._stats_cache.invalidate()
+            self._group_index = None
+            self._report_aggregates = None
+            if not keep_name_index:
+                self._name_index = None
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Returns hit/miss counters of the statistics cache."""
+        return self._stats_cache.info()
+
+    def process_data(self, force: bool = False,
+                     on_progress: Optional[Callable[[str, float], None]] = None,
+                     is_cancelled: Optional[Callable[[], bool]] = None,
+                     use_snapshot: bool = False) -> None:
+        """
+        Executes the data processing pipeline (self.pipeline, by default
+        Load -> Clean -> Calculate Grades -> Determine Scholarships).
+        Stores the final DataFrame in self.processed_df and the per-stage
+        timings in self.last_pipeline_report.
+
+        Args:
+            force: Run the pipeline again even if data was already processed.
+            on_progress: Optional callback called after every stage with
+                         (stage name, fraction of enabled stages completed).
+            is_cancelled: Optional callable checked before every stage; the run
+                          then stops with PipelineCancelled and keeps the old data.
+            use_snapshot: Load processed_df from the snapshot in config.snapshot_dir
+                          when it matches the source file and configuration
+                          (not with force=True), and save a new snapshot after
+                          a pipeline run. raw_df and last_pipeline_report stay
+                          None after loading a snapshot.
+        """
+        if self._is_processed and not force:
             logging.info("Data already processed. Skipping reprocessing.")
             return
-            
-        logging.info("Starting data processing pipeline...")
-        try:
-            # 1. Load
-            self.raw_df = DataLoader.load_data(self.config)
 
-            # 2. Clean
-            cleaned_df = DataCleaner.clean_data(self.raw_df, self.config)
+        if use_snapshot and not force:
+            snapshot_df = snapshot.load_snapshot(self.config, self.pipeline)
+            if snapshot_df is not None:
+                self.raw_df = None
+                self.processed_df, self.last_pipeline_report = snapshot_df, None
+                self.loaded_from_snapshot = True
+                self._is_processed = True
+                if on_progress is not None:
+                    on_progress('snapshot', 1.0)
+                return
+
+        inplace = self.config.inplace_pipeline
+        logging.info(f"Starting data processing pipeline (inplace={inplace})...")
+        try:
+            enabled_stages = [stage.name for stage in self.pipeline.stages if stage.enabled]
+            raw_df = None
 
-            # 3. Calculate National Scale
-            graded_df = GradeCalculator.calculate_national_scale(cleaned_df, self.config)
+            def stage_complete(stage_name: str, df: pd.DataFrame) -> None:
+                nonlocal raw_df
+                # In in-place mode the pipeline owns the loaded frame, so raw_df is not kept
+                if stage_name == 'load' and not inplace:
+                    raw_df = df
+                if on_progress is not None:
+                    on_progress(stage_name, (enabled_stages.index(stage_name) + 1) / len(enabled_stages))
 
-            # 4. Determine Scholarships (includes GPA)
-            self.processed_df = ScholarshipDeterminer.determine_scholarships(graded_df, self.config)
+            processed_df, report = self.pipeline.run(
+                self.config, inplace=inplace, on_stage_complete=stage_complete, is_cancelled=is_cancelled
+            )
+            # Published only after a complete run, so a cancelled run keeps the previous data
+            self.raw_df = raw_df
+            self.processed_df, self.last_pipeline_report = processed_df, report
+            self.loaded_from_snapshot = False
 
             self._is_processed = True
             logging.info("Data processing pipeline completed successfully.")
 
+            if use_snapshot:
+                try:
+                    snapshot.save_snapshot(processed_df, self.config, self.pipeline)
+                except Exception as e: # The data is valid even if the snapshot cannot be written
+                    logging.warning(f"Could not save the processed data snapshot: {e}", exc_info=True)
+
+        except PipelineCancelled:
+            logging.info("Data processing pipeline cancelled.")
+            raise
         except (DataLoaderError, KeyError, Exception) as e:
              # Log specific errors from components if they occur
              logging.error(f"Data processing failed: {e}", exc_info=True)
              # Decide if we should re-raise or handle/store the error state
              raise # Re-raise the exception to be caught by the caller (e.g., main.py)
 
+    def build_indexes(self) -> None:
+        """
+        Builds the group and name indexes now instead of on first use, e.g. on
+        a background thread right after process_data.
+        """
+        if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+        self._get_group_index()
+        self._get_name_index()
+
+    def _get_group_index(self) -> GroupIndex:
+        """Returns the group index, building it on first use for the current processed_df."""
+        with self._derived_lock:
+            if self._group_index is None:
+                self._group_index = GroupIndex(self.processed_df, self.config)
+            return self._group_index
+
+    def _get_name_index(self) -> NameSearchIndex:
+        """Returns the name search index, building it on first use for the current processed_df."""
+        with self._derived_lock:
+            if self._name_index is None:
+                self._name_index = NameSearchIndex(self.processed_df[self.config.name_column])
+            return self._name_index
+
+    def get_pipeline_report(self, prometheus: bool = False) -> Any:
+        """
+        Returns the timings of the last process_data run.
+
+        Args:
+            prometheus: If True, returns Prometheus text format instead of a dict.
+
+        Raises:
+            RuntimeError: If the pipeline has not been run yet.
+        """
+        if self.last_pipeline_report is None:
+            raise RuntimeError("Data must be processed before getting the pipeline report.")
+        if prometheus:
+            return self.last_pipeline_report.to_prometheus()
+        return self.last_pipeline_report.to_dict()
+
     def save_processed_data(self) -> None:
         """Saves the processed data to the output file specified in config."""
         if not self._is_processed or self.processed_df is None:
@@ -73,7 +220,7 @@ class DataAnalyzer:
 
     def get_overall_stats(self) -> Dict[str, Any]:
         """
-        Calculates overall statistics from the processed data.
+        Returns overall statistics from the processed data (memoized per dataset version).
 
         Returns:
             A dictionary containing:
@@ -89,7 +236,11 @@ class DataAnalyzer:
         if not self._is_processed or self.processed_df is None:
              logging.error("Cannot get overall stats. Data not processed.")
              raise RuntimeError("Data must be processed before getting statistics.")
-        
+
+        return self._stats_cache.get_or_compute('overall', self._compute_overall_stats)
+
+    def _compute_overall_stats(self) -> Dict[str, Any]:
+        """Calculates the dictionary returned by get_overall_stats."""
         stats = {}
         df = self.processed_df.dropna(subset=[self.config.gpa_column]) # Analyze only those with valid GPA
 
@@ -114,8 +265,8 @@ class DataAnalyzer:
 
     def get_group_stats(self, group_id: Optional[str] = None) -> Dict[str, Any]:
         """
-        Filters data for a specific group (if provided, otherwise uses config's target_group) 
-        and calculates statistics for that group.
+        Returns statistics for a specific group (if provided, otherwise uses config's target_group).
+        The statistics are precomputed for all groups in one pass by GroupIndex.
 
         Args:
             group_id: The identifier of the group to analyze. If None, uses 
@@ -139,50 +290,245 @@ class DataAnalyzer:
             raise RuntimeError("Data must be processed before getting group statistics.")
 
         target_group = group_id if group_id is not None else self.config.target_group
+        return self._stats_cache.get_or_compute(('group', target_group), lambda: self._compute_group_stats(target_group))
+
+    def _compute_group_stats(self, target_group: str) -> Dict[str, Any]:
+        """Looks up the dictionary returned by get_group_stats in the group index."""
         logging.info(f"Calculating statistics for group: {target_group}")
-        
-        # Filter data for the target group
-        group_df = self.processed_df[self.processed_df[self.config.group_column] == target_group]
 
-        if group_df.empty:
+        # Precomputed per-group aggregates (see GroupIndex)
+        stats = self._get_group_index().get_stats(target_group)
+
+        if stats is None:
             logging.warning(f"Group '{target_group}' not found or has no students in the processed data.")
-            # Option 1: Raise an error
             raise ValueError(f"Group '{target_group}' not found in the data.")
-            # Option 2: Return empty/None stats
-            # return { 'group_id': target_group, 'students_in_group': 0, ... None/0 for others ... }
 
-        # Calculate stats for the filtered group (handle potential NaNs in GPA)
-        group_df_valid_gpa = group_df.dropna(subset=[self.config.gpa_column])
-        
-        stats = {'group_id': target_group}
-        stats['students_in_group'] = len(group_df)
-
-        if group_df_valid_gpa.empty:
+        if stats['average_gpa_in_group'] is None:
              logging.warning(f"No students with valid GPA in group '{target_group}'.")
-             stats['highest_gpa_student_in_group'] = None
-             stats['lowest_gpa_student_in_group'] = None
-             stats['average_gpa_in_group'] = None
-             # Scholarship count still calculated from original marking, even if GPA is NaN now (unlikely)
-             stats['scholarship_recipients_in_group'] = (group_df[self.config.scholarship_column] == self.config.scholarship_marker).sum()
-        else:
-             stats['highest_gpa_student_in_group'] = group_df_valid_gpa.loc[group_df_valid_gpa[self.config.gpa_column].idxmax(), self.config.name_column]
-             stats['lowest_gpa_student_in_group'] = group_df_valid_gpa.loc[group_df_valid_gpa[self.config.gpa_column].idxmin(), self.config.name_column]
-             stats['average_gpa_in_group'] = group_df_valid_gpa[self.config.gpa_column].mean()
-             stats['scholarship_recipients_in_group'] = (group_df[self.config.scholarship_column] == self.config.scholarship_marker).sum()
-
 
         logging.info(f"Calculated stats for group '{target_group}': {stats}")
         return stats
         
+    # --- Incremental what-if updates ---
+
+    def _quota_groups(self, df: pd.DataFrame) -> Optional[np.ndarray]:
+        """Quota group key of every row of df (None for a global quota)."""
+        quota_mode = self.config.scholarship_quota_mode
+        if quota_mode == 'global':
+            return None
+        if quota_mode == 'group':
+            return df[self.config.scholarship_quota_column or self.config.group_column].to_numpy(dtype=object)
+        raise ValueError(f"Unknown scholarship quota mode: '{quota_mode}'. Use 'global' or 'group'.")
+
+    def _get_ranking(self) -> ScholarshipRanking:
+        """Returns the maintained GPA ranking, building it on first use (or after a quota mode change)."""
+        ranking_key = (self.config.scholarship_quota_mode, self.config.scholarship_quota_column)
+        if self._ranking is None or self._ranking_key != ranking_key:
+            gpa = self.processed_df[self.config.gpa_column].to_numpy(dtype=np.float64, na_value=np.nan)
+            self._ranking = ScholarshipRanking(gpa, self._quota_groups(self.processed_df))
+            self._ranking_key = ranking_key
+        return self._ranking
+
+    def _refresh_scholarships(self) -> pd.Index:
+        """
+        Re-reads the awarded set from the ranking and rewrites only the rows
+        whose scholarship status changed. Returns the labels of those rows.
+        """
+        df = self.processed_df
+        marker = self.config.scholarship_marker
+        awarded = self._get_ranking().awarded(self.config.scholarship_percentage, self.config.scholarship_tie_policy)
+        current = (df[self.config.scholarship_column] == marker).to_numpy(dtype=bool)
+        changed = np.flatnonzero(awarded != current)
+        if changed.size:
+            column_dtype = df[self.config.scholarship_column].dtype
+            if not isinstance(column_dtype, pd.CategoricalDtype) or marker not in column_dtype.categories:
+                df[self.config.scholarship_column] = pd.Categorical.from_codes(current.astype(np.int8), categories=['', marker])
+            column_position = df.columns.get_loc(self.config.scholarship_column)
+            df.iloc[changed, column_position] = np.where(awarded[changed], marker, '')
+            logging.info(f"What-if: scholarship status changed for {changed.size} students.")
+        return df.index[changed]
+
+    def update_score(self, student: Hashable, score_column: str, score: Optional[float]) -> pd.Index:
+        """
+        Changes one score and updates that student's grade and GPA, then the
+        scholarship flags, without rerunning the pipeline.
+
+        Args:
+            student: Index label of the student in processed_df.
+            score_column: One of config.subject_score_columns.
+            score: The new score. None or an out-of-range value is stored as
+                   missing, as DataCleaner does.
+
+        Returns:
+            Labels of the students whose scholarship status changed.
+
+        Raises:
+            RuntimeError: If data has not been processed yet.
+            KeyError: If the student is not found.
+            ValueError: If score_column is not a score column.
+        """
+        if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+        if score_column not in self.config.subject_score_columns:
+            raise ValueError(f"'{score_column}' is not a subject score column.")
+
+        df = self.processed_df
+        position = df.index.get_loc(student)
+        if not isinstance(position, int):
+            raise ValueError(f"Student label '{student}' is not unique in the processed data.")
+        ranking = self._get_ranking() # Built from the GPA values before the change
+
+        value = np.nan if score is None else float(score)
+        if not np.isnan(value) and not (self.config.min_score <= value <= self.config.max_score):
+            logging.warning(f"Score {value} for '{score_column}' is outside the range "
+                            f"[{self.config.min_score}, {self.config.max_score}]. Storing it as missing.")
+            value = np.nan
+        if not pd.api.types.is_float_dtype(df[score_column]):
+            df[score_column] = df[score_column].astype(np.float64)
+        df.iat[position, df.columns.get_loc(score_column)] = value
+
+        # Grade of the changed cell only
+        grade_column = self.config.get_national_scale_column_name(score_column)
+        if grade_column in df.columns:
+            codes, grade_dtype = GradeCalculator.grade_codes(np.array([[value]]), self.config)
+            code = int(codes[0, 0])
+            df.iat[position, df.columns.get_loc(grade_column)] = grade_dtype.categories[code] if code >= 0 else np.nan
+
+        # GPA of the changed row only
+        score_cols = [col for col in self.config.subject_score_columns if pd.api.types.is_numeric_dtype(df[col])]
+        row_scores = df.iloc[[position], df.columns.get_indexer(score_cols)].to_numpy(dtype=np.float64, na_value=np.nan)
+        gpa = float(ScholarshipDeterminer._weighted_gpa(row_scores, self.config.get_subject_weights(score_cols))[0])
+        df.iat[position, df.columns.get_loc(self.config.gpa_column)] = gpa
+        ranking.update(position, gpa)
+
+        changed = self._refresh_scholarships()
+        self._invalidate_derived(keep_name_index=True)
+        return changed
+
+    def set_scholarship_percentage(self, percentage: float) -> pd.Index:
+        """
+        Changes config.scholarship_percentage and updates the scholarship flags
+        from the maintained ranking.
+
+        Returns:
+            Labels of the students whose scholarship status changed.
+
+        Raises:
+            RuntimeError: If data has not been processed yet.
+            ValueError: If percentage is not within [0, 1].
+        """
+        if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+        if not 0 <= percentage <= 1:
+            raise ValueError(f"Scholarship percentage must be between 0 and 1, got {percentage}.")
+
+        self.config.scholarship_percentage = percentage
+        changed = self._refresh_scholarships()
+        self._invalidate_derived(keep_name_index=True)
+        return changed
+
+    def add_students(self, students: pd.DataFrame) -> pd.Index:
+        """
+        Appends new students: only the new rows are cleaned, graded and get a
+        GPA; they are then inserted into the ranking. Names that already exist
+        are dropped (the first occurrence is kept, as in DataCleaner).
+
+        Args:
+            students: Rows with the name, group and score columns.
+
+        Returns:
+            Labels of the students whose scholarship status changed.
+
+        Raises:
+            RuntimeError: If data has not been processed yet.
+            KeyError: If required columns are missing.
+        """
+        if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+        required = [self.config.name_column, self.config.group_column] + self.config.subject_score_columns
+        missing = [col for col in required if col not in students.columns]
+        if missing:
+            raise KeyError(f"Missing required columns in new students: {missing}")
+
+        df = self.processed_df
+        ranking = self._get_ranking()
+        new_rows = DataCleaner.clean_data(students, self.config)
+        tracker = DuplicateTracker()
+        tracker.keep_mask(df[self.config.name_column])
+        keep = tracker.keep_mask(new_rows[self.config.name_column])
+        if not keep.all():
+            logging.warning(f"Skipping {int((~keep).sum())} new students whose names already exist.")
+            new_rows = new_rows[keep]
+        if new_rows.empty:
+            return df.index[:0]
+
+        new_rows = GradeCalculator.calculate_national_scale(new_rows, self.config, inplace=True)
+        new_rows = ScholarshipDeterminer.determine_scholarships(new_rows, self.config, inplace=True)
+        if pd.api.types.is_integer_dtype(df.index):
+            start = int(df.index.max()) + 1 if len(df) else 0
+            new_rows.index = pd.RangeIndex(start, start + len(new_rows))
+        elif df.index.isin(new_rows.index).any():
+            raise ValueError("New students reuse index labels of existing students.")
+
+        self._processed_df = pd.concat([df, new_rows.reindex(columns=df.columns)])
+        ranking.append_rows(new_rows[self.config.gpa_column].to_numpy(dtype=np.float64, na_value=np.nan),
+                            self._quota_groups(new_rows))
+        logging.info(f"What-if: added {len(new_rows)} students.")
+
+        changed = self._refresh_scholarships()
+        self._invalidate_derived()
+        return changed
+
+    def remove_students(self, students: Iterable[Hashable]) -> pd.Index:
+        """
+        Removes students by index label and updates the scholarship flags of
+        the remaining ones (quotas shrink with the cohort).
+
+        Returns:
+            Labels of the remaining students whose scholarship status changed.
+
+        Raises:
+            RuntimeError: If data has not been processed yet.
+            KeyError: If any student is not found.
+        """
+        if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+
+        df = self.processed_df
+        labels = list(students)
+        positions = df.index.get_indexer(labels)
+        if (positions < 0).any():
+            raise KeyError(f"Students not found: {[label for label, pos in zip(labels, positions) if pos < 0]}")
+
+        self._get_ranking().remove_rows(positions)
+        keep = np.ones(len(df), dtype=bool)
+        keep[positions] = False
+        self._processed_df = df.iloc[keep]
+        logging.info(f"What-if: removed {len(labels)} students.")
+
+        changed = self._refresh_scholarships()
+        self._invalidate_derived()
+        return changed
+
     # --- Methods for Future Expansion (Placeholders) ---
     
-    def find_student_by_name(self, name_substring: str) -> Optional[pd.DataFrame]:
-        """Finds student(s) by full or partial name match (case-insensitive)."""
+    def find_student_by_name(self, name_substring: str, max_typos: int = 0) -> Optional[pd.DataFrame]:
+        """
+        Finds student(s) by full or partial name match (case-insensitive).
+
+        Args:
+            name_substring: Full name or any part of it.
+            max_typos: If > 0, also matches names within this edit distance
+                       (closest matches first).
+        """
         if not self._is_processed or self.processed_df is None:
             raise RuntimeError("Data must be processed first.")
-        # Use contains for partial matching
-        results = self.processed_df[self.processed_df[self.config.name_column].str.contains(name_substring, case=False, na=False)]
-        return results if not results.empty else None
+        name_index = self._get_name_index()
+        if max_typos > 0:
+            positions = name_index.search_fuzzy(name_substring, max_distance=max_typos)
+        else:
+            positions = name_index.search(name_substring)
+        return self.processed_df.iloc[positions] if len(positions) else None
 
     def get_scholarship_students(self) -> Optional[pd.DataFrame]:
          """Returns a DataFrame of all students who receive scholarships."""
@@ -191,6 +537,25 @@ class DataAnalyzer:
          scholars = self.processed_df[self.processed_df[self.config.scholarship_column] == self.config.scholarship_marker]
          return scholars if not scholars.empty else None
          
+    def get_report_aggregates(self, group_id: Optional[str] = None) -> Optional[GroupReportAggregates]:
+         """
+         Returns the precomputed PDF report aggregates of a group (None if unknown).
+         They are computed for all groups at once and kept until processed_df changes.
+         """
+         if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+         target_group = group_id if group_id is not None else self.config.target_group
+         with self._derived_lock:
+             if self._report_aggregates is None:
+                 self._report_aggregates = compute_group_report_aggregates(self.processed_df, self.config)
+             return self._report_aggregates.get(target_group)
+
+    def get_group_ids(self) -> List[Hashable]:
+         """Returns all group identifiers in the processed data, in order of first appearance."""
+         if not self._is_processed or self.processed_df is None:
+            raise RuntimeError("Data must be processed first.")
+         return self._get_group_index().groups
+
     # get_group_data(group_id) -> returns the filtered dataframe for plotting/reporting
     def get_group_data(self, group_id: Optional[str] = None) -> Optional[pd.DataFrame]:
          """Returns the processed data filtered for a specific group."""
@@ -198,6 +563,4 @@ class DataAnalyzer:
             raise RuntimeError("Data must be processed first.")
          
          target_group = group_id if group_id is not None else self.config.target_group
-         group_df = self.processed_df[self.processed_df[self.config.group_column] == target_group]
-         
-         return group_df if not group_df.empty else None
\ No newline at end of file
+         return self._get_group_index().get_frame(self.processed_df, target_group)
\ No newline at end of file
@@ -0,0 +1,167 @@
+import logging
+import queue
+import threading
+import itertools
+from typing import Callable, Optional, Any, Tuple, Dict
+
+
+class JobCancelled(Exception):
+    """Raised inside a job function when its job has been cancelled."""
+    pass
+
+
+class BackgroundJob:
+    """
+    Handle of a submitted job. The job function receives it to report
+    progress and to check for cancellation.
+    """
+    def __init__(self, job_id: int, name: str, worker: "BackgroundWorker"):
+        self.job_id = job_id
+        self.name = name
+        self.status = 'queued' # queued -> running -> done / failed / cancelled
+        self._worker = worker
+        self._cancel_event = threading.Event()
+        self._callbacks: Dict[str, Optional[Callable]] = {}
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    def cancel(self) -> None:
+        """Requests cancellation; the job stops at its next checkpoint."""
+        self._cancel_event.set()
+
+    def check_cancelled(self) -> None:
+        """Checkpoint for the job function: raises JobCancelled after cancel()."""
+        if self._cancel_event.is_set():
+            raise JobCancelled(f"Job '{self.name}' was cancelled.")
+
+    def report_progress(self, fraction: float, message: str = "") -> None:
+        """Queues a progress update (0.0 - 1.0) for the main thread."""
+        self._worker._post(self, 'progress', (fraction, message))
+
+    def __repr__(self) -> str:
+        return f"BackgroundJob(id={self.job_id}, name='{self.name}', status='{self.status}')"
+
+
+class BackgroundWorker:
+    """
+    A single worker thread that runs submitted jobs one after another.
+
+    Tkinter widgets may only be touched from the main thread, so the worker
+    never calls back directly: results, errors and progress are queued as
+    events, and the GUI drains them with poll() from a root.after loop.
+    """
+    def __init__(self, name: str = "analysis-worker"):
+        self._jobs: "queue.Queue[Optional[Tuple[BackgroundJob, Callable]]]" = queue.Queue()
+        self._events: "queue.Queue[Tuple[BackgroundJob, str, Any]]" = queue.Queue()
+        self._ids = itertools.count(1)
+        self.current_job: Optional[BackgroundJob] = None
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, name: str, func: Callable[[BackgroundJob], Any],
+               on_done: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[BaseException], None]] = None,
+               on_progress: Optional[Callable[[float, str], None]] = None,
+               on_cancelled: Optional[Callable[[], None]] = None) -> BackgroundJob:
+        """
+        Queues func(job) for the worker thread. The callbacks are later called
+        by poll() on the polling (main) thread.
+
+        Returns:
+            The BackgroundJob handle (e.g. for cancel()).
+        """
+        job = BackgroundJob(next(self._ids), name, self)
+        job._callbacks = {'done': on_done, 'error': on_error, 'progress': on_progress, 'cancelled': on_cancelled}
+        self._jobs.put((job, func))
+        logging.debug(f"Background job queued: {job}")
+        return job
+
+    def _post(self, job: BackgroundJob, kind: str, payload: Any) -> None:
+        self._events.put((job, kind, payload))
+
+    def _run(self) -> None:
+        while True:
+            item = self._jobs.get()
+            if item is None: # Shutdown sentinel
+                return
+            job, func = item
+            if job.cancelled:
+                job.status = 'cancelled'
+                self._post(job, 'cancelled', None)
+                continue
+
+            self.current_job = job
+            job.status = 'running'
+            logging.info(f"Background job started: {job.name}")
+            try:
+                result = func(job)
+                job.check_cancelled() # A cancel that arrived after the last checkpoint still wins
+            except JobCancelled:
+                job.status = 'cancelled'
+                logging.info(f"Background job cancelled: {job.name}")
+                self._post(job, 'cancelled', None)
+            except Exception as e:
+                if job.cancelled: # e.g. a component's own cancellation exception
+                    job.status = 'cancelled'
+                    logging.info(f"Background job cancelled: {job.name} ({e})")
+                    self._post(job, 'cancelled', None)
+                    continue
+                job.status = 'failed'
+                logging.error(f"Background job '{job.name}' failed: {e}", exc_info=True)
+                self._post(job, 'error', e)
+            else:
+                job.status = 'done'
+                logging.info(f"Background job finished: {job.name}")
+                self._post(job, 'done', result)
+            finally:
+                self.current_job = None
+
+    def poll(self) -> int:
+        """
+        Dispatches all queued events to their callbacks on the calling thread.
+
+        Returns:
+            The number of events dispatched.
+        """
+        dispatched = 0
+        while True:
+            try:
+                job, kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                return dispatched
+            dispatched += 1
+            callback = job._callbacks.get(kind)
+            if callback is None:
+                if kind == 'error':
+                    logging.warning(f"Unhandled error of background job '{job.name}': {payload}")
+                continue
+            if kind == 'progress':
+                callback(*payload)
+            elif kind == 'cancelled':
+                callback()
+            else:
+                callback(payload)
+
+    def cancel_all(self) -> None:
+        """Cancels the running job and every queued job."""
+        if self.current_job is not None:
+            self.current_job.cancel()
+        pending = []
+        while True:
+            try:
+                pending.append(self._jobs.get_nowait())
+            except queue.Empty:
+                break
+        for item in pending:
+            if item is not None:
+                item[0].cancel()
+            self._jobs.put(item) # They still report 'cancelled' from the worker thread
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Cancels everything and stops the worker thread after the current job."""
+        self.cancel_all()
+        self._jobs.put(None)
+        if wait:
+            self._thread.join()
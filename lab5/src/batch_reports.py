@@ -0,0 +1,210 @@
+import pandas as pd
+import logging
+import json
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Hashable, Iterable, Tuple, Callable
+
+from .config import AppConfig
+from .report_aggregates import GroupReportAggregates
+from . import pdf_reporter
+
+MANIFEST_FILENAME = "manifest.json"
+
+# Set once per worker process by _init_worker
+_worker_config: Optional[AppConfig] = None
+# The GUI runs batches on a worker thread next to the Tk loop; forking such a process can
+# copy a lock held by another thread into the child, so workers start from a clean process
+POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+
+@dataclass
+class ReportResult:
+    """Outcome of generating one group report."""
+    group_id: str
+    output_file: str
+    success: bool
+    wall_time_s: float
+    worker_pid: int
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchReportManifest:
+    """Summary of a batch run: one entry per group plus totals."""
+    output_dir: str
+    workers: int
+    total_wall_time_s: float = 0.0
+    cancelled: bool = False # True if the run was stopped before all reports were generated
+    reports: List[ReportResult] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[ReportResult]:
+        return [report for report in self.reports if report.success]
+
+    @property
+    def failed(self) -> List[ReportResult]:
+        return [report for report in self.reports if not report.success]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the manifest as plain Python types (e.g. for JSON output)."""
+        return {
+            'output_dir': self.output_dir,
+            'workers': self.workers,
+            'total_wall_time_s': self.total_wall_time_s,
+            'succeeded': len(self.succeeded),
+            'failed': len(self.failed),
+            'cancelled': self.cancelled,
+            'reports': [asdict(report) for report in self.reports],
+        }
+
+    def save(self, filepath: Path) -> None:
+        """Writes the manifest as JSON."""
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+def report_filename(group_id: Hashable) -> str:
+    """File name of a group report (same default as the GUI), safe for any group id."""
+    safe_id = re.sub(r'[\\/:*?"<>|\s]+', '_', str(group_id))
+    return f"group_{safe_id}_report.pdf"
+
+
+def _init_worker(config: AppConfig) -> None:
+    """Process pool initializer: keeps the config and loads fonts/styles for all tasks of this worker."""
+    global _worker_config
+    _worker_config = config
+    pdf_reporter.get_styles()
+    logging.debug(f"Report worker {os.getpid()} ready (font '{pdf_reporter.get_font_name()}').")
+
+
+def _render_group_report(group_id: str, group_df: pd.DataFrame, group_stats: Dict[str, Any],
+                         aggregates: Optional[GroupReportAggregates], output_filepath: str) -> ReportResult:
+    """Generates one report in the current process and times it."""
+    start = time.perf_counter()
+    error = None
+    try:
+        success = pdf_reporter.generate_group_report_pdf(
+            group_df=group_df,
+            group_stats=group_stats,
+            group_id=group_id,
+            config=_worker_config,
+            output_filepath=output_filepath,
+            aggregates=aggregates,
+        )
+        if not success:
+            error = "generate_group_report_pdf returned False (see log)"
+    except Exception as e: # One broken group must not stop the batch
+        logging.error(f"Report for group {group_id} failed: {e}", exc_info=True)
+        success, error = False, str(e)
+    return ReportResult(
+        group_id=group_id,
+        output_file=output_filepath,
+        success=success,
+        wall_time_s=time.perf_counter() - start,
+        worker_pid=os.getpid(),
+        error=error,
+    )
+
+
+def generate_all_group_reports(
+    analyzer,
+    output_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    group_ids: Optional[Iterable[Hashable]] = None,
+    on_report_complete: Optional[Callable[[ReportResult, int, int], None]] = None,
+    is_cancelled: Optional[Callable[[], bool]] = None,
+) -> BatchReportManifest:
+    """
+    Generates a PDF report for every group of the processed data.
+
+    Reports are rendered in a process pool; every worker is initialized once
+    (config, fonts and styles) and then renders many groups. The subject
+    averages and threshold lists of all groups are computed up front in one
+    pass (DataAnalyzer.get_report_aggregates). A manifest with
+    per-report timings is written to output_dir/manifest.json.
+
+    Args:
+        analyzer: A DataAnalyzer with processed data.
+        output_dir: Target directory (defaults to config.reports_dir).
+        max_workers: Pool size (defaults to config.report_workers, then CPU count).
+                     With 1 worker or a single group, reports are rendered in-process.
+        group_ids: Only generate these groups (defaults to all groups).
+        on_report_complete: Optional callback called with (result, completed, total)
+                            after every report, e.g. for progress reporting.
+        is_cancelled: Optional callable checked between reports; pending reports
+                      are then dropped and the manifest is marked as cancelled.
+
+    Returns:
+        The BatchReportManifest of this run.
+
+    Raises:
+        RuntimeError: If data has not been processed yet.
+    """
+    config: AppConfig = analyzer.config
+    output_dir = Path(output_dir if output_dir is not None else config.reports_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    group_ids = list(group_ids) if group_ids is not None else analyzer.get_group_ids()
+    max_workers = max_workers or config.report_workers or os.cpu_count() or 1
+    workers = max(1, min(max_workers, len(group_ids)))
+    logging.info(f"Generating {len(group_ids)} group reports to '{output_dir}' with {workers} worker(s)...")
+
+    tasks: List[Tuple[str, pd.DataFrame, Dict[str, Any], Optional[GroupReportAggregates], str]] = []
+    used_filenames = set()
+    for group_id in group_ids:
+        group_df = analyzer.get_group_data(group_id)
+        if group_df is None or group_df.empty:
+            logging.warning(f"Group '{group_id}' not found or empty. Skipping report.")
+            continue
+        # Distinct ids can share a file name (1 and '1', 'a/b' and 'a:b'); later ones get a number
+        filename, duplicate = report_filename(group_id), 1
+        while filename in used_filenames:
+            duplicate += 1
+            filename = report_filename(f"{group_id}_{duplicate}")
+        used_filenames.add(filename)
+        output_filepath = str(output_dir / filename)
+        tasks.append((str(group_id), group_df, analyzer.get_group_stats(group_id),
+                      analyzer.get_report_aggregates(group_id), output_filepath))
+
+    manifest = BatchReportManifest(output_dir=str(output_dir), workers=workers)
+    start = time.perf_counter()
+    results: Dict[int, ReportResult] = {} # By task index: distinct ids like 1 and '1' share a text form
+
+    def record(index: int, result: ReportResult) -> None:
+        results[index] = result
+        if on_report_complete is not None:
+            on_report_complete(result, len(results), len(tasks))
+
+    if workers == 1:
+        _init_worker(config)
+        for index, task in enumerate(tasks):
+            if is_cancelled is not None and is_cancelled():
+                manifest.cancelled = True
+                break
+            record(index, _render_group_report(*task))
+    else:
+        mp_context = multiprocessing.get_context(POOL_START_METHOD)
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context,
+                                 initializer=_init_worker, initargs=(config,)) as pool:
+            futures = {pool.submit(_render_group_report, *task): index for index, task in enumerate(tasks)}
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                record(futures[future], future.result())
+                if is_cancelled is not None and is_cancelled() and not manifest.cancelled:
+                    manifest.cancelled = True
+                    for pending in futures:
+                        pending.cancel() # Reports already running still finish
+    manifest.reports = [results[index] for index in sorted(results)] # Keep group order
+    manifest.total_wall_time_s = time.perf_counter() - start
+
+    manifest.save(output_dir / MANIFEST_FILENAME)
+    logging.info(f"Batch reports finished in {manifest.total_wall_time_s:.2f}s: "
+                 f"{len(manifest.succeeded)} succeeded, {len(manifest.failed)} failed.")
+    return manifest
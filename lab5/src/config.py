@@ -1,6 +1,9 @@
-import pandas as pd
 from pathlib import Path
 import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class AppConfig:
     """Holds application configuration settings."""
@@ -41,6 +44,9 @@ class AppConfig:
 
         self.national_scale_suffix = " (Нац. шкала)"
         self.gpa_column = "GPA"
+        # Credit hours per subject score column, used as GPA weights.
+        # Columns not listed here weigh 1.0, so an empty dict gives the plain average.
+        self.subject_credits: dict[str, float] = {}
         self.scholarship_column = "Стипендія"
 
         # --- Score & Grade Settings ---
@@ -56,9 +62,34 @@ class AppConfig:
         # --- Scholarship Settings ---
         self.scholarship_percentage = 0.60
         self.scholarship_marker = "Рекомендовано"
+        # 'global' ranks the whole cohort; 'group' applies the percentage inside every group
+        self.scholarship_quota_mode = "global"
+        self.scholarship_quota_column = None # Column defining quota groups in 'group' mode (defaults to group_column)
+        # 'first' (exact quota), 'include' (all tied at the cutoff) or 'exclude' (ties only if all fit)
+        self.scholarship_tie_policy = "first"
 
         # --- Target group ---
         self.target_group = "536ст"
+
+        # --- Streaming Ingestion Settings ---
+        self.chunk_size = 5000
+        self.score_dtype = "float32"
+        self.group_dtype = "category"
+        self.group_categories = None # Fixed group categories; None: collected in a first pass over the file
+        self.name_dtype = "string"
+
+        # --- Pipeline Settings ---
+        # In-place mode lets each stage modify the loaded frame instead of copying it.
+        # raw_df is then not kept, since processed_df owns the same data.
+        self.inplace_pipeline = False
+
+        # --- Batch PDF Report Settings ---
+        self.reports_dir = self.output_dir / "group_reports"
+        self.report_workers = None # Process pool size for batch reports (None = CPU count)
+
+        # --- Processed Data Snapshot (warm start, see snapshot.py) ---
+        self.snapshot_dir = self.output_dir / "snapshot"
+        self.snapshot_format = "auto" # 'auto' (Feather if pyarrow is installed, else pickle), 'feather' or 'pickle'
         logging.debug("AppConfig initialized successfully.")
 
 
@@ -69,4 +100,22 @@ class AppConfig:
         return f"{base_name}{self.national_scale_suffix}"
 
     def get_all_national_scale_columns(self) -> list[str]:
-         return [self.get_national_scale_column_name(col) for col in self.subject_score_columns]
\ No newline at end of file
+         return [self.get_national_scale_column_name(col) for col in self.subject_score_columns]
+
+    def get_subject_weights(self, score_columns: list[str]) -> "np.ndarray":
+        """Returns the credit weight of every given score column as a float64 vector."""
+        import numpy as np
+        weights = np.array([self.subject_credits.get(col, 1.0) for col in score_columns], dtype=np.float64)
+        if (weights < 0).any():
+            raise ValueError(f"Subject credits must be non-negative, got: {dict(zip(score_columns, weights.tolist()))}")
+        return weights
+
+    def get_column_schema(self) -> dict[str, str]:
+        """Returns the declared dtype for every column the streaming loader keeps."""
+        schema = {
+            self.name_column: self.name_dtype,
+            self.group_column: self.group_dtype,
+        }
+        for col in self.subject_score_columns:
+            schema[col] = self.score_dtype
+        return schema
\ No newline at end of file
@@ -1,51 +1,187 @@
 import pandas as pd
 import numpy as np
 from .config import AppConfig
+from .name_index import normalize_names
 import logging
+from dataclasses import dataclass, field
+from typing import List, Set
+
+
+@dataclass
+class ScoreValidationSummary:
+    """Result of the single-pass score range validation."""
+    columns: List[str] = field(default_factory=list)      # Validated (numeric) score columns
+    invalid_mask: np.ndarray = field(default_factory=lambda: np.zeros((0, 0), dtype=bool)) # rows x columns bitmap
+    per_column: pd.Series = field(default_factory=lambda: pd.Series(dtype=int))  # Invalid count per column
+    per_row: pd.Series = field(default_factory=lambda: pd.Series(dtype=int))     # Invalid count, only rows that have any
+
+    @property
+    def total_invalid(self) -> int:
+        return int(self.per_column.sum())
+
+
+@dataclass
+class DuplicateReport:
+    """Result of the single-pass duplicate name detection."""
+    keep_mask: np.ndarray # True for the first occurrence of every normalized name
+    groups: pd.DataFrame  # One row per duplicated name: normalized name, count, first index label
+
+    @property
+    def duplicate_rows(self) -> int:
+        """Number of rows that belong to a duplicate group (including the kept ones)."""
+        return int(self.groups['count'].sum()) if not self.groups.empty else 0
+
+    @property
+    def removed_rows(self) -> int:
+        return int((~self.keep_mask).sum())
+
+
+# Names are normalized and hashed in blocks so only one block of normalized strings is alive
+_HASH_BLOCK_SIZE = 8192
+
+
+def _hash_names(names: pd.Series) -> np.ndarray:
+    """64-bit hashes of normalized names (whitespace, case and Unicode folding)."""
+    hashes = np.empty(len(names), dtype=np.uint64)
+    for start in range(0, len(names), _HASH_BLOCK_SIZE):
+        block = normalize_names(names.iloc[start:start + _HASH_BLOCK_SIZE])
+        hashes[start:start + len(block)] = pd.util.hash_pandas_object(block, index=False).to_numpy()
+    return hashes
+
+
+class DuplicateTracker:
+    """
+    Streaming duplicate detector: remembers the 64-bit hashes of all names seen
+    in previous chunks, so memory grows with the number of distinct names
+    instead of with the data itself.
+    """
+    def __init__(self):
+        self._seen: Set[int] = set()
+        self.rows_seen = 0
+        self.duplicates_dropped = 0
+
+    def keep_mask(self, names: pd.Series) -> np.ndarray:
+        """Returns the keep mask for the next chunk (False for names seen before)."""
+        keep = np.zeros(len(names), dtype=bool)
+        seen = self._seen
+        for position, name_hash in enumerate(_hash_names(names).tolist()):
+            if name_hash not in seen:
+                seen.add(name_hash)
+                keep[position] = True
+        self.rows_seen += len(names)
+        self.duplicates_dropped += int((~keep).sum())
+        return keep
+
 
 class DataCleaner:
     """Handles cleaning operations on the student DataFrame."""
 
     @staticmethod
-    def clean_data(df: pd.DataFrame, config: AppConfig) -> pd.DataFrame:
+    def clean_data(df: pd.DataFrame, config: AppConfig, inplace: bool = False) -> pd.DataFrame:
         """
         Cleans the DataFrame by handling duplicates and invalid scores.
 
         Args:
             df: The DataFrame to clean.
             config: The application configuration object.
+            inplace: If True, modifies df directly instead of working on a copy.
+                     The caller hands ownership of df to the pipeline.
 
         Returns:
-            A cleaned pandas DataFrame.
+            A cleaned pandas DataFrame (df itself when inplace=True).
         """
-        df_cleaned = df.copy()
-
         # 1. Handle Duplicates based on Name Column
-        initial_rows = len(df_cleaned)
-        duplicates = df_cleaned[df_cleaned.duplicated(subset=[config.name_column], keep=False)]
-        if not duplicates.empty:
-            logging.warning(f"Found {len(duplicates)} rows with duplicate names based on column '{config.name_column}'. Keeping first occurrence.")
-            logging.debug(f"Duplicate names: {duplicates[config.name_column].tolist()}")
-            df_cleaned = df_cleaned.drop_duplicates(subset=[config.name_column], keep='first')
-            logging.info(f"Removed {initial_rows - len(df_cleaned)} duplicate rows.")
+        report = DataCleaner.find_duplicates(df[config.name_column])
+        if report.removed_rows:
+            logging.warning(f"Found {report.duplicate_rows} rows with duplicate names based on column '{config.name_column}'. Keeping first occurrence.")
+            logging.debug(f"Duplicate names: {report.groups['name'].tolist()}")
+            if inplace and df.index.is_unique:
+                df.drop(index=df.index[~report.keep_mask], inplace=True)
+                df_cleaned = df
+            else:
+                df_cleaned = df[report.keep_mask] # Boolean selection already returns a new frame
+            logging.info(f"Removed {report.removed_rows} duplicate rows.")
         else:
+            df_cleaned = df if inplace else df.copy()
             logging.info("No duplicate names found.")
 
         # 2. Validate Score Ranges for Subject Columns
+        DataCleaner.invalidate_out_of_range_scores(df_cleaned, config)
+
+        logging.info("Data cleaning completed.")
+        return df_cleaned
+
+    @staticmethod
+    def find_duplicates(names: pd.Series) -> DuplicateReport:
+        """
+        Detects duplicate names in one pass over their 64-bit hashes.
+
+        Names are compared after normalization (case folding, Unicode NFKC,
+        apostrophe variants and whitespace), so 'Іван  Петренко' and
+        'іван петренко' are treated as the same student.
+
+        Args:
+            names: The name column.
+
+        Returns:
+            A DuplicateReport with the keep mask and a summary of duplicate groups.
+        """
+        hashes = _hash_names(names)
+        # Codes are assigned in order of first appearance
+        codes, _ = pd.factorize(hashes)
+        previous_max = np.maximum.accumulate(np.concatenate(([-1], codes[:-1]))) if len(codes) else codes
+        keep_mask = codes > previous_max
+
+        counts = np.bincount(codes) if len(codes) else np.zeros(0, dtype=np.int64)
+        duplicated_codes = np.flatnonzero(counts > 1)
+        first_positions = np.flatnonzero(keep_mask)[duplicated_codes]
+        groups = pd.DataFrame({
+            'name': names.iloc[first_positions].tolist(),
+            'count': counts[duplicated_codes],
+            'first_index': names.index[first_positions],
+        })
+        return DuplicateReport(keep_mask=keep_mask, groups=groups)
+
+    @staticmethod
+    def invalidate_out_of_range_scores(df: pd.DataFrame, config: AppConfig) -> ScoreValidationSummary:
+        """
+        Sets scores outside [min_score, max_score] to NaN, modifying df in place.
+
+        All score columns are checked at once as one 2-D block, producing a single
+        invalid-cell bitmap; only columns that contain invalid cells are written back.
+
+        Args:
+            df: The DataFrame to validate (modified in place).
+            config: The application configuration object.
+
+        Returns:
+            A ScoreValidationSummary with the bitmap and per-column/per-row counts.
+        """
         logging.info(f"Validating scores in columns: {config.subject_score_columns} (Range: {config.min_score}-{config.max_score})")
+        columns = []
         for col in config.subject_score_columns:
             # Ensure column is numeric first (might have been object if loading failed subtly)
-            if not pd.api.types.is_numeric_dtype(df_cleaned[col]):
-                 logging.warning(f"Skipping score validation for non-numeric column: {col}")
-                 continue
-                 
-            # Find scores outside the valid range [min_score, max_score]
-            invalid_mask = (df_cleaned[col] < config.min_score) | (df_cleaned[col] > config.max_score)
-            invalid_count = invalid_mask.sum()
+            if pd.api.types.is_numeric_dtype(df[col]):
+                columns.append(col)
+            else:
+                logging.warning(f"Skipping score validation for non-numeric column: {col}")
 
+        if not columns:
+            return ScoreValidationSummary()
+
+        block = df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        # NaN compares False on both sides, so missing scores are not flagged
+        invalid_mask = (block < config.min_score) | (block > config.max_score)
+
+        per_column = pd.Series(invalid_mask.sum(axis=0), index=columns)
+        row_counts = invalid_mask.sum(axis=1)
+        rows_with_invalid = np.flatnonzero(row_counts)
+        per_row = pd.Series(row_counts[rows_with_invalid], index=df.index[rows_with_invalid])
+
+        for position, col in enumerate(columns):
+            invalid_count = per_column[col]
             if invalid_count > 0:
                 logging.warning(f"Found {invalid_count} scores in column '{col}' outside the valid range ({config.min_score}-{config.max_score}). Setting them to NaN.")
+                df[col] = df[col].mask(invalid_mask[:, position])
 
-
-        logging.info("Data cleaning completed.")
-        return df_cleaned
\ No newline at end of file
+        return ScoreValidationSummary(columns=columns, invalid_mask=invalid_mask, per_column=per_column, per_row=per_row)
\ No newline at end of file
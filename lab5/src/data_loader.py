@@ -2,6 +2,7 @@ import pandas as pd
 from pathlib import Path
 from .config import AppConfig
 import logging
+from typing import Any, Dict, Iterator, Optional, List
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
@@ -61,4 +62,165 @@ class DataLoader:
              raise e # Re-raise the specific KeyError from validation
         except Exception as e:
             logging.error(f"Failed to load or perform initial validation on data from {config.input_file}: {e}", exc_info=True)
-            raise DataLoaderError(f"Could not read or validate data from file '{config.input_file}'. Reason: {e}")
\ No newline at end of file
+            raise DataLoaderError(f"Could not read or validate data from file '{config.input_file}'. Reason: {e}")
+
+    @staticmethod
+    def iter_chunks(config: AppConfig, chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """
+        Streams student data in typed batches instead of loading the whole sheet.
+
+        Excel files are read row by row through openpyxl in read-only mode,
+        CSV files through pandas' chunked reader. Every batch is projected to
+        the columns of config.get_column_schema() and cast to it (float32 scores,
+        categorical group, string names), so memory peaks at one chunk. All
+        batches share one group CategoricalDtype (config.group_categories, or
+        the groups found by a first pass over the group column), so that
+        pd.concat of the batches keeps the column categorical.
+
+        Args:
+            config: The application configuration object.
+            chunk_size: Rows per batch (positive). If None, uses config.chunk_size.
+
+        Yields:
+            pandas DataFrames with at most chunk_size rows each.
+
+        Raises:
+            DataLoaderError: If the file is not found or cannot be read.
+            KeyError: If essential columns specified in config are missing.
+            ValueError: If chunk_size is not positive.
+        """
+        input_path = Path(config.input_file)
+        if not input_path.exists():
+            logging.error(f"Input file not found: {config.input_file}")
+            raise DataLoaderError(f"Input file not found: {config.input_file}")
+
+        chunk_size = config.chunk_size if chunk_size is None else chunk_size
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        logging.info(f"Streaming data from '{config.input_file}' in chunks of {chunk_size} rows")
+        is_csv = input_path.suffix.lower() == '.csv'
+        if is_csv:
+            raw_chunks = DataLoader._iter_csv_chunks(input_path, config, chunk_size)
+        else:
+            raw_chunks = DataLoader._iter_excel_chunks(input_path, config, chunk_size)
+
+        total_rows = 0
+        try:
+            dtypes = dict(config.get_column_schema())
+            if dtypes[config.group_column] == 'category':
+                categories = config.group_categories
+                if categories is None:
+                    categories = DataLoader._scan_column(input_path, config, config.group_column, is_csv)
+                dtypes[config.group_column] = pd.CategoricalDtype(categories)
+            for raw_chunk in raw_chunks:
+                chunk = DataLoader._cast_to_schema(raw_chunk, config, dtypes)
+                total_rows += len(chunk)
+                yield chunk
+        except KeyError as e:
+            raise e # Re-raise the specific KeyError from validation
+        except Exception as e:
+            logging.error(f"Failed to stream data from {config.input_file}: {e}", exc_info=True)
+            raise DataLoaderError(f"Could not stream data from file '{config.input_file}'. Reason: {e}")
+        logging.info(f"Streaming finished. Total rows: {total_rows}")
+
+    @staticmethod
+    def _validate_header(header: List[str], config: AppConfig) -> None:
+        """Raises KeyError if any schema column is missing from the header."""
+        missing_cols = [col for col in config.get_column_schema() if col not in header]
+        if missing_cols:
+            logging.error(f"Missing required columns in the input file: {missing_cols}")
+            raise KeyError(f"Missing required columns: {missing_cols}. Please check config.py or the input file '{config.input_file}'.")
+
+    @staticmethod
+    def _iter_excel_chunks(input_path: Path, config: AppConfig, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Yields untyped row batches from an Excel sheet using openpyxl read-only mode."""
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            if isinstance(config.sheet_name, int):
+                sheet = workbook.worksheets[config.sheet_name]
+            else:
+                sheet = workbook[config.sheet_name]
+
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            header = [str(cell) if cell is not None else '' for cell in header]
+            DataLoader._validate_header(header, config)
+
+            # Keep only the schema columns to avoid holding unused cells
+            positions = [header.index(col) for col in config.get_column_schema()]
+            columns = [header[pos] for pos in positions]
+
+            batch = []
+            offset = 0
+            for row in rows:
+                if row is None or all(cell is None for cell in row):
+                    continue
+                batch.append([row[pos] if pos < len(row) else None for pos in positions])
+                if len(batch) == chunk_size:
+                    yield pd.DataFrame(batch, columns=columns, index=pd.RangeIndex(offset, offset + len(batch)))
+                    offset += len(batch)
+                    batch = []
+            if batch:
+                yield pd.DataFrame(batch, columns=columns, index=pd.RangeIndex(offset, offset + len(batch)))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _iter_csv_chunks(input_path: Path, config: AppConfig, chunk_size: int) -> Iterator[pd.DataFrame]:
+        """Yields untyped row batches from a CSV file using pandas' chunked reader."""
+        header = pd.read_csv(input_path, nrows=0).columns.tolist()
+        DataLoader._validate_header(header, config)
+
+        schema_columns = list(config.get_column_schema())
+        reader = pd.read_csv(input_path, usecols=schema_columns, dtype=object, chunksize=chunk_size)
+        for chunk in reader:
+            yield chunk[schema_columns]
+
+    @staticmethod
+    def _scan_column(input_path: Path, config: AppConfig, column: str, is_csv: bool) -> List[Any]:
+        """Distinct non-missing values of one column in order of appearance (reads only that column)."""
+        if is_csv:
+            values = pd.read_csv(input_path, usecols=[column], dtype=object)[column]
+            return values.dropna().unique().tolist()
+
+        import openpyxl
+
+        workbook = openpyxl.load_workbook(input_path, read_only=True, data_only=True)
+        try:
+            if isinstance(config.sheet_name, int):
+                sheet = workbook.worksheets[config.sheet_name]
+            else:
+                sheet = workbook[config.sheet_name]
+            header = next(sheet.iter_rows(max_row=1, values_only=True), None) or ()
+            header = [str(cell) if cell is not None else '' for cell in header]
+            DataLoader._validate_header(header, config)
+            position = header.index(column) + 1
+            cells = sheet.iter_rows(min_row=2, min_col=position, max_col=position, values_only=True)
+            return list(dict.fromkeys(row[0] for row in cells if row and row[0] is not None))
+        finally:
+            workbook.close()
+
+    @staticmethod
+    def _cast_to_schema(chunk: pd.DataFrame, config: AppConfig, dtypes: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """Casts a raw batch to dtypes (default: the dtypes declared by config.get_column_schema())."""
+        typed = {}
+        for col, dtype in (dtypes or config.get_column_schema()).items():
+            if col in config.subject_score_columns:
+                # Attempt conversion, coerce errors to NaN
+                typed[col] = pd.to_numeric(chunk[col], errors='coerce').astype(dtype)
+            elif isinstance(dtype, pd.CategoricalDtype):
+                # Only possible with declared config.group_categories: unknown values become missing
+                values = chunk[col]
+                unknown = values.notna() & ~values.isin(dtype.categories)
+                if unknown.any():
+                    logging.warning(f"{int(unknown.sum())} values of '{col}' are not among the declared categories; set to missing.")
+                    values = values.mask(unknown)
+                typed[col] = values.astype(dtype)
+            else:
+                typed[col] = chunk[col].astype(dtype)
+        return pd.DataFrame(typed, index=chunk.index)
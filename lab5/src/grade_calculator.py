@@ -2,58 +2,105 @@ import pandas as pd
 import numpy as np
 from .config import AppConfig
 import logging
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=8)
+def _build_grade_lookup(scales: Tuple[Tuple[Tuple[int, int], str], ...], min_score: int, max_score: int) -> Tuple[np.ndarray, np.ndarray, pd.CategoricalDtype]:
+    """
+    Builds the grading tables once per configuration.
+
+    Returns:
+        bins: Right-closed bin edges (same semantics as pd.cut(right=True)).
+        lookup: Grade code for every integer score in [min_score, max_score], -1 if ungraded.
+        dtype: The categorical dtype shared by all national scale columns.
+    """
+    sorted_scales = sorted(scales, key=lambda item: item[0][0])
+    bins = np.array([min_score - 1] + [upper for (lower, upper), grade in sorted_scales], dtype=np.float64)
+    labels = [grade for (lower, upper), grade in sorted_scales]
+
+    scores = np.arange(min_score, max_score + 1, dtype=np.float64)
+    lookup = (np.searchsorted(bins, scores, side='left') - 1).astype(np.int8)
+    lookup[(scores <= bins[0]) | (scores > bins[-1])] = -1
+
+    dtype = pd.CategoricalDtype(categories=labels, ordered=True)
+    return bins, lookup, dtype
+
 
 class GradeCalculator:
     """Calculates national scale grades based on scores."""
 
     @staticmethod
-    def calculate_national_scale(df: pd.DataFrame, config: AppConfig) -> pd.DataFrame:
+    def calculate_national_scale(df: pd.DataFrame, config: AppConfig, inplace: bool = False) -> pd.DataFrame:
         """
         Adds national scale grade columns to the DataFrame.
 
+        Integer scores are graded with a precomputed lookup table (one entry per
+        possible score) applied to the whole score matrix at once; fractional
+        scores fall back to a binary search over the same bins. All grade columns
+        share one ordered categorical dtype.
+
         Args:
             df: The DataFrame with score columns.
             config: The application configuration object.
+            inplace: If True, adds the columns to df directly instead of a copy.
 
         Returns:
-            DataFrame with added national scale columns.
+            DataFrame with added national scale columns (df itself when inplace=True).
         """
-        df_graded = df.copy()
+        df_graded = df if inplace else df.copy()
         logging.info("Calculating national scale grades...")
 
-        sorted_scales = sorted(config.grade_scales.items(), key=lambda item: item[0][0]) 
-        bins = [config.min_score - 1] + [upper for (lower, upper), grade in sorted_scales]
-        labels = [grade for (lower, upper), grade in sorted_scales]
-        
-        # Ensure the upper bound matches the max possible score if needed
-        if bins[-1] < config.max_score:
-             # This logic might need adjustment depending on how ranges are defined
-             # If 100 should be 'Відмінно', the range (90, 100) and bins work.
-             # If a score of exactly 100 needs a special check, add it here.
-             pass 
-
-        logging.debug(f"Using bins: {bins}")
-        logging.debug(f"Using labels: {labels}")
+        numeric_cols = [col for col in config.subject_score_columns if pd.api.types.is_numeric_dtype(df_graded[col])]
+        codes, grade_dtype = GradeCalculator.grade_codes(
+            df_graded[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan), config
+        )
 
         for score_col in config.subject_score_columns:
             national_scale_col = config.get_national_scale_column_name(score_col)
-            
-            if pd.api.types.is_numeric_dtype(df_graded[score_col]):
-                logging.debug(f"Calculating scale for: {score_col} -> {national_scale_col}")
-                df_graded[national_scale_col] = pd.cut(
-                    df_graded[score_col],
-                    bins=bins,
-                    labels=labels,
-                    right=True, 
-                    include_lowest=False # Change if min_score itself needs a specific grade
-                )
-
-                df_graded[national_scale_col] = df_graded[national_scale_col].astype('object') # 
-                df_graded.loc[df_graded[score_col].isnull(), national_scale_col] = np.nan
 
+            if score_col in numeric_cols:
+                logging.debug(f"Calculating scale for: {score_col} -> {national_scale_col}")
+                position = numeric_cols.index(score_col)
+                df_graded[national_scale_col] = pd.Categorical.from_codes(codes[:, position], dtype=grade_dtype)
             else:
                 logging.warning(f"Cannot calculate national scale for non-numeric column: {score_col}. Skipping.")
                 df_graded[national_scale_col] = "N/A" # Or np.nan
 
         logging.info("National scale calculation completed.")
-        return df_graded
\ No newline at end of file
+        return df_graded
+
+    @staticmethod
+    def grade_codes(block: np.ndarray, config: AppConfig) -> Tuple[np.ndarray, pd.CategoricalDtype]:
+        """
+        Maps a 2-D block of scores to grade codes (-1 for missing/ungraded scores).
+
+        Args:
+            block: Scores as a float array of shape (rows, columns).
+            config: The application configuration object.
+
+        Returns:
+            The int8 code matrix and the categorical dtype the codes refer to.
+        """
+        scales = tuple(sorted(config.grade_scales.items()))
+        bins, lookup, grade_dtype = _build_grade_lookup(scales, config.min_score, config.max_score)
+        logging.debug(f"Using bins: {bins.tolist()}")
+        logging.debug(f"Using labels: {list(grade_dtype.categories)}")
+
+        codes = np.full(block.shape, -1, dtype=np.int8)
+        if block.size == 0:
+            return codes, grade_dtype
+
+        with np.errstate(invalid='ignore'):
+            in_table = (block >= config.min_score) & (block <= config.max_score) & (block == np.floor(block))
+        codes[in_table] = lookup.take(block[in_table].astype(np.intp) - config.min_score)
+
+        # Fractional or out-of-table scores: same bins, binary search
+        other = ~in_table & ~np.isnan(block)
+        if other.any():
+            values = block[other]
+            other_codes = np.searchsorted(bins, values, side='left') - 1
+            other_codes[(values <= bins[0]) | (values > bins[-1])] = -1
+            codes[other] = other_codes
+        return codes, grade_dtype
@@ -0,0 +1,105 @@
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, Any, Optional, Hashable, List
+
+from .config import AppConfig
+
+
+class GroupIndex:
+    """
+    Precomputed lookup structure over processed_df for group queries.
+
+    Row positions of every group and the per-group statistics are computed
+    once, so get_group_stats/get_group_data no longer rescan the whole frame.
+    """
+    def __init__(self, df: pd.DataFrame, config: AppConfig):
+        """
+        Builds the index in a single pass over the group column.
+
+        Args:
+            df: The processed DataFrame (with GPA and scholarship columns).
+            config: The application configuration object.
+        """
+        self.config = config
+        self._positions: Dict[Hashable, np.ndarray] = {}
+        self._stats: Dict[Hashable, Dict[str, Any]] = {}
+
+        if df.empty:
+            return
+
+        # 1. Row positions per group: one stable sort of the group codes, then split
+        codes, uniques = pd.factorize(df[config.group_column], use_na_sentinel=True)
+        order = np.argsort(codes, kind='stable')
+        sorted_codes = codes[order]
+        boundaries = np.flatnonzero(np.diff(sorted_codes)) + 1
+        for chunk in np.split(order, boundaries):
+            code = codes[chunk[0]]
+            if code < 0: # Rows with a missing group are not indexed
+                continue
+            self._positions[uniques[code]] = chunk
+
+        # 2. Per-group aggregates in one groupby pass
+        self._stats = self._compute_stats(df, config)
+        logging.info(f"Group index built for {len(self._positions)} groups.")
+
+    @staticmethod
+    def _compute_stats(df: pd.DataFrame, config: AppConfig) -> Dict[Hashable, Dict[str, Any]]:
+        """Calculates count, GPA mean, min/max student and scholars for all groups at once."""
+        gpa = df[config.gpa_column]
+        frame = pd.DataFrame({
+            'group': df[config.group_column],
+            'gpa': gpa,
+            'is_scholar': df[config.scholarship_column] == config.scholarship_marker,
+        })
+        grouped = frame.groupby('group', sort=False, observed=True, dropna=True)
+        counts = grouped.size()
+        scholars = grouped['is_scholar'].sum()
+
+        # GPA aggregates only over rows with a valid GPA
+        valid = frame[gpa.notna()]
+        valid_grouped = valid.groupby('group', sort=False, observed=True, dropna=True)['gpa']
+        means = valid_grouped.mean()
+        max_labels = valid_grouped.idxmax()
+        min_labels = valid_grouped.idxmin()
+
+        names = df[config.name_column]
+        stats = {}
+        for group, count in counts.items():
+            has_gpa = group in means.index
+            stats[group] = {
+                'group_id': group,
+                'students_in_group': int(count),
+                'highest_gpa_student_in_group': names.loc[max_labels[group]] if has_gpa else None,
+                'lowest_gpa_student_in_group': names.loc[min_labels[group]] if has_gpa else None,
+                'scholarship_recipients_in_group': int(scholars[group]),
+                'average_gpa_in_group': float(means[group]) if has_gpa else None,
+            }
+        return stats
+
+    def __contains__(self, group_id: Hashable) -> bool:
+        return group_id in self._positions
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def groups(self) -> List[Hashable]:
+        """All indexed group identifiers, in order of first appearance."""
+        return list(self._positions)
+
+    def get_positions(self, group_id: Hashable) -> Optional[np.ndarray]:
+        """Returns the row positions (for .iloc) of a group, or None if unknown."""
+        return self._positions.get(group_id)
+
+    def get_frame(self, df: pd.DataFrame, group_id: Hashable) -> Optional[pd.DataFrame]:
+        """Returns the rows of df belonging to the group, or None if unknown."""
+        positions = self._positions.get(group_id)
+        if positions is None:
+            return None
+        return df.iloc[positions]
+
+    def get_stats(self, group_id: Hashable) -> Optional[Dict[str, Any]]:
+        """Returns a copy of the precomputed statistics of a group, or None if unknown."""
+        stats = self._stats.get(group_id)
+        return dict(stats) if stats is not None else None
@@ -1,19 +1,31 @@
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
+import importlib
 import logging
 from pathlib import Path
-import pandas as pd
-from typing import Optional
-
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt 
+from typing import Optional, TYPE_CHECKING
 
+# Only light modules are imported here, so the window appears before pandas,
+# matplotlib and reportlab are loaded. Those are imported where first needed:
+# the analysis modules by the processing job (on the worker thread), the plotting
+# and PDF modules by _preload_modules right after it, or on first use.
 from .config import AppConfig
-from .analysis import DataAnalyzer, DataLoaderError
-from . import plotting 
-from . import pdf_reporter
+from .background import BackgroundWorker, BackgroundJob
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+    from .analysis import DataAnalyzer
+    from .result_grid import VirtualResultGrid
+    from . import plotting
+
+# Imported in the background after the data is processed, so the first plot or report does not wait for them.
+# Names starting with '.' are relative to this package
+PRELOAD_MODULES = ('.plotting', '.pdf_reporter', '.batch_reports', 'matplotlib.backends.backend_tkagg')
+
+WORKER_POLL_INTERVAL_MS = 100 # How often the Tk main loop drains background job events
+PLOT_CACHE_SIZE = 16          # Figures kept by the plot LRU cache
 
 class StudentAnalysisGUI:
     """
@@ -24,43 +36,49 @@ class StudentAnalysisGUI:
         self.root.title("Аналіз Успішності Студентів")
         self.root.geometry("800x700")
 
-        # --- Uploading and processing data ---
-        self.analyzer = None
+        # --- Configuration and analyzer (data is processed in the background) ---
+        self.analyzer: Optional["DataAnalyzer"] = None # Created by the first processing job
         self.config = None
+        self.initialized = False
+        self.worker = BackgroundWorker()
+        self._processing_job: Optional[BackgroundJob] = None
         try:
             logging.info("GUI: Initializing configuration and analyzer...")
             self.config = AppConfig()
             if not hasattr(self.config, 'output_dir'):
                  logging.error("CRITICAL: AppConfig loaded, but 'output_dir' attribute is missing!")
                  raise AttributeError("'AppConfig' object correctly initialized but missing 'output_dir'. Check config.py definition.")
-
-            self.analyzer = DataAnalyzer(self.config)
-            logging.info("GUI: Processing data...")
-            self.root.update_idletasks() 
-            self.status_label = ttk.Label(root, text="Завантаження та обробка даних...")
-            self.status_label.pack(pady=5)
-            self.root.update_idletasks()
-            self.analyzer.process_data() # Uploading and processing data
-            self.status_label.config(text="Дані успішно завантажено та оброблено.")
-            logging.info("GUI: Data processing complete.")
-        except (DataLoaderError, KeyError, ValueError, RuntimeError, FileNotFoundError, AttributeError) as e: # Додано AttributeError
-            logging.error(f"GUI: Critical error during data loading/processing: {e}", exc_info=True)
+        except (KeyError, ValueError, RuntimeError, FileNotFoundError, AttributeError) as e:
+            logging.error(f"GUI: Critical error during initialization: {e}", exc_info=True)
             messagebox.showerror("Помилка Завантаження Даних", f"Не вдалося завантажити або обробити дані:\n{e}\n\nПеревірте файл '{getattr(self.config, 'input_file', 'N/A')}' та конфігурацію.\nДодаток буде закрито.")
+            self.worker.shutdown()
             self.root.quit() 
             return 
         except Exception as e:
              logging.critical(f"GUI: Unexpected critical error during initialization: {e}", exc_info=True)
              messagebox.showerror("Критична Помилка", f"Виникла неочікувана помилка під час ініціалізації:\n{e}\n\nДодаток буде закрито.")
+             self.worker.shutdown()
              self.root.quit()
              return
 
-        # self.status_label.pack_forget()
-        self.status_label.config(text=f"Файл: {Path(self.config.input_file).name} | Група за замовчуванням: {self.config.target_group}")
-
+        # --- Status bar: progress of background jobs and cancellation ---
+        status_frame = ttk.Frame(root, padding="10 5 10 0")
+        status_frame.pack(fill=tk.X)
+        self.status_label = ttk.Label(status_frame, text="Завантаження та обробка даних...")
+        self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.cancel_button = ttk.Button(status_frame, text="Скасувати", command=self._cancel_background_jobs, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=(5, 0))
+        self.progress_bar = ttk.Progressbar(status_frame, mode='determinate', maximum=1.0, length=160)
+        self.progress_bar.pack(side=tk.RIGHT)
 
         # --- Create widgets ---
         logging.info("GUI: Creating widgets...")
         self._create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        self.initialized = True
+        self._start_processing()
+        self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_worker)
         logging.info("GUI: Initialization complete.")
 
 
@@ -129,8 +147,17 @@ class StudentAnalysisGUI:
         self.all_scholars_button = ttk.Button(general_actions_frame, text="Показати Всіх Стипендіатів", command=self._show_all_scholars)
         self.all_scholars_button.pack(pady=5, padx=5)
 
+        self.all_reports_button = ttk.Button(general_actions_frame, text="PDF Звіти для Всіх Груп", command=self._generate_all_group_pdfs)
+        self.all_reports_button.pack(pady=5, padx=5)
+
+        self.reload_button = ttk.Button(general_actions_frame, text="Перезавантажити Дані", command=lambda: self._start_processing(force=True))
+        self.reload_button.pack(pady=5, padx=5)
+
+        self.students_table_button = ttk.Button(general_actions_frame, text="PDF Таблиця Всіх Студентів", command=self._generate_students_table_pdf)
+        self.students_table_button.pack(pady=5, padx=5)
+
         # --- Exit button ---
-        self.quit_button = ttk.Button(control_frame, text="Вихід", command=self.root.quit)
+        self.quit_button = ttk.Button(control_frame, text="Вихід", command=self._on_close)
         self.quit_button.pack(side=tk.BOTTOM, pady=20)
 
         # === Output area (right panel) ===
@@ -139,8 +166,14 @@ class StudentAnalysisGUI:
         results_frame = ttk.LabelFrame(output_frame, text="Результати")
         results_frame.pack(pady=5, padx=5, fill=tk.X)
 
-        self.results_text = scrolledtext.ScrolledText(results_frame, height=12, width=60, wrap=tk.WORD, state=tk.DISABLED, font=('Courier New', 9))
-        self.results_text.pack(expand=True, fill=tk.BOTH, pady=5, padx=5)
+        # Text messages on one tab, tabular results (virtualized grid) on the other
+        self.results_notebook = ttk.Notebook(results_frame)
+        self.results_notebook.pack(expand=True, fill=tk.BOTH, pady=5, padx=5)
+
+        self.results_text = scrolledtext.ScrolledText(self.results_notebook, height=12, width=60, wrap=tk.WORD, state=tk.DISABLED, font=('Courier New', 9))
+        self.results_notebook.add(self.results_text, text="Повідомлення")
+
+        self._result_grid: Optional["VirtualResultGrid"] = None # Tab added on first tabular result
 
         # --- Area for Matplotlib graphs ---
         self.plot_frame = ttk.LabelFrame(output_frame, text="Графік")
@@ -150,15 +183,164 @@ class StudentAnalysisGUI:
 
         self.current_plot_canvas = None
         self.current_plot_toolbar = None
+        # Built figures by (view, id, dataset version); switching back to a view reuses its figure
+        self._figure_cache: Optional["plotting.FigureCache"] = None
+
+        # Need processed data; disabled while the data is (re)loaded
+        self._data_buttons = [
+            self.student_search_button, self.group_info_button, self.group_pie_button, self.group_pdf_button,
+            self.all_scholars_button, self.all_reports_button, self.students_table_button,
+        ]
+
+    # === Background jobs ===
+
+    def _poll_worker(self):
+        """Delivers finished-job/progress events of the worker on the Tk thread, then reschedules itself."""
+        try:
+            self.worker.poll()
+        except Exception as e:
+            logging.error(f"GUI: Error in background job callback: {e}", exc_info=True)
+        self.root.after(WORKER_POLL_INTERVAL_MS, self._poll_worker)
+
+    def _set_busy(self, message: str):
+        self.status_label.config(text=message)
+        self.progress_bar['value'] = 0
+        self.cancel_button.config(state=tk.NORMAL)
+
+    def _set_idle(self, message: str):
+        self.status_label.config(text=message)
+        self.cancel_button.config(state=tk.DISABLED)
+
+    def _on_job_progress(self, fraction: float, message: str):
+        self.progress_bar['value'] = fraction
+        if message:
+            self.status_label.config(text=message)
+
+    def _set_data_buttons_state(self, enabled: bool):
+        for button in self._data_buttons:
+            button.config(state=tk.NORMAL if enabled else tk.DISABLED)
+
+    def _cancel_background_jobs(self):
+        logging.info("GUI: Cancelling background jobs.")
+        self.status_label.config(text="Скасування...")
+        self.worker.cancel_all()
+
+    def _run_in_background(self, name: str, func, on_done, busy_message: str, on_error=None):
+        """Runs func(job) on the worker thread and calls on_done(result) on the Tk thread."""
+        self._set_busy(busy_message)
+
+        def done(result):
+            self._set_idle("Готово.")
+            on_done(result)
+
+        def error(e: BaseException):
+            self._set_idle("Помилка.")
+            if on_error is not None:
+                on_error(e)
+            else:
+                messagebox.showerror("Помилка", f"Виникла помилка: {e}")
+
+        return self.worker.submit(name, func, on_done=done, on_error=error,
+                                  on_progress=self._on_job_progress,
+                                  on_cancelled=lambda: self._set_idle("Операцію скасовано."))
+
+    def _start_processing(self, force: bool = False):
+        """Loads and processes the data on the worker thread; the window stays responsive."""
+        self._set_data_buttons_state(False)
+        self.reload_button.config(state=tk.DISABLED)
+        self._set_busy("Завантаження та обробка даних...")
+
+        def process(job: BackgroundJob):
+            if self.analyzer is None:
+                from .analysis import DataAnalyzer # First pandas import happens here, off the Tk thread
+                self.analyzer = DataAnalyzer(self.config)
+            self.analyzer.process_data(
+                force=force,
+                on_progress=lambda stage, fraction: job.report_progress(fraction, f"Обробка даних: етап '{stage}' завершено"),
+                is_cancelled=lambda: job.cancelled,
+                use_snapshot=True, # Warm start; the reload button (force=True) always reads the workbook
+            )
+            self.analyzer.build_indexes() # Here rather than in the first search on the Tk thread
+
+        self._processing_job = self.worker.submit(
+            "process_data", process,
+            on_done=lambda _: self._on_processing_finished(),
+            on_error=self._on_processing_failed,
+            on_progress=self._on_job_progress,
+            on_cancelled=self._on_processing_cancelled,
+        )
+
+    def _on_processing_finished(self):
+        logging.info(f"GUI: Data processing complete (from snapshot: {self.analyzer.loaded_from_snapshot}).")
+        source = " (збережений знімок)" if self.analyzer.loaded_from_snapshot else ""
+        self._set_idle(f"Файл: {Path(self.config.input_file).name}{source} | Група за замовчуванням: {self.config.target_group}")
+        self.progress_bar['value'] = 1.0
+        self._set_data_buttons_state(True)
+        self.reload_button.config(state=tk.NORMAL)
+        self.worker.submit("preload_modules", self._preload_modules)
+
+    @staticmethod
+    def _preload_modules(job: BackgroundJob):
+        """Imports the plotting and PDF modules on the worker thread (no Tk calls)."""
+        for module_name in PRELOAD_MODULES:
+            job.check_cancelled()
+            importlib.import_module(module_name, __package__)
+
+    def _has_processed_data(self) -> bool:
+        return self.analyzer is not None and self.analyzer._is_processed
+
+    @property
+    def figure_cache(self) -> "plotting.FigureCache":
+        if self._figure_cache is None:
+            from . import plotting
+            self._figure_cache = plotting.FigureCache(maxsize=PLOT_CACHE_SIZE)
+        return self._figure_cache
+
+    @property
+    def result_grid(self) -> "VirtualResultGrid":
+        """The result grid tab, created on first use."""
+        if self._result_grid is None:
+            from .result_grid import VirtualResultGrid
+            self._result_grid = VirtualResultGrid(self.results_notebook, visible_rows=10)
+            self.results_notebook.add(self._result_grid, text="Таблиця")
+        return self._result_grid
+
+    def _on_processing_failed(self, e: BaseException):
+        logging.error(f"GUI: Critical error during data loading/processing: {e}")
+        self._set_idle("Помилка завантаження даних.")
+        self.reload_button.config(state=tk.NORMAL)
+        self._set_data_buttons_state(self._has_processed_data()) # Previous data is still valid
+        messagebox.showerror("Помилка Завантаження Даних", f"Не вдалося завантажити або обробити дані:\n{e}\n\nПеревірте файл '{getattr(self.config, 'input_file', 'N/A')}' та конфігурацію.")
+
+    def _on_processing_cancelled(self):
+        logging.info("GUI: Data processing cancelled.")
+        self._set_idle("Обробку даних скасовано.")
+        self.reload_button.config(state=tk.NORMAL)
+        self._set_data_buttons_state(self._has_processed_data())
+
+    def _on_close(self):
+        self.worker.shutdown()
+        self.root.quit()
 
 
     # === Auxiliary methods===
 
     def _clear_results(self):
-        """Clears the results text field."""
+        """Clears the results text field and the result grid."""
         self.results_text.config(state=tk.NORMAL) # Дозволити редагування
         self.results_text.delete('1.0', tk.END)
         self.results_text.config(state=tk.DISABLED) # Знову заборонити
+        if self._result_grid is not None:
+            self._result_grid.clear()
+        self.results_notebook.select(self.results_text)
+
+    def _show_result_table(self, df: "pd.DataFrame", sort_by: Optional[str] = None):
+        """Shows students in the virtualized result grid (only visible rows are rendered)."""
+        columns = [self.config.name_column, self.config.group_column, self.config.gpa_column, self.config.scholarship_column]
+        columns += self.config.subject_score_columns
+        columns = [col for col in columns if col in df.columns]
+        self.result_grid.set_data(df, columns, sort_by=sort_by)
+        self.results_notebook.select(self.result_grid)
 
     def _append_results(self, text):
         """Adds text to the results text field."""
@@ -168,18 +350,21 @@ class StudentAnalysisGUI:
         self.results_text.see(tk.END) # Прокрутити до кінця
 
     def _clear_plot_area(self):
-        """Removes the current graph and its toolbar from the plot_frame."""
+        """Hides the current graph and its toolbar (the canvas is kept for reuse)."""
         if self.current_plot_toolbar:
             self.current_plot_toolbar.pack_forget()
-            self.current_plot_toolbar = None
         if self.current_plot_canvas:
             self.current_plot_canvas.get_tk_widget().pack_forget()
-            self.current_plot_canvas = None
         if not self.plot_placeholder_label.winfo_ismapped():
             self.plot_placeholder_label.pack(expand=True)
 
-    def _display_plot(self, fig: Optional[Figure]): # Optional use
-        """Displays the Matplotlib figure in the plot_frame."""
+    def _display_plot(self, fig: Optional["Figure"]): # Optional use
+        """
+        Displays the Matplotlib figure in the plot_frame.
+
+        One FigureCanvasTkAgg and toolbar are created on first use and then
+        reused: showing another figure only swaps the canvas' figure.
+        """
         self._clear_plot_area() 
 
         if fig is None:
@@ -192,18 +377,26 @@ class StudentAnalysisGUI:
         self.plot_placeholder_label.pack_forget()
 
         try:
-            # Create Canvas
-            canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
-            canvas.draw()
-
-            toolbar = NavigationToolbar2Tk(canvas, self.plot_frame, pack_toolbar=False)
-            toolbar.update()
-
-            toolbar.pack(side=tk.BOTTOM, fill=tk.X)
-            canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
-
-            self.current_plot_canvas = canvas
-            self.current_plot_toolbar = toolbar
+            if self.current_plot_canvas is None:
+                from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+                canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
+                toolbar = NavigationToolbar2Tk(canvas, self.plot_frame, pack_toolbar=False)
+                self.current_plot_canvas = canvas
+                self.current_plot_toolbar = toolbar
+            else:
+                canvas = self.current_plot_canvas
+                widget = canvas.get_tk_widget()
+                canvas.figure = fig
+                fig.set_canvas(canvas)
+                # Cached figures may have been built for another size
+                width, height = widget.winfo_width(), widget.winfo_height()
+                if width > 1 and height > 1:
+                    fig.set_size_inches(width / fig.dpi, height / fig.dpi, forward=False)
+
+            self.current_plot_toolbar.update() # Resets the zoom/pan history for the new figure
+            self.current_plot_toolbar.pack(side=tk.BOTTOM, fill=tk.X)
+            self.current_plot_canvas.get_tk_widget().pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+            self.current_plot_canvas.draw()
             logging.info("GUI: Plot displayed successfully.")
 
         except Exception as e:
@@ -213,13 +406,6 @@ class StudentAnalysisGUI:
             self.plot_placeholder_label.config(text="Помилка відображення графіка")
             self.plot_placeholder_label.pack(expand=True) # Показати текст помилки
 
-        finally:
-            # Close the Matplotlib figure to free up memory,
-            # since it has already been drawn in Canvas
-            # Check that fig is really a Figure object before closing
-            if isinstance(fig, Figure):
-                plt.close(fig)
-
 
     # === Event handlers for buttons ===
 
@@ -246,33 +432,17 @@ class StudentAnalysisGUI:
 
             else:
                 num_found = len(found_students_df)
-                self._append_results(f"Знайдено {num_found} студент(ів), що містять '{student_name}':")
-
-                for index, student_data in found_students_df.iterrows():
-                    self._append_results("-" * 30)
-                    name = student_data.get(self.config.name_column, "N/A")
-                    group = student_data.get(self.config.group_column, "N/A")
-                    gpa = student_data.get(self.config.gpa_column)
-                    gpa_str = f"{gpa:.2f}" if pd.notna(gpa) else "N/A"
-                    scholarship = student_data.get(self.config.scholarship_column, "") == self.config.scholarship_marker
-                    scholarship_str = "Так" if scholarship else "Ні"
-
-                    self._append_results(f"  ПІБ: {name}")
-                    self._append_results(f"  Група: {group}")
-                    self._append_results(f"  GPA: {gpa_str}")
-                    self._append_results(f"  Стипендія: {scholarship_str}")
-                    # Add grade
-                    self._append_results("  Оцінки:")
-                    for subj_col in self.config.subject_score_columns:
-                        score = student_data.get(subj_col)
-                        score_str = f"{score:.0f}" if pd.notna(score) else "N/A"
-                        subj_name = self.config.get_national_scale_column_name(subj_col).replace(self.config.national_scale_suffix, '') # Використаємо метод з конфіга для очищення
-                        self._append_results(f"    {subj_name}: {score_str}")
+                self._append_results(f"Знайдено {num_found} студент(ів), що містять '{student_name}'.")
+                self._show_result_table(found_students_df)
 
+                from . import plotting
                 first_student_data = found_students_df.iloc[0]
                 logging.info(f"GUI: Creating bar chart for {first_student_data.get(self.config.name_column, 'N/A')}")
 
-                student_fig = plotting.create_student_scores_bar(first_student_data, self.config)
+                student_fig = self.figure_cache.get_or_create(
+                    ('student', found_students_df.index[0], self.analyzer.dataset_version),
+                    lambda: plotting.create_student_scores_bar(first_student_data, self.config)
+                )
                 self._display_plot(student_fig)
 
         except RuntimeError as e:
@@ -305,6 +475,7 @@ class StudentAnalysisGUI:
             self._append_results(f"Кількість студентів: {group_stats.get('students_in_group', 'N/A')}")
             self._append_results(f"Кількість стипендіатів: {group_stats.get('scholarship_recipients_in_group', 'N/A')}")
 
+            import pandas as pd # Already loaded by the analysis, so this is only a lookup
             avg_gpa = group_stats.get('average_gpa_in_group')
             avg_gpa_str = f"{avg_gpa:.2f}" if avg_gpa is not None and pd.notna(avg_gpa) else "N/A" 
             self._append_results(f"Середній GPA: {avg_gpa_str}")
@@ -341,12 +512,9 @@ class StudentAnalysisGUI:
                 self._append_results("Студентів, що отримують стипендію, не знайдено.")
                 logging.info("GUI: No scholars found.")
             else:
-                self._append_results("--- Список Студентів зі Стипендією ---")
-                names = sorted(scholars_df[self.config.name_column].tolist())
-                for i, name in enumerate(names, 1):
-                    self._append_results(f"{i}. {name}")
-                self._append_results(f"\nЗагальна кількість стипендіатів: {len(names)}")
-                logging.info(f"GUI: Displayed {len(names)} scholars.")
+                self._append_results(f"Загальна кількість стипендіатів: {len(scholars_df)}")
+                self._show_result_table(scholars_df, sort_by=self.config.name_column)
+                logging.info(f"GUI: Displayed {len(scholars_df)} scholars.")
 
         except RuntimeError as e:
              logging.error(f"GUI: Runtime error getting scholars list: {e}")
@@ -377,7 +545,11 @@ class StudentAnalysisGUI:
                     self.plot_placeholder_label.pack(expand=True)
                 return
 
-            group_fig = plotting.create_group_performance_pie(group_df, group_id, self.config)
+            from . import plotting
+            group_fig = self.figure_cache.get_or_create(
+                ('group', group_id, self.analyzer.dataset_version),
+                lambda: plotting.create_group_performance_pie(group_df, group_id, self.config)
+            )
             self._display_plot(group_fig) 
         except RuntimeError as e:
              logging.error(f"GUI: Runtime error creating group pie chart: {e}")
@@ -429,25 +601,32 @@ class StudentAnalysisGUI:
                 return
 
             self._append_results(f"Генерація PDF звіту для групи {group_id} до файлу:\n{filepath}...")
-            self.root.update_idletasks() 
-
-            success = pdf_reporter.generate_group_report_pdf(
-                group_df=group_df,
-                group_stats=group_stats,
-                group_id=group_id,
-                config=self.config,
-                output_filepath=filepath 
+            aggregates = self.analyzer.get_report_aggregates(group_id)
+
+            def on_done(success: bool):
+                if success:
+                    logging.info(f"GUI: PDF report generated successfully: {filepath}")
+                    messagebox.showinfo("PDF Звіт Згенеровано", f"Звіт для групи {group_id} успішно збережено як:\n{filepath}")
+                    self._append_results(f"PDF звіт успішно збережено:\n{filepath}")
+                else:
+                    logging.error(f"GUI: Failed to generate PDF report for group {group_id}.")
+                    messagebox.showerror("Помилка Генерації PDF", f"Не вдалося згенерувати PDF звіт для групи {group_id}.\nПеревірте лог-файл для деталей.")
+                    self._append_results(f"Помилка генерації PDF звіту для групи {group_id}.")
+
+            from . import pdf_reporter
+            self._run_in_background(
+                f"group_pdf:{group_id}",
+                lambda job: pdf_reporter.generate_group_report_pdf(
+                    group_df=group_df,
+                    group_stats=group_stats,
+                    group_id=group_id,
+                    config=self.config,
+                    output_filepath=filepath,
+                    aggregates=aggregates
+                ),
+                on_done, f"Генерація PDF звіту для групи {group_id}..."
             )
 
-            if success:
-                logging.info(f"GUI: PDF report generated successfully: {filepath}")
-                messagebox.showinfo("PDF Звіт Згенеровано", f"Звіт для групи {group_id} успішно збережено як:\n{filepath}")
-                self._append_results(f"PDF звіт успішно збережено:\n{filepath}")
-            else:
-                logging.error(f"GUI: Failed to generate PDF report for group {group_id}.")
-                messagebox.showerror("Помилка Генерації PDF", f"Не вдалося згенерувати PDF звіт для групи {group_id}.\nПеревірте лог-файл для деталей.")
-                self._append_results(f"Помилка генерації PDF звіту для групи {group_id}.")
-
         except ValueError as e: 
              logging.warning(f"GUI: Error getting stats for PDF report: {e}")
              messagebox.showerror("Помилка Даних", f"Помилка отримання даних для звіту: {e}")
@@ -461,12 +640,86 @@ class StudentAnalysisGUI:
              logging.error(f"GUI: Unexpected error during PDF generation: {e}", exc_info=True)
              messagebox.showerror("Неочікувана Помилка", f"Виникла помилка: {e}")
 
+    def _generate_all_group_pdfs(self):
+        """Generates PDF reports for all groups into config.reports_dir."""
+        self._clear_results()
+        output_dir = self.config.reports_dir
+        logging.info(f"GUI: Starting batch PDF generation to '{output_dir}'")
+        self._append_results(f"Генерація PDF звітів для всіх груп до:\n{output_dir}...")
+
+        from . import batch_reports
+
+        def generate(job: BackgroundJob):
+            return batch_reports.generate_all_group_reports(
+                self.analyzer, output_dir,
+                on_report_complete=lambda result, completed, total: job.report_progress(
+                    completed / total, f"PDF звіти: {completed} з {total}"),
+                is_cancelled=lambda: job.cancelled,
+            )
+
+        def on_done(manifest: "batch_reports.BatchReportManifest"):
+            self._append_results(f"Згенеровано звітів: {len(manifest.succeeded)} з {len(manifest.reports)} "
+                                 f"за {manifest.total_wall_time_s:.2f} с ({manifest.workers} процесів).")
+            if manifest.cancelled:
+                self._append_results("Генерацію скасовано, решту звітів не створено.")
+            for report in manifest.failed:
+                self._append_results(f"  Помилка для групи {report.group_id}: {report.error}")
+            self._append_results(f"Маніфест: {Path(output_dir) / batch_reports.MANIFEST_FILENAME}")
+            if manifest.failed:
+                messagebox.showwarning("PDF Звіти", f"Не вдалося згенерувати {len(manifest.failed)} звіт(ів). Перевірте лог-файл.")
+            elif not manifest.cancelled:
+                messagebox.showinfo("PDF Звіти", f"Усі звіти ({len(manifest.reports)}) збережено до:\n{output_dir}")
+
+        def on_error(e: BaseException):
+             logging.error(f"GUI: Error during batch PDF generation: {e}")
+             messagebox.showerror("Помилка", f"Помилка під час генерації PDF: {e}")
+
+        self._run_in_background("all_group_pdfs", generate, on_done, "Генерація PDF звітів для всіх груп...", on_error)
+
+    def _generate_students_table_pdf(self):
+        """Generates a paginated PDF table of all processed students and offers to save it."""
+        self._clear_results()
+        try:
+            output_dir = self.config.output_dir
+            output_dir.mkdir(parents=True, exist_ok=True)
+            filepath = filedialog.asksaveasfilename(
+                initialdir=str(output_dir),
+                initialfile="all_students_report.pdf",
+                defaultextension=".pdf",
+                filetypes=[("PDF Documents", "*.pdf"), ("All Files", "*.*")]
+            )
+            if not filepath:
+                logging.info("GUI: Student table PDF generation cancelled by user.")
+                self._append_results("Генерацію PDF звіту скасовано.")
+                return
+
+            students_df = self.analyzer.processed_df
+            self._append_results(f"Генерація PDF таблиці ({len(students_df)} студентів) до файлу:\n{filepath}...")
+
+            def on_done(success: bool):
+                if success:
+                    messagebox.showinfo("PDF Звіт Згенеровано", f"Таблицю студентів успішно збережено як:\n{filepath}")
+                    self._append_results(f"PDF звіт успішно збережено:\n{filepath}")
+                else:
+                    messagebox.showerror("Помилка Генерації PDF", "Не вдалося згенерувати PDF таблицю студентів.\nПеревірте лог-файл для деталей.")
+                    self._append_results("Помилка генерації PDF таблиці студентів.")
+
+            from . import pdf_reporter
+            self._run_in_background(
+                "students_table_pdf",
+                lambda job: pdf_reporter.generate_student_table_pdf(students_df, self.config, filepath),
+                on_done, "Генерація PDF таблиці студентів..."
+            )
+        except Exception as e:
+             logging.error(f"GUI: Unexpected error during student table PDF generation: {e}", exc_info=True)
+             messagebox.showerror("Неочікувана Помилка", f"Виникла помилка: {e}")
+
 
 def run_gui():
     """Initializes and runs the Tkinter main loop."""
     root = tk.Tk()
     app = StudentAnalysisGUI(root) 
-    if hasattr(app, 'analyzer') and app.analyzer: 
+    if app.initialized: 
         root.mainloop()
     else:
         logging.info("GUI: Exiting due to initialization failure.")
@@ -0,0 +1,157 @@
+import pandas as pd
+import numpy as np
+import bisect
+import logging
+import re
+import unicodedata
+from typing import Dict, List, Iterable
+
+# Apostrophe variants used in Ukrainian names (Мар'яна, Мар’яна, Марʼяна)
+_APOSTROPHES = re.compile(r"[’‘`´ʼʹ′]")
+_WHITESPACE = re.compile(r"\s+")
+NGRAM_SIZE = 3
+
+
+def normalize_name(name: str) -> str:
+    """Casefolds and normalizes a name (Unicode NFKC, apostrophes, whitespace)."""
+    name = unicodedata.normalize('NFKC', str(name)).casefold()
+    name = _APOSTROPHES.sub("'", name)
+    return _WHITESPACE.sub(' ', name).strip()
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Vectorized normalize_name for a whole column; missing names stay missing."""
+    names = names.astype('string')
+    return (names.str.normalize('NFKC').str.casefold()
+                 .str.replace(_APOSTROPHES.pattern, "'", regex=True)
+                 .str.replace(_WHITESPACE.pattern, ' ', regex=True)
+                 .str.strip())
+
+
+def _ngrams(text: str, n: int = NGRAM_SIZE) -> Iterable[str]:
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def _substring_edit_distance(pattern: str, text: str) -> int:
+    """Smallest edit distance between pattern and any substring of text."""
+    previous = [0] * (len(text) + 1) # A match may start anywhere in text
+    for i, p_char in enumerate(pattern, 1):
+        current = [i] + [0] * len(text)
+        for j, t_char in enumerate(text, 1):
+            current[j] = min(
+                previous[j] + 1,                         # deletion
+                current[j - 1] + 1,                      # insertion
+                previous[j - 1] + (p_char != t_char),    # substitution
+            )
+        previous = current
+    return min(previous)
+
+
+class NameSearchIndex:
+    """
+    Prebuilt search index over normalized student names.
+
+    Substring queries intersect the posting lists of the query trigrams and
+    verify the few remaining candidates; prefix queries use a sorted array.
+    """
+    def __init__(self, names: pd.Series):
+        """
+        Builds the index.
+
+        Args:
+            names: The name column; results are returned as positions into it.
+        """
+        normalized = normalize_names(names)
+        self._names: List[str] = normalized.fillna('').tolist()
+        # An empty query matches every named row, but not rows without a name (as str.contains(na=False))
+        self._named_positions = np.flatnonzero(normalized.notna().to_numpy()).astype(np.int64)
+
+        postings: Dict[str, List[int]] = {}
+        for position, name in enumerate(self._names):
+            for gram in _ngrams(name):
+                postings.setdefault(gram, []).append(position)
+        self._postings: Dict[str, np.ndarray] = {
+            gram: np.asarray(positions, dtype=np.int32) for gram, positions in postings.items()
+        }
+        # Names shorter than a trigram have no postings; short queries check them directly
+        self._short_positions = np.asarray(
+            [position for position, name in enumerate(self._names) if 0 < len(name) < NGRAM_SIZE], dtype=np.int64)
+
+        order = sorted(range(len(self._names)), key=self._names.__getitem__)
+        self._sorted_names: List[str] = [self._names[i] for i in order]
+        self._sorted_positions = np.asarray(order, dtype=np.int64)
+        logging.info(f"Name search index built: {len(self._names)} names, {len(self._postings)} trigrams.")
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _all_positions(self) -> np.ndarray:
+        return self._named_positions.copy()
+
+    def search(self, query: str) -> np.ndarray:
+        """Returns sorted positions of names containing query (case-insensitive)."""
+        query = normalize_name(query)
+        if not query:
+            return self._all_positions()
+
+        if len(query) < NGRAM_SIZE:
+            # Too short for trigrams: take candidates from every trigram containing the query
+            lists = [positions for gram, positions in self._postings.items() if query in gram]
+            lists.append(self._short_positions)
+            candidates = np.unique(np.concatenate(lists))
+        else:
+            lists = []
+            for gram in _ngrams(query):
+                positions = self._postings.get(gram)
+                if positions is None:
+                    return np.empty(0, dtype=np.int64)
+                lists.append(positions)
+            lists.sort(key=len)
+            candidates = lists[0]
+            for positions in lists[1:]:
+                candidates = np.intersect1d(candidates, positions, assume_unique=True)
+                if candidates.size == 0:
+                    break
+
+        # Trigram matches are necessary but not sufficient, so verify each candidate
+        verified = [position for position in candidates.tolist() if query in self._names[position]]
+        return np.asarray(verified, dtype=np.int64)
+
+    def search_prefix(self, prefix: str) -> np.ndarray:
+        """Returns sorted positions of names starting with prefix (case-insensitive)."""
+        prefix = normalize_name(prefix)
+        if not prefix:
+            return self._all_positions()
+        start = bisect.bisect_left(self._sorted_names, prefix)
+        end = bisect.bisect_right(self._sorted_names, prefix + '\U0010ffff')
+        return np.sort(self._sorted_positions[start:end])
+
+    def search_fuzzy(self, query: str, max_distance: int = 1) -> np.ndarray:
+        """
+        Returns positions of names containing query with at most max_distance
+        typos (edit distance), best matches first.
+        """
+        query = normalize_name(query)
+        if max_distance <= 0 or len(query) < NGRAM_SIZE:
+            return self.search(query)
+
+        # Each edit destroys at most NGRAM_SIZE query trigrams (q-gram lemma)
+        query_grams = _ngrams(query)
+        min_shared = len(query_grams) - NGRAM_SIZE * max_distance
+        if min_shared > 0:
+            lists = [self._postings[gram] for gram in query_grams if gram in self._postings]
+            if not lists:
+                return np.empty(0, dtype=np.int64)
+            shared = np.bincount(np.concatenate(lists), minlength=len(self._names))
+            candidates = np.flatnonzero(shared >= min_shared).tolist()
+        else:
+            # Query too short for the filter to be safe: check every name
+            candidates = range(len(self._names))
+
+        matches = []
+        for position in candidates:
+            distance = _substring_edit_distance(query, self._names[position])
+            if distance <= max_distance:
+                matches.append((distance, position))
+        matches.sort()
+        return np.asarray([position for _, position in matches], dtype=np.int64)
@@ -2,69 +2,66 @@ import pandas as pd
 import numpy as np
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple, Iterator
 
 # --- ReportLab Imports ---
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY # TA_JUSTIFY може бути корисним
 from reportlab.lib.units import inch
+from reportlab.lib.pagesizes import A4, landscape
 from reportlab.lib import colors
 # --- New imports for Fonts ---
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
 from .config import AppConfig
+from .report_aggregates import GroupReportAggregates, compute_group_report_aggregates
 
-try:
-    font_path = Path(__file__).parent / "assets" / "fonts" / "OpenSans-VariableFont_wdth,wght.ttf" 
-    if font_path.exists():
-        pdfmetrics.registerFont(TTFont('OpenSans', str(font_path))) 
-        FONT_NAME = 'OpenSans' 
-        logging.info(f"Registered TTF font '{FONT_NAME}' from: {font_path}")
-    else:
-        logging.warning(f"Font file not found at {font_path}. Using default font (may cause issues with Cyrillic).")
-        FONT_NAME = 'Helvetica'
-        
-except Exception as font_err:
-    logging.error(f"Failed to register font: {font_err}", exc_info=True)
-    FONT_NAME = 'Helvetica' 
-
-# --- Setup basic styles using the registered font ---
-styles = getSampleStyleSheet()
-
-styles.add(ParagraphStyle(name='Center', alignment=TA_CENTER, fontName=FONT_NAME))
-styles.add(ParagraphStyle(name='LeftAligned', alignment=TA_LEFT, spaceAfter=6, fontName=FONT_NAME, leading=14)) 
-styles.add(ParagraphStyle(name='H1', alignment=TA_CENTER, fontSize=16, spaceAfter=12, spaceBefore=12, fontName=FONT_NAME))
-styles.add(ParagraphStyle(name='H2', alignment=TA_LEFT, fontSize=14, spaceAfter=10, spaceBefore=10, fontName=FONT_NAME))
-styles.add(ParagraphStyle(name='TableHeader', alignment=TA_CENTER, fontName=FONT_NAME, fontSize=10))
-styles.add(ParagraphStyle(name='TableCell', alignment=TA_CENTER, fontName=FONT_NAME, fontSize=9))
-
-def _calculate_group_subject_averages(group_df: pd.DataFrame, config: AppConfig) -> Dict[str, float]:
-    """Calculates the average score for each subject within the group."""
-    averages = {}
-    for col in config.subject_score_columns:
-        if col in group_df.columns and pd.api.types.is_numeric_dtype(group_df[col]):
-            avg = group_df[col].mean(skipna=True)
-            subject_name = col.replace('(бали)', '').replace('(Бали)', '').strip()
-            averages[subject_name] = avg if pd.notna(avg) else 0.0
-    return averages
-
-def _find_students_by_score_threshold(group_df: pd.DataFrame, config: AppConfig, threshold: int, condition: str) -> List[str]:
-    """Finds students with any score meeting the condition (less than or greater than)."""
-    students_found = set()
-    for col in config.subject_score_columns:
-        if col in group_df.columns and pd.api.types.is_numeric_dtype(group_df[col]):
-            if condition == 'less':
-                mask = group_df[col] < threshold
-            elif condition == 'greater':
-                mask = group_df[col] > threshold
-            else:
-                continue
-            
-            students_found.update(group_df.loc[mask, config.name_column].tolist())
-            
-    return sorted(list(students_found))
+_FONT_PATH = Path(__file__).parent / "assets" / "fonts" / "OpenSans-VariableFont_wdth,wght.ttf"
+_FALLBACK_FONT_NAME = 'Helvetica'
+
+
+@lru_cache(maxsize=None)
+def get_font_name() -> str:
+    """
+    Registers the Cyrillic TTF font on first use and returns the font name
+    to use. Later calls (and imports that never build a PDF) cost nothing.
+    """
+    try:
+        if _FONT_PATH.exists():
+            pdfmetrics.registerFont(TTFont('OpenSans', str(_FONT_PATH)))
+            logging.info(f"Registered TTF font 'OpenSans' from: {_FONT_PATH}")
+            return 'OpenSans'
+        logging.warning(f"Font file not found at {_FONT_PATH}. Using default font (may cause issues with Cyrillic).")
+    except Exception as font_err:
+        logging.error(f"Failed to register font: {font_err}", exc_info=True)
+    return _FALLBACK_FONT_NAME
+
+
+@lru_cache(maxsize=None)
+def get_styles() -> StyleSheet1:
+    """Builds the report stylesheet (using the registered font) once and caches it."""
+    font_name = get_font_name()
+    styles = getSampleStyleSheet()
+
+    styles.add(ParagraphStyle(name='Center', alignment=TA_CENTER, fontName=font_name))
+    styles.add(ParagraphStyle(name='LeftAligned', alignment=TA_LEFT, spaceAfter=6, fontName=font_name, leading=14)) 
+    styles.add(ParagraphStyle(name='H1', alignment=TA_CENTER, fontSize=16, spaceAfter=12, spaceBefore=12, fontName=font_name))
+    styles.add(ParagraphStyle(name='H2', alignment=TA_LEFT, fontSize=14, spaceAfter=10, spaceBefore=10, fontName=font_name))
+    styles.add(ParagraphStyle(name='TableHeader', alignment=TA_CENTER, fontName=font_name, fontSize=10))
+    styles.add(ParagraphStyle(name='TableCell', alignment=TA_CENTER, fontName=font_name, fontSize=9))
+    return styles
+
+
+def __getattr__(name: str):
+    # The former module-level FONT_NAME and styles, now created on first access
+    if name == 'FONT_NAME':
+        return get_font_name()
+    if name == 'styles':
+        return get_styles()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --- The main function of PDF generation ---
@@ -74,7 +71,8 @@ def generate_group_report_pdf(
     group_stats: Dict[str, Any],
     group_id: str,
     config: AppConfig,
-    output_filepath: str
+    output_filepath: str,
+    aggregates: Optional[GroupReportAggregates] = None
 ) -> bool:
     """
     Generates a PDF report for a specific student group to the specified file path.
@@ -85,11 +83,14 @@ def generate_group_report_pdf(
         group_id: The ID of the group.
         config: Application configuration.
         output_filepath: The full path (including filename) to save the PDF report.
+        aggregates: Precomputed subject averages and threshold lists of the group
+                    (see report_aggregates); computed from group_df if not given.
 
     Returns:
         True if PDF generation was successful, False otherwise.
     """
-    logging.info(f"Generating PDF report for group: {group_id} to '{output_filepath}' using font '{FONT_NAME}'")
+    styles = get_styles()
+    logging.info(f"Generating PDF report for group: {group_id} to '{output_filepath}' using font '{get_font_name()}'")
 
     if not output_filepath:
         logging.error("Output file path is empty. Cannot generate PDF.")
@@ -99,6 +100,11 @@ def generate_group_report_pdf(
     story = []
 
     try:
+        if aggregates is None:
+            # group_df holds a single group, whatever the type of its group column
+            per_group = compute_group_report_aggregates(group_df, config)
+            aggregates = next(iter(per_group.values())) if len(per_group) == 1 else per_group.get(group_id, GroupReportAggregates())
+
         # --- Title ---
         story.append(Paragraph(f"Звіт Успішності Студентів - Група {group_id}", styles['H1']))
         story.append(Spacer(1, 0.2*inch))
@@ -116,7 +122,7 @@ def generate_group_report_pdf(
 
         # --- Subject Averages ---
         story.append(Paragraph("Середній Бал по Предметах:", styles['H2']))
-        subject_averages = _calculate_group_subject_averages(group_df, config)
+        subject_averages = aggregates.subject_averages
         if subject_averages:
             avg_data = [
                 [Paragraph('Предмет', styles['TableHeader']), Paragraph('Середній Бал', styles['TableHeader'])]
@@ -145,7 +151,7 @@ def generate_group_report_pdf(
 
         # --- Low Performers ---
         story.append(Paragraph("Студенти з Оцінками Нижче 65 (з будь-якого предмету):", styles['H2']))
-        low_performers = _find_students_by_score_threshold(group_df, config, 65, 'less')
+        low_performers = aggregates.low_performers
         if low_performers:
              low_performers_text = "<br/>".join([f"- {name}" for name in low_performers])
              story.append(Paragraph(low_performers_text, styles['LeftAligned']))
@@ -155,7 +161,7 @@ def generate_group_report_pdf(
 
         # --- High Performers  ---
         story.append(Paragraph("Студенти з Оцінками Вище 95 (з будь-якого предмету):", styles['H2']))
-        high_performers = _find_students_by_score_threshold(group_df, config, 95, 'greater')
+        high_performers = aggregates.high_performers
         if high_performers:
              high_performers_text = "<br/>".join([f"- {name}" for name in high_performers])
              story.append(Paragraph(high_performers_text, styles['LeftAligned']))
@@ -170,4 +176,146 @@ def generate_group_report_pdf(
 
     except Exception as e:
         logging.error(f"Failed to generate PDF report for group {group_id} to {output_filepath}: {e}", exc_info=True)
-        return False
\ No newline at end of file
+        return False
+
+
+# --- Large student table report ---
+
+TABLE_FONT_SIZE = 8
+TABLE_ROW_HEIGHT = 14 # Font size + cell padding of a single-line row
+
+class _FlowableFeed(list):
+    """
+    Flowable list for doc.build that takes the next flowable from an iterator
+    only when the previous ones have been drawn. build() checks len() before
+    every flowable, so at most one table chunk exists at a time.
+    """
+    def __init__(self, head: List[Any], rest: Iterator[Any]):
+        super().__init__(head)
+        self._rest = rest
+
+    def __len__(self) -> int:
+        if not super().__len__():
+            following = next(self._rest, None)
+            if following is not None:
+                self.append(following)
+        return super().__len__()
+
+
+def _format_student_table(df: pd.DataFrame, config: AppConfig) -> Tuple[List[str], np.ndarray]:
+    """Formats the table columns into a string matrix with vectorized column operations."""
+    headers = ['№', 'ПІБ', 'Група']
+    columns = [
+        pd.Series(np.arange(1, len(df) + 1), index=df.index).astype(str),
+        df[config.name_column].astype('string').fillna(''),
+        df[config.group_column].astype('string').fillna(''),
+    ]
+    for col in config.subject_score_columns:
+        if col in df.columns and pd.api.types.is_numeric_dtype(df[col]):
+            headers.append(col.replace('(бали)', '').replace('(Бали)', '').strip())
+            columns.append(df[col].map('{:.0f}'.format, na_action='ignore').astype('string').fillna('N/A'))
+    if config.gpa_column in df.columns:
+        headers.append('GPA')
+        columns.append(df[config.gpa_column].map('{:.2f}'.format, na_action='ignore').astype('string').fillna('N/A'))
+    if config.scholarship_column in df.columns:
+        headers.append('Стипендія')
+        columns.append(df[config.scholarship_column].astype('string').fillna(''))
+    matrix = np.column_stack([column.to_numpy(dtype=object) for column in columns]) if len(df) else np.empty((0, len(headers)), dtype=object)
+    return headers, matrix
+
+
+def generate_student_table_pdf(
+    df: pd.DataFrame,
+    config: AppConfig,
+    output_filepath: str,
+    title: str = "Успішність Студентів",
+    rows_per_chunk: Optional[int] = None
+) -> bool:
+    """
+    Generates a paginated table of all given students (e.g. a faculty-wide report).
+
+    Unlike generate_group_report_pdf, which is meant for one group, this mode
+    scales to thousands of rows: cells are plain strings (a Paragraph is used
+    only for text wider than its column), and the table is emitted as
+    page-sized Table chunks that each repeat the header row, so ReportLab
+    never has to measure or split one huge table. Chunks are created one at a
+    time while the document is built, so only the current page's flowables
+    are in memory; the formatted cell text and the finished PDF pages (kept
+    by ReportLab until the file is saved) still grow with the row count.
+
+    Args:
+        df: The students to list (typically processed_df).
+        config: Application configuration.
+        output_filepath: The full path (including filename) to save the PDF report.
+        title: Report title on the first page.
+        rows_per_chunk: Data rows per Table chunk (defaults to one page).
+
+    Returns:
+        True if PDF generation was successful, False otherwise.
+    """
+    styles = get_styles()
+    font_name = get_font_name()
+    logging.info(f"Generating student table PDF ({len(df)} students) to '{output_filepath}'")
+
+    if not output_filepath:
+        logging.error("Output file path is empty. Cannot generate PDF.")
+        return False
+
+    try:
+        doc = SimpleDocTemplate(output_filepath, pagesize=landscape(A4),
+                                leftMargin=0.5*inch, rightMargin=0.5*inch, topMargin=0.5*inch, bottomMargin=0.5*inch)
+        headers, matrix = _format_student_table(df, config)
+        if rows_per_chunk is None:
+            rows_per_chunk = max(1, int(doc.height // TABLE_ROW_HEIGHT) - 2) # Header row + safety margin
+
+        # Name column takes the remaining width; other columns share it evenly
+        other_width = min(1.0*inch, doc.width * 0.6 / max(1, len(headers) - 2))
+        col_widths = [0.5*inch, doc.width - 0.5*inch - other_width * (len(headers) - 2)] + [other_width] * (len(headers) - 2)
+        cell_style = ParagraphStyle('LargeTableCell', parent=styles['TableCell'], fontSize=TABLE_FONT_SIZE, leading=TABLE_FONT_SIZE + 2)
+        header_row = [Paragraph(text, cell_style) for text in headers]
+
+        table_style = TableStyle([
+            ('FONTNAME', (0, 0), (-1, -1), font_name),
+            ('FONTSIZE', (0, 0), (-1, -1), TABLE_FONT_SIZE),
+            ('LEADING', (0, 0), (-1, -1), TABLE_FONT_SIZE + 2),
+            ('BACKGROUND', (0, 0), (-1, 0), colors.darkslategray),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.whitesmoke]),
+            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+        ])
+
+        # Only cells that do not fit their column are wrapped in a Paragraph
+        max_text_widths = [width - 12 for width in col_widths] # minus left/right padding
+        def to_cell(text: str, column: int) -> Any:
+            if pdfmetrics.stringWidth(text, font_name, TABLE_FONT_SIZE) > max_text_widths[column]:
+                return Paragraph(text, cell_style)
+            return text
+
+        story = [Paragraph(title, styles['H1']),
+                 Paragraph(f"Кількість студентів: {len(df)}", styles['LeftAligned'])]
+        # The first chunk shares its page with the title, so it is shorter;
+        # every following chunk then starts at the top of a page.
+        title_height = sum(flowable.wrap(doc.width, doc.height)[1] + flowable.getSpaceBefore() + flowable.getSpaceAfter()
+                           for flowable in story)
+        first_chunk = max(1, rows_per_chunk - int(-(-title_height // TABLE_ROW_HEIGHT)))
+        boundaries = [0] + list(range(first_chunk, len(matrix), rows_per_chunk)) + [len(matrix)]
+        def chunks() -> Iterator[Table]:
+            for start, end in zip(boundaries[:-1], boundaries[1:]):
+                rows = [[to_cell(text, column) for column, text in enumerate(row)]
+                        for row in matrix[start:end].tolist()]
+                chunk = Table([header_row] + rows, colWidths=col_widths, repeatRows=1)
+                chunk.setStyle(table_style)
+                yield chunk
+
+        doc.build(_FlowableFeed(story, chunks()))
+        logging.info(f"Student table PDF saved successfully to {output_filepath}")
+        return True
+
+    except Exception as e:
+        logging.error(f"Failed to generate student table PDF to {output_filepath}: {e}", exc_info=True)
+        return False
@@ -0,0 +1,198 @@
+import pandas as pd
+import logging
+import time
+from dataclasses import dataclass, field, asdict
+from typing import Callable, Optional, List, Dict, Any, Tuple
+
+from .config import AppConfig
+from .data_loader import DataLoader
+from .data_cleaner import DataCleaner
+from .grade_calculator import GradeCalculator
+from .scholarship import ScholarshipDeterminer
+
+# A stage receives the output of the previous stage (None for the first one),
+# the configuration and the in-place flag, and returns the next DataFrame.
+StageFunc = Callable[[Optional[pd.DataFrame], AppConfig, bool], pd.DataFrame]
+
+
+class PipelineCancelled(Exception):
+    """Raised by Pipeline.run when a cancellation was requested between stages."""
+    pass
+
+
+@dataclass
+class PipelineStage:
+    """A named step of the processing pipeline."""
+    name: str
+    func: StageFunc
+    enabled: bool = True
+
+
+@dataclass
+class StageTiming:
+    """Measurements recorded for one executed stage."""
+    name: str
+    wall_time_s: float
+    cpu_time_s: float
+    rows_in: int
+    rows_out: int
+    memory_delta_bytes: int # Change of the DataFrame memory footprint (shallow, cheap to measure)
+
+
+@dataclass
+class PipelineReport:
+    """Per-stage timings of a single pipeline run."""
+    stages: List[StageTiming] = field(default_factory=list)
+    skipped_stages: List[str] = field(default_factory=list)
+
+    @property
+    def total_wall_time_s(self) -> float:
+        return sum(stage.wall_time_s for stage in self.stages)
+
+    @property
+    def total_cpu_time_s(self) -> float:
+        return sum(stage.cpu_time_s for stage in self.stages)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the report as plain Python types (e.g. for JSON output)."""
+        return {
+            'stages': [asdict(stage) for stage in self.stages],
+            'skipped_stages': list(self.skipped_stages),
+            'total_wall_time_s': self.total_wall_time_s,
+            'total_cpu_time_s': self.total_cpu_time_s,
+        }
+
+    def to_prometheus(self, prefix: str = "student_pipeline") -> str:
+        """Renders the report in the Prometheus text exposition format."""
+        metrics = [
+            ('stage_wall_seconds', 'Wall time spent in each pipeline stage.', 'wall_time_s'),
+            ('stage_cpu_seconds', 'CPU time spent in each pipeline stage.', 'cpu_time_s'),
+            ('stage_rows_in', 'Rows received by each pipeline stage.', 'rows_in'),
+            ('stage_rows_out', 'Rows produced by each pipeline stage.', 'rows_out'),
+            ('stage_memory_delta_bytes', 'Change of DataFrame memory footprint per stage.', 'memory_delta_bytes'),
+        ]
+        lines = []
+        for metric_name, help_text, attr in metrics:
+            full_name = f"{prefix}_{metric_name}"
+            lines.append(f"# HELP {full_name} {help_text}")
+            lines.append(f"# TYPE {full_name} gauge")
+            for stage in self.stages:
+                lines.append(f'{full_name}{{stage="{stage.name}"}} {getattr(stage, attr)}')
+        return "\n".join(lines) + "\n"
+
+
+def _frame_rows(df: Optional[pd.DataFrame]) -> int:
+    return 0 if df is None else len(df)
+
+
+def _frame_bytes(df: Optional[pd.DataFrame]) -> int:
+    return 0 if df is None else int(df.memory_usage(index=True, deep=False).sum())
+
+
+class Pipeline:
+    """
+    Ordered list of stages that turns the input file into the processed DataFrame.
+    Stages can be added, replaced or skipped by name; every run records timings.
+    """
+    def __init__(self, stages: Optional[List[PipelineStage]] = None):
+        self.stages: List[PipelineStage] = list(stages) if stages else []
+
+    @classmethod
+    def default(cls) -> "Pipeline":
+        """Builds the standard Load -> Clean -> Grade -> Scholarship pipeline."""
+        # Components are looked up at call time so they can be patched in tests
+        return cls([
+            PipelineStage('load', lambda df, config, inplace: DataLoader.load_data(config)),
+            PipelineStage('clean', lambda df, config, inplace: DataCleaner.clean_data(df, config, inplace=inplace)),
+            PipelineStage('grade', lambda df, config, inplace: GradeCalculator.calculate_national_scale(df, config, inplace=inplace)),
+            PipelineStage('scholarship', lambda df, config, inplace: ScholarshipDeterminer.determine_scholarships(df, config, inplace=inplace)),
+        ])
+
+    def stage_names(self) -> List[str]:
+        return [stage.name for stage in self.stages]
+
+    def _index_of(self, name: str) -> int:
+        for i, stage in enumerate(self.stages):
+            if stage.name == name:
+                return i
+        raise ValueError(f"Stage '{name}' not found in pipeline. Available stages: {self.stage_names()}")
+
+    def add_stage(self, stage: PipelineStage, before: Optional[str] = None, after: Optional[str] = None) -> None:
+        """Inserts a stage before/after a named stage, or appends it at the end."""
+        if stage.name in self.stage_names():
+            raise ValueError(f"Stage '{stage.name}' already exists in pipeline.")
+        if before is not None and after is not None:
+            raise ValueError("Specify either 'before' or 'after', not both.")
+        if before is not None:
+            self.stages.insert(self._index_of(before), stage)
+        elif after is not None:
+            self.stages.insert(self._index_of(after) + 1, stage)
+        else:
+            self.stages.append(stage)
+
+    def replace_stage(self, name: str, func: StageFunc) -> None:
+        """Swaps the implementation of a named stage."""
+        self.stages[self._index_of(name)].func = func
+
+    def remove_stage(self, name: str) -> None:
+        del self.stages[self._index_of(name)]
+
+    def skip_stage(self, name: str) -> None:
+        self.stages[self._index_of(name)].enabled = False
+
+    def enable_stage(self, name: str) -> None:
+        self.stages[self._index_of(name)].enabled = True
+
+    def run(self, config: AppConfig, inplace: bool = False,
+            on_stage_complete: Optional[Callable[[str, pd.DataFrame], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> Tuple[Optional[pd.DataFrame], PipelineReport]:
+        """
+        Runs the enabled stages in order.
+
+        Args:
+            config: The application configuration object.
+            inplace: Passed to every stage; see AppConfig.inplace_pipeline.
+            on_stage_complete: Optional callback called with (stage name, output DataFrame).
+            is_cancelled: Optional callable checked before every stage.
+
+        Raises:
+            PipelineCancelled: If is_cancelled() returned True before a stage.
+
+        Returns:
+            The output of the last stage and the PipelineReport of this run.
+        """
+        report = PipelineReport()
+        df: Optional[pd.DataFrame] = None
+
+        for stage in self.stages:
+            if not stage.enabled:
+                logging.info(f"Pipeline: skipping stage '{stage.name}'")
+                report.skipped_stages.append(stage.name)
+                continue
+            if is_cancelled is not None and is_cancelled():
+                logging.info(f"Pipeline: cancelled before stage '{stage.name}'")
+                raise PipelineCancelled(f"Pipeline cancelled before stage '{stage.name}'.")
+
+            rows_in = _frame_rows(df)
+            bytes_in = _frame_bytes(df)
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+
+            df = stage.func(df, config, inplace)
+
+            timing = StageTiming(
+                name=stage.name,
+                wall_time_s=time.perf_counter() - wall_start,
+                cpu_time_s=time.process_time() - cpu_start,
+                rows_in=rows_in,
+                rows_out=_frame_rows(df),
+                memory_delta_bytes=_frame_bytes(df) - bytes_in,
+            )
+            report.stages.append(timing)
+            logging.info(f"Pipeline: stage '{stage.name}' finished in {timing.wall_time_s:.3f}s "
+                         f"(cpu {timing.cpu_time_s:.3f}s, rows {timing.rows_in} -> {timing.rows_out})")
+
+            if on_stage_complete is not None:
+                on_stage_complete(stage.name, df)
+
+        return df, report
@@ -1,10 +1,10 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 import logging
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Callable, Hashable
 
 from .config import AppConfig
 
@@ -18,6 +18,48 @@ SCORE_MAP_345 = {
 # Create bins and labels for pd.cut based on the map
 BINS_345 = [59] + [upper for lower, upper in sorted(SCORE_MAP_345.keys())]
 LABELS_345 = [score for (lower, upper), score in sorted(SCORE_MAP_345.items(), key=lambda item: item[0][0])]
+PIE_LABELS_345 = {3: 'Satisfactory (3)', 4: 'Good (4)', 5: 'Excellent (5)'}
+
+# Position in LABELS_345 of every integer score 0..100 (-1: not on the 3/4/5 scale),
+# same right-closed bins as pd.cut(bins=BINS_345)
+_LOOKUP_345 = np.searchsorted(BINS_345, np.arange(BINS_345[-1] + 1), side='left') - 1
+
+
+def _score_block(df: pd.DataFrame, config: AppConfig) -> np.ndarray:
+    """The numeric subject score columns of df as one float matrix (NaN for missing)."""
+    score_cols = [col for col in config.subject_score_columns
+                  if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+    return df[score_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _score_codes_345(block: np.ndarray) -> np.ndarray:
+    """
+    Maps a block of scores to positions in LABELS_345 (-1 for missing scores
+    and scores outside 60-100). Integer scores go through the lookup table,
+    fractional ones through a binary search over the same bins.
+    """
+    codes = np.full(block.shape, -1, dtype=np.intp)
+    with np.errstate(invalid='ignore'):
+        in_table = (block >= 0) & (block <= BINS_345[-1]) & (block == np.floor(block))
+    codes[in_table] = _LOOKUP_345[block[in_table].astype(np.intp)]
+
+    other = ~in_table & ~np.isnan(block)
+    if other.any():
+        values = block[other]
+        other_codes = np.searchsorted(BINS_345, values, side='left') - 1
+        other_codes[values > BINS_345[-1]] = -1
+        codes[other] = other_codes
+    return codes
+
+
+def pie_chart_series(counts: np.ndarray) -> pd.Series:
+    """Turns counts of 3/4/5 into the pie chart Series (labels as index, zero counts dropped)."""
+    present = np.flatnonzero(counts)
+    if present.size == 0:
+        return pd.Series(dtype=int) # Return empty series if no valid scores
+    labels = [PIE_LABELS_345[LABELS_345[i]] for i in present]
+    return pd.Series(counts[present], index=labels, name='count')
+
 
 def _prepare_pie_chart_data(group_df: pd.DataFrame, config: AppConfig) -> pd.Series:
     """
@@ -31,24 +73,34 @@ def _prepare_pie_chart_data(group_df: pd.DataFrame, config: AppConfig) -> pd.Ser
     Returns:
         A pandas Series with counts for each simplified score (3, 4, 5).
     """
-    all_scores_345 = []
-    for score_col in config.subject_score_columns:
-        if score_col in group_df.columns and pd.api.types.is_numeric_dtype(group_df[score_col]):
-            simplified_scores = pd.cut(
-                group_df[score_col],
-                bins=BINS_345,
-                labels=LABELS_345,
-                right=True,
-                include_lowest=False
-            ).dropna().astype(int)
-            all_scores_345.extend(simplified_scores.tolist())
-
-    if not all_scores_345:
-        return pd.Series(dtype=int)
-
-    score_counts = pd.Series(all_scores_345).value_counts().sort_index()
-    score_counts.index = score_counts.index.map({3: 'Satisfactory (3)', 4: 'Good (4)', 5: 'Excellent (5)'})
-    return score_counts
+    codes = _score_codes_345(_score_block(group_df, config)).ravel()
+    counts = np.bincount(codes[codes >= 0], minlength=len(LABELS_345))
+    return pie_chart_series(counts)
+
+
+def prepare_pie_chart_matrix(df: pd.DataFrame, config: AppConfig) -> pd.DataFrame:
+    """
+    Counts the simplified scores (3/4/5) of all groups at once with a single
+    bincount over (group, score) pairs.
+
+    Args:
+        df: The processed DataFrame with all groups.
+        config: Application configuration.
+
+    Returns:
+        A DataFrame of counts: one row per group (sorted), one column per
+        simplified score label. Rows without a group are not counted.
+    """
+    group_codes, groups = pd.factorize(df[config.group_column], sort=True)
+    codes = _score_codes_345(_score_block(df, config))
+    keys = group_codes[:, np.newaxis] * len(LABELS_345) + codes
+    valid = (codes >= 0) & (group_codes[:, np.newaxis] >= 0)
+    counts = np.bincount(keys[valid], minlength=len(groups) * len(LABELS_345))
+    return pd.DataFrame(
+        counts.reshape(len(groups), len(LABELS_345)),
+        index=pd.Index(groups, name=config.group_column),
+        columns=[PIE_LABELS_345[score] for score in LABELS_345],
+    )
 
 
 def create_group_performance_pie(group_df: pd.DataFrame, group_id: str, config: AppConfig) -> Optional[Figure]:
@@ -69,7 +121,10 @@ def create_group_performance_pie(group_df: pd.DataFrame, group_id: str, config:
             logging.warning(f"No valid scores found for group {group_id} to generate pie chart.")
             return None
 
-        fig, ax = plt.subplots(figsize=(6, 6))
+        # A standalone Figure (not registered with pyplot) can be cached and
+        # garbage-collected freely; see FigureCache
+        fig = Figure(figsize=(6, 6))
+        ax = fig.add_subplot()
         ax.pie(score_counts, labels=score_counts.index, autopct='%1.1f%%', startangle=90, counterclock=False)
         ax.axis('equal')
         ax.set_title(f'Успішність Групи {group_id} (3/4/5 балів)')
@@ -78,7 +133,6 @@ def create_group_performance_pie(group_df: pd.DataFrame, group_id: str, config:
         return fig 
     except Exception as e:
         logging.error(f"Failed to create pie chart figure for group {group_id}: {e}", exc_info=True)
-        plt.close('all')
         return None
 
 
@@ -108,15 +162,18 @@ def create_student_scores_bar(student_data: pd.Series, config: AppConfig) -> Opt
             logging.warning(f"No valid scores found for student {student_name} to generate bar chart.")
             return None
 
-        fig, ax = plt.subplots(figsize=(8, 5))
+        fig = Figure(figsize=(8, 5))
+        ax = fig.add_subplot()
         bars = ax.bar(scores_series.index, scores_series.values, color='cornflowerblue') 
         ax.set_ylabel('Бал')
         ax.set_title(f'Оцінки Студента: {student_name}')
         ax.set_ylim(0, 105)
-        plt.xticks(rotation=40, ha='right', fontsize=9)
+        ax.tick_params(axis='x', labelsize=9, labelrotation=40)
+        for label in ax.get_xticklabels():
+            label.set_horizontalalignment('right')
 
         ax.bar_label(bars, fmt='%.0f')
-        plt.tight_layout()
+        fig.tight_layout()
 
         # plt.savefig(...) 
         # plt.close(fig)
@@ -125,5 +182,44 @@ def create_student_scores_bar(student_data: pd.Series, config: AppConfig) -> Opt
 
     except Exception as e:
         logging.error(f"Failed to create bar chart figure for student {student_name}: {e}", exc_info=True)
-        plt.close('all') 
-        return None
\ No newline at end of file
+        return None
+
+
+class FigureCache:
+    """
+    LRU cache of built figures, keyed e.g. by ('group', group_id, dataset_version).
+
+    Including the dataset version in the key means figures of modified data
+    are never returned; they simply age out of the cache.
+    """
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self._figures: "OrderedDict[Hashable, Figure]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._figures
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Optional[Figure]]) -> Optional[Figure]:
+        """Returns the cached figure for key, building it with factory() on a miss (None is not cached)."""
+        fig = self._figures.get(key)
+        if fig is not None:
+            self.hits += 1
+            self._figures.move_to_end(key)
+            return fig
+
+        self.misses += 1
+        fig = factory()
+        if fig is not None:
+            self._figures[key] = fig
+            while len(self._figures) > self.maxsize:
+                evicted_key, _ = self._figures.popitem(last=False)
+                logging.debug(f"Figure cache: evicted {evicted_key}")
+        return fig
+
+    def clear(self) -> None:
+        self._figures.clear()
@@ -0,0 +1,69 @@
+import pandas as pd
+import numpy as np
+import logging
+from dataclasses import dataclass, field
+from typing import Dict, List, Hashable
+
+from .config import AppConfig
+
+LOW_SCORE_THRESHOLD = 65  # "any score below" list of the group report
+HIGH_SCORE_THRESHOLD = 95 # "any score above" list of the group report
+
+
+@dataclass
+class GroupReportAggregates:
+    """Everything the PDF report needs beyond the group statistics."""
+    subject_averages: Dict[str, float] = field(default_factory=dict)
+    low_performers: List[str] = field(default_factory=list)  # Any score < LOW_SCORE_THRESHOLD
+    high_performers: List[str] = field(default_factory=list) # Any score > HIGH_SCORE_THRESHOLD
+
+
+def _subject_name(score_column: str) -> str:
+    return score_column.replace('(бали)', '').replace('(Бали)', '').strip()
+
+
+def _names_by_group(names: pd.Series, codes: np.ndarray, flags: np.ndarray) -> Dict[int, List[str]]:
+    """Sorted unique names of the flagged rows, per group code."""
+    frame = pd.DataFrame({'code': codes[flags], 'name': names.to_numpy()[flags]}).dropna()
+    frame = frame.drop_duplicates().sort_values(['code', 'name'], kind='stable')
+    return {code: chunk.tolist() for code, chunk in frame.groupby('code', sort=False)['name']}
+
+
+def compute_group_report_aggregates(df: pd.DataFrame, config: AppConfig) -> Dict[Hashable, GroupReportAggregates]:
+    """
+    Computes subject averages and the below/above-threshold student lists of
+    every group in one grouped pass over the score matrix.
+
+    Args:
+        df: The processed DataFrame (or any subset of it, e.g. one group).
+        config: The application configuration object.
+
+    Returns:
+        A GroupReportAggregates per group id (rows without a group are ignored).
+    """
+    score_cols = [col for col in config.subject_score_columns
+                  if col in df.columns and pd.api.types.is_numeric_dtype(df[col])]
+    codes, uniques = pd.factorize(df[config.group_column], use_na_sentinel=True)
+    in_group = codes >= 0
+
+    block = df[score_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+    means = pd.DataFrame(block[in_group], columns=score_cols).groupby(codes[in_group]).mean()
+
+    # NaN compares False, so missing scores never flag a student
+    with np.errstate(invalid='ignore'):
+        any_low = (block < LOW_SCORE_THRESHOLD).any(axis=1) & in_group
+        any_high = (block > HIGH_SCORE_THRESHOLD).any(axis=1) & in_group
+    names = df[config.name_column]
+    low_by_group = _names_by_group(names, codes, any_low)
+    high_by_group = _names_by_group(names, codes, any_high)
+
+    aggregates = {}
+    for code, group_id in enumerate(uniques):
+        averages = means.loc[code] if code in means.index else pd.Series(dtype=np.float64)
+        aggregates[group_id] = GroupReportAggregates(
+            subject_averages={_subject_name(col): float(avg) if pd.notna(avg) else 0.0 for col, avg in averages.items()},
+            low_performers=low_by_group.get(code, []),
+            high_performers=high_by_group.get(code, []),
+        )
+    logging.debug(f"Report aggregates computed for {len(aggregates)} groups.")
+    return aggregates
@@ -0,0 +1,220 @@
+import tkinter as tk
+from tkinter import ttk
+import pandas as pd
+import numpy as np
+import logging
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+
+
+def format_cell(value: Any) -> str:
+    """Display text of a grid cell: integral numbers without decimals, others with two."""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ''
+    if isinstance(value, (float, np.floating)):
+        return f"{value:.0f}" if float(value).is_integer() else f"{value:.2f}"
+    return str(value)
+
+
+class ResultGridModel:
+    """
+    Sorted/filtered view over a DataFrame for the virtualized result grid.
+
+    The frame itself is never copied: the view is an array of row positions
+    in the current sort order, restricted to the rows matching the filter.
+    Only the rows actually requested by rows() are formatted.
+    """
+    def __init__(self, df: pd.DataFrame, columns: Sequence[str]):
+        self.df = df
+        self.columns = list(columns)
+        self.sort_column: Optional[str] = None
+        self.ascending = True
+        self.filter_text = ''
+        self._order = np.arange(len(df))          # All rows, in sort order
+        self._mask = np.ones(len(df), dtype=bool) # Rows matching the filter
+        self._view = self._order
+        self._search_text: Dict[str, np.ndarray] = {} # Lower-cased display text per column, built on first filter
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    @property
+    def positions(self) -> np.ndarray:
+        """Row positions (for df.iloc) of the current view, in display order."""
+        return self._view
+
+    def rows(self, start: int, stop: int) -> List[Tuple[str, ...]]:
+        """Formatted cells of the view rows [start, stop)."""
+        positions = self._view[start:stop]
+        if positions.size == 0:
+            return []
+        columns = [self.df[col].iloc[positions].tolist() for col in self.columns]
+        return [tuple(format_cell(value) for value in row) for row in zip(*columns)]
+
+    def sort(self, column: str, ascending: Optional[bool] = None) -> None:
+        """
+        Sorts by a column (stable, missing values last). Sorting the same column
+        again without an explicit direction reverses the order. Columns mixing
+        numbers and text (e.g. groups 342 and '345а') are sorted by their text.
+        """
+        if column not in self.columns:
+            raise KeyError(f"Column '{column}' is not shown in the grid.")
+        if ascending is None:
+            ascending = not self.ascending if column == self.sort_column else True
+        keys = self.df[column].reset_index(drop=True)
+        if keys.dtype == object and pd.api.types.infer_dtype(keys, skipna=True).startswith('mixed'):
+            keys = keys.astype('string') # int and str cannot be compared; the string dtype keeps missing values
+        self._order = keys.sort_values(ascending=ascending, na_position='last', kind='stable').index.to_numpy()
+        self.sort_column, self.ascending = column, ascending
+        self._view = self._order[self._mask[self._order]]
+
+    def _column_text(self, column: str) -> np.ndarray:
+        if column not in self._search_text:
+            self._search_text[column] = np.array(
+                [format_cell(value).casefold() for value in self.df[column].tolist()], dtype=object
+            )
+        return self._search_text[column]
+
+    def set_filter(self, text: str) -> None:
+        """
+        Keeps only rows where any shown column contains text (case-insensitive).
+        Typing more characters only re-checks the rows that already matched.
+        """
+        text = text.strip().casefold()
+        if text == self.filter_text:
+            return
+        narrowing = bool(self.filter_text) and text.startswith(self.filter_text)
+        candidates = self._view if narrowing else self._order
+        self.filter_text = text
+
+        if not text:
+            self._mask = np.ones(len(self.df), dtype=bool)
+        else:
+            matches = np.zeros(candidates.size, dtype=bool)
+            for column in self.columns:
+                column_text = pd.Series(self._column_text(column)[candidates], dtype=object)
+                matches |= column_text.str.contains(text, regex=False).to_numpy(dtype=bool)
+            self._mask = np.zeros(len(self.df), dtype=bool)
+            self._mask[candidates[matches]] = True
+        self._view = self._order[self._mask[self._order]]
+
+
+class VirtualResultGrid(ttk.Frame):
+    """
+    A ttk.Treeview that shows a ResultGridModel with a fixed pool of items.
+
+    Only as many Treeview rows as fit on screen exist; scrolling re-fills
+    them from the model, so showing tens of thousands of rows costs the same
+    as showing a screenful. Click a heading to sort, type in the filter box
+    to filter.
+    """
+    def __init__(self, master, visible_rows: int = 15, **kwargs):
+        super().__init__(master, **kwargs)
+        self.model: Optional[ResultGridModel] = None
+        self._offset = 0
+
+        filter_frame = ttk.Frame(self)
+        filter_frame.pack(side=tk.TOP, fill=tk.X)
+        ttk.Label(filter_frame, text="Фільтр:").pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_var = tk.StringVar()
+        self.filter_var.trace_add('write', lambda *_: self._on_filter_changed())
+        ttk.Entry(filter_frame, textvariable=self.filter_var).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.count_label = ttk.Label(filter_frame, text="")
+        self.count_label.pack(side=tk.RIGHT, padx=5)
+
+        self.tree = ttk.Treeview(self, show='headings', height=visible_rows, selectmode='browse')
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.tree.bind(sequence, self._on_mousewheel)
+        self.tree.bind('<Configure>', lambda event: self._render())
+
+    @property
+    def visible_rows(self) -> int:
+        return int(self.tree.cget('height'))
+
+    def set_data(self, df: pd.DataFrame, columns: Sequence[str], headings: Optional[Sequence[str]] = None,
+                 sort_by: Optional[str] = None) -> None:
+        """Shows df (without copying it) with the given columns."""
+        self.model = ResultGridModel(df, columns)
+        if sort_by is not None:
+            self.model.sort(sort_by, ascending=True)
+        headings = list(headings) if headings is not None else list(columns)
+
+        self.tree.delete(*self.tree.get_children())
+        self.tree['columns'] = list(range(len(columns)))
+        for i, (column, heading) in enumerate(zip(columns, headings)):
+            self.tree.heading(i, text=heading, command=lambda c=column: self._on_heading_click(c))
+            self.tree.column(i, width=80 if i else 220, anchor=tk.W if i == 0 else tk.CENTER, stretch=True)
+
+        self._offset = 0
+        self.filter_var.set('') # Triggers _on_filter_changed -> _render
+        self._render()
+
+    def clear(self) -> None:
+        self.model = None
+        self.tree.delete(*self.tree.get_children())
+        self.count_label.config(text="")
+        self.scrollbar.set(0.0, 1.0)
+
+    def _max_offset(self) -> int:
+        return max(0, len(self.model) - self.visible_rows) if self.model else 0
+
+    def _scroll_to(self, offset: int) -> None:
+        offset = min(max(0, offset), self._max_offset())
+        if offset != self._offset:
+            self._offset = offset
+            self._render()
+
+    def _render(self) -> None:
+        """Fills the item pool with the rows at the current offset."""
+        if self.model is None:
+            return
+        rows = self.model.rows(self._offset, self._offset + self.visible_rows)
+        items = list(self.tree.get_children())
+        for i, values in enumerate(rows):
+            if i < len(items):
+                self.tree.item(items[i], values=values)
+            else:
+                self.tree.insert('', tk.END, values=values)
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+
+        total = len(self.model)
+        if total:
+            self.scrollbar.set(self._offset / total, min(1.0, (self._offset + len(rows)) / total))
+        else:
+            self.scrollbar.set(0.0, 1.0)
+        self.count_label.config(text=f"{total} з {len(self.model.df)}")
+
+    def _on_scrollbar(self, action: str, *args) -> None:
+        if self.model is None:
+            return
+        if action == tk.MOVETO:
+            self._scroll_to(int(float(args[0]) * len(self.model)))
+        elif action == tk.SCROLL:
+            step = int(args[0]) * (self.visible_rows if args[1] == tk.PAGES else 1)
+            self._scroll_to(self._offset + step)
+
+    def _on_mousewheel(self, event) -> str:
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self._offset - 3)
+        else:
+            self._scroll_to(self._offset + 3)
+        return 'break' # The Treeview must not scroll its (fixed) item pool itself
+
+    def _on_heading_click(self, column: str) -> None:
+        if self.model is None:
+            return
+        self.model.sort(column)
+        logging.debug(f"Result grid sorted by '{column}' (ascending={self.model.ascending})")
+        self._offset = 0
+        self._render()
+
+    def _on_filter_changed(self) -> None:
+        if self.model is None:
+            return
+        self.model.set_filter(self.filter_var.get())
+        self._offset = 0
+        self._render()
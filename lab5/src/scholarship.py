@@ -2,24 +2,24 @@ import pandas as pd
 import numpy as np
 from .config import AppConfig
 import logging
-import math
 
 class ScholarshipDeterminer:
     """Calculates GPA and determines scholarship recipients."""
 
     @staticmethod
-    def determine_scholarships(df: pd.DataFrame, config: AppConfig) -> pd.DataFrame:
+    def determine_scholarships(df: pd.DataFrame, config: AppConfig, inplace: bool = False) -> pd.DataFrame:
         """
-        Calculates GPA and adds a scholarship marker column.
+        Calculates (credit-weighted) GPA and adds a scholarship marker column.
 
         Args:
             df: DataFrame with score columns.
             config: Application configuration.
+            inplace: If True, adds the columns to df directly instead of a copy.
 
         Returns:
-            DataFrame with 'GPA' and 'Scholarship' columns added.
+            DataFrame with 'GPA' and 'Scholarship' columns added (df itself when inplace=True).
         """
-        df_scholarship = df.copy()
+        df_scholarship = df if inplace else df.copy()
         logging.info("Calculating GPA and determining scholarships...")
 
         # 1. Calculate GPA (Average Score)
@@ -33,31 +33,109 @@ class ScholarshipDeterminer:
              # Decide how to handle this: raise error or add NaN column?
              df_scholarship[config.gpa_column] = np.nan 
         else:
-             logging.info(f"Calculating GPA based on columns: {valid_score_cols}")
-             # mean(axis=1) calculates row-wise mean, skipna=True ignores NaNs
-             df_scholarship[config.gpa_column] = df_scholarship[valid_score_cols].mean(axis=1, skipna=True)
+             weights = config.get_subject_weights(valid_score_cols)
+             logging.info(f"Calculating GPA based on columns: {valid_score_cols} (credit weights: {weights.tolist()})")
+             df_scholarship[config.gpa_column] = ScholarshipDeterminer._weighted_gpa(
+                 df_scholarship[valid_score_cols].to_numpy(dtype=np.float64, na_value=np.nan), weights
+             )
         
         # 2. Determine Scholarship Recipients
         # Handle cases where GPA calculation resulted in NaN (e.g., all scores were NaN)
-        valid_gpa_df = df_scholarship.dropna(subset=[config.gpa_column])
-        
-        if valid_gpa_df.empty:
+        gpa = df_scholarship[config.gpa_column].to_numpy(dtype=np.float64, na_value=np.nan)
+        valid_positions = np.flatnonzero(~np.isnan(gpa))
+        awarded = np.zeros(len(df_scholarship), dtype=bool)
+
+        if valid_positions.size == 0:
              logging.warning("No students with valid GPA found. Cannot determine scholarships.")
-             df_scholarship[config.scholarship_column] = '' # Or np.nan
         else:
-             # Calculate the number of scholarships to award (top X%)
-             # Use ceil to ensure if fraction, we round up (or floor depending on exact rule)
-             num_scholarships = math.ceil(len(valid_gpa_df) * config.scholarship_percentage) 
-             logging.info(f"Total students with valid GPA: {len(valid_gpa_df)}. Awarding scholarships to top {config.scholarship_percentage*100:.1f}% ({num_scholarships} students).")
+             quota_mode = config.scholarship_quota_mode
+             if quota_mode == 'global':
+                  group_codes = np.zeros(valid_positions.size, dtype=np.intp)
+             elif quota_mode == 'group':
+                  quota_column = config.scholarship_quota_column or config.group_column
+                  group_codes, _ = pd.factorize(df_scholarship[quota_column].iloc[valid_positions], use_na_sentinel=False)
+             else:
+                  raise ValueError(f"Unknown scholarship quota mode: '{quota_mode}'. Use 'global' or 'group'.")
 
-             # Find the indices of the top N students based on GPA
-             # Handle ties: nlargest keeps all tied entries if they fall within the count
-             top_students_indices = valid_gpa_df[config.gpa_column].nlargest(num_scholarships).index
+             logging.info(f"Total students with valid GPA: {valid_positions.size}. Awarding scholarships to top {config.scholarship_percentage*100:.1f}% "
+                          f"(quota mode: {quota_mode}, tie policy: {config.scholarship_tie_policy}).")
+             awarded[valid_positions] = ScholarshipDeterminer._select_top_k(
+                 gpa[valid_positions], group_codes, config.scholarship_percentage, config.scholarship_tie_policy
+             )
+             logging.info(f"Marked {int(awarded.sum())} students for scholarship.")
 
-             # Mark scholarship recipients
-             df_scholarship[config.scholarship_column] = '' # Initialize column
-             df_scholarship.loc[top_students_indices, config.scholarship_column] = config.scholarship_marker
-             logging.info(f"Marked {len(top_students_indices)} students for scholarship.") # This might be > num_scholarships due to ties
+        # Stored as a two-category column ('' / marker) instead of repeated strings
+        df_scholarship[config.scholarship_column] = pd.Categorical.from_codes(
+            awarded.astype(np.int8), categories=['', config.scholarship_marker]
+        )
 
         logging.info("Scholarship determination completed.")
-        return df_scholarship
\ No newline at end of file
+        return df_scholarship
+
+    @staticmethod
+    def _weighted_gpa(scores: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """
+        Credit-weighted row mean that ignores missing scores.
+
+        Computed as two matrix-vector products over the score block: the weighted
+        sum of the present scores, divided by the sum of weights of the present
+        scores. Rows without any score (or with zero total weight) get NaN.
+        With equal weights this is the plain mean(axis=1, skipna=True).
+        """
+        present = ~np.isnan(scores)
+        weighted_sum = np.where(present, scores, 0.0) @ weights
+        weight_total = present.astype(np.float64) @ weights
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(weight_total > 0, weighted_sum / weight_total, np.nan)
+
+    @staticmethod
+    def _select_top_k(gpa: np.ndarray, group_codes: np.ndarray, percentage: float, tie_policy: str) -> np.ndarray:
+        """
+        Selects the top ceil(n_g * percentage) students of every group in one pass.
+
+        Rows are sorted once by (group, -GPA, original position); a student's rank
+        within the group is then its sorted position minus the group start.
+
+        Args:
+            gpa: GPA values (no NaNs).
+            group_codes: Integer group code for every row (all zeros for a global quota).
+            percentage: Share of each group that receives a scholarship.
+            tie_policy: How students tied with the last awarded GPA are handled:
+                        'first' - exactly the quota, earlier rows win ties;
+                        'include' - all tied students are awarded (may exceed the quota);
+                        'exclude' - tied students are awarded only if all of them fit.
+
+        Returns:
+            Boolean mask of awarded rows.
+        """
+        if tie_policy not in ('first', 'include', 'exclude'):
+            raise ValueError(f"Unknown scholarship tie policy: '{tie_policy}'. Use 'first', 'include' or 'exclude'.")
+
+        n = gpa.size
+        order = np.lexsort((np.arange(n), -gpa, group_codes))
+        sorted_codes = group_codes[order]
+        sorted_gpa = gpa[order]
+
+        group_sizes = np.bincount(group_codes)
+        group_starts = np.concatenate(([0], np.cumsum(group_sizes)[:-1]))
+        quotas = np.ceil(group_sizes * percentage).astype(np.intp)
+
+        ranks = np.arange(n) - group_starts[sorted_codes]
+        selected_sorted = ranks < quotas[sorted_codes]
+
+        if tie_policy != 'first':
+            # GPA of the last student inside each (non-empty) quota
+            has_quota = (quotas > 0) & (group_sizes > 0)
+            cutoff = np.full(group_sizes.size, np.inf)
+            cutoff[has_quota] = sorted_gpa[group_starts[has_quota] + np.minimum(quotas, group_sizes)[has_quota] - 1]
+            row_cutoff = cutoff[sorted_codes]
+            if tie_policy == 'include':
+                selected_sorted = sorted_gpa >= row_cutoff
+            else:
+                at_or_above = np.bincount(sorted_codes, weights=sorted_gpa >= row_cutoff, minlength=group_sizes.size)
+                ties_fit = at_or_above <= quotas
+                selected_sorted = (sorted_gpa > row_cutoff) | ((sorted_gpa == row_cutoff) & ties_fit[sorted_codes])
+
+        selected = np.empty(n, dtype=bool)
+        selected[order] = selected_sorted
+        return selected
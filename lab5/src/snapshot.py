@@ -0,0 +1,240 @@
+import pandas as pd
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .config import AppConfig
+
+SNAPSHOT_FORMAT_VERSION = 1
+METADATA_FILE_NAME = "snapshot.json"
+DATA_FILE_NAMES = {'feather': "processed.feather", 'pickle': "processed.pkl"}
+
+# Settings that do not change the processed data and so do not invalidate a snapshot
+_NON_DATA_SETTINGS = {
+    'output_dir', 'output_file', 'reports_dir', 'report_workers', 'chunk_size',
+    'inplace_pipeline', 'target_group', 'snapshot_dir', 'snapshot_format',
+}
+
+
+def _canonical(value: Any) -> Any:
+    """Converts a config value to a JSON-serializable form with a stable order."""
+    if isinstance(value, dict):
+        return sorted([repr(key), _canonical(item)] for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    return str(value) # Paths, numpy dtypes, ...
+
+
+def _code_digest(code) -> str:
+    """Digest of a code object: bytecode, names and constants (nested code objects recursively)."""
+    digest = hashlib.sha256(code.co_code)
+    digest.update(repr(code.co_names).encode('utf-8'))
+    for const in code.co_consts:
+        # The repr of a code object holds its memory address, so hash its content instead
+        digest.update((_code_digest(const) if hasattr(const, 'co_code') else repr(const)).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def _function_identity(func) -> list:
+    """
+    Name of a stage function plus a digest of its code and closure values, so
+    that two lambdas or closures from the same scope do not look identical.
+    """
+    identity = [f"{getattr(func, '__module__', None)}.{getattr(func, '__qualname__', type(func).__qualname__)}"]
+    code = getattr(func, '__code__', None)
+    if code is not None:
+        identity.append(_code_digest(code))
+    for cell in getattr(func, '__closure__', None) or ():
+        try:
+            value = cell.cell_contents
+        except ValueError: # Empty cell
+            value = None
+        identity.append(_function_identity(value) if callable(value) else _canonical(value))
+    return identity
+
+
+def config_fingerprint(config: AppConfig, pipeline=None) -> str:
+    """
+    Hash of every setting that influences processed_df, plus the enabled
+    pipeline stages and their code (so custom pipelines do not share snapshots).
+    """
+    settings = {name: _canonical(value) for name, value in sorted(vars(config).items())
+                if name not in _NON_DATA_SETTINGS}
+    if pipeline is not None:
+        settings['__pipeline__'] = [
+            [stage.name, _function_identity(stage.func)]
+            for stage in pipeline.stages if stage.enabled
+        ]
+    payload = json.dumps(settings, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_info(path: Path, with_hash: bool = True) -> Dict[str, Any]:
+    stat = path.stat()
+    info = {'path': str(path.resolve()), 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+    if with_hash:
+        info['sha256'] = _file_sha256(path)
+    return info
+
+
+def resolve_format(config: AppConfig) -> str:
+    """
+    The snapshot format for config.snapshot_format: Feather (memory-mapped
+    Arrow) when pyarrow is installed, otherwise a pandas pickle.
+    """
+    requested = getattr(config, 'snapshot_format', 'auto')
+    has_pyarrow = importlib.util.find_spec('pyarrow') is not None
+    if requested == 'auto':
+        return 'feather' if has_pyarrow else 'pickle'
+    if requested not in DATA_FILE_NAMES:
+        raise ValueError(f"Unknown snapshot format: '{requested}'. Use 'auto', 'feather' or 'pickle'.")
+    if requested == 'feather' and not has_pyarrow:
+        logging.warning("Snapshot format 'feather' needs pyarrow, which is not installed. Using 'pickle'.")
+        return 'pickle'
+    return requested
+
+
+def _write_frame(df: pd.DataFrame, path: Path, data_format: str) -> None:
+    if data_format == 'feather':
+        from pyarrow import feather
+        feather.write_feather(df, str(path)) # The index is stored in the pandas metadata and restored on read
+    else:
+        df.to_pickle(path)
+
+
+def _read_frame(path: Path, data_format: str) -> pd.DataFrame:
+    if data_format == 'feather':
+        from pyarrow import feather
+        # Zero-copy Arrow conversion can give read-only arrays; the what-if methods write in place
+        return feather.read_table(str(path), memory_map=False).to_pandas().copy()
+    return pd.read_pickle(path)
+
+
+def _replace_atomically(path: Path, write) -> None:
+    """Writes via a temporary file in the same directory, then renames it over path."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def _store_frame(df: pd.DataFrame, snapshot_dir: Path, data_format: str) -> Tuple[str, Path]:
+    """
+    Writes the frame in data_format; returns the format used and the file.
+    Arrow cannot store object columns that mix types (e.g. groups 342 and
+    '345а'), so such frames fall back to pickle, which keeps them unchanged.
+    """
+    if data_format == 'feather':
+        from pyarrow.lib import ArrowException
+        data_path = snapshot_dir / DATA_FILE_NAMES['feather']
+        try:
+            _replace_atomically(data_path, lambda tmp: _write_frame(df, tmp, 'feather'))
+            return 'feather', data_path
+        except ArrowException as e:
+            logging.info(f"Processed data cannot be stored as Feather ({e}); using pickle.")
+            data_path.unlink(missing_ok=True)
+    data_path = snapshot_dir / DATA_FILE_NAMES['pickle']
+    _replace_atomically(data_path, lambda tmp: _write_frame(df, tmp, 'pickle'))
+    return 'pickle', data_path
+
+
+def save_snapshot(df: pd.DataFrame, config: AppConfig, pipeline=None) -> Path:
+    """
+    Stores processed_df with the config fingerprint and the state of the
+    source file in config.snapshot_dir.
+
+    Returns:
+        The path of the snapshot metadata file.
+    """
+    snapshot_dir = Path(config.snapshot_dir)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    meta_path = snapshot_dir / METADATA_FILE_NAME
+
+    # Metadata goes first and comes back last, so an interrupted save leaves no valid snapshot
+    meta_path.unlink(missing_ok=True)
+    data_format, data_path = _store_frame(df, snapshot_dir, resolve_format(config))
+    metadata = {
+        'format_version': SNAPSHOT_FORMAT_VERSION,
+        'data_format': data_format,
+        'data_file': data_path.name,
+        'pandas_version': pd.__version__,
+        'config_fingerprint': config_fingerprint(config, pipeline),
+        'source': _source_info(Path(config.input_file)),
+        'rows': len(df),
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+    }
+    _replace_atomically(meta_path, lambda tmp: tmp.write_text(json.dumps(metadata, ensure_ascii=False, indent=2), encoding='utf-8'))
+    logging.info(f"Processed data snapshot saved to {data_path} ({len(df)} rows, {data_format}).")
+    return meta_path
+
+
+def _validation_error(metadata: Dict[str, Any], config: AppConfig, pipeline) -> Optional[str]:
+    """Why the snapshot cannot be used, or None if it matches the source and config."""
+    if metadata.get('format_version') != SNAPSHOT_FORMAT_VERSION:
+        return "snapshot format version changed"
+    if metadata.get('pandas_version') != pd.__version__:
+        return f"written by pandas {metadata.get('pandas_version')}, running {pd.__version__}"
+    if metadata.get('config_fingerprint') != config_fingerprint(config, pipeline):
+        return "configuration changed"
+
+    source_path = Path(config.input_file)
+    if not source_path.exists():
+        return f"source file {source_path} not found"
+    recorded = metadata.get('source', {})
+    current = _source_info(source_path, with_hash=False)
+    if current['path'] != recorded.get('path'):
+        return "different source file"
+    if current['size'] != recorded.get('size'):
+        return "source file size changed"
+    # Same size and mtime: unchanged. A new mtime alone (copy, touch) is checked by content
+    if current['mtime_ns'] != recorded.get('mtime_ns') and _file_sha256(source_path) != recorded.get('sha256'):
+        return "source file content changed"
+    return None
+
+
+def load_snapshot(config: AppConfig, pipeline=None) -> Optional[pd.DataFrame]:
+    """
+    Returns the snapshot of processed_df if it was made from the current
+    source file with the current configuration, otherwise None (the reason
+    is logged).
+    """
+    meta_path = Path(config.snapshot_dir) / METADATA_FILE_NAME
+    if not meta_path.exists():
+        logging.info("No processed data snapshot found.")
+        return None
+    try:
+        metadata = json.loads(meta_path.read_text(encoding='utf-8'))
+        reason = _validation_error(metadata, config, pipeline)
+        if reason is not None:
+            logging.info(f"Processed data snapshot is stale ({reason}); running the pipeline.")
+            return None
+        if metadata['data_format'] == 'feather' and importlib.util.find_spec('pyarrow') is None:
+            logging.info("Processed data snapshot is in Feather format, but pyarrow is not installed.")
+            return None
+        df = _read_frame(meta_path.with_name(metadata['data_file']), metadata['data_format'])
+    except Exception as e: # Corrupt or unreadable snapshot: fall back to the pipeline
+        logging.warning(f"Could not read the processed data snapshot: {e}")
+        return None
+
+    if len(df) != metadata.get('rows'):
+        logging.warning("Processed data snapshot is incomplete; running the pipeline.")
+        return None
+    logging.info(f"Loaded processed data snapshot from {metadata['created_at']} ({len(df)} rows).")
+    return df
@@ -0,0 +1,57 @@
+import logging
+import threading
+from typing import Dict, Any, Callable, Hashable, Tuple
+
+
+class StatsCache:
+    """
+    Memoizes statistics dictionaries keyed by (dataset version, key).
+
+    The owner bumps the dataset version whenever the underlying data changes;
+    entries of older versions are dropped and can never be returned again.
+    Thread-safe: the GUI reads statistics on the Tk thread while background
+    jobs (e.g. batch reports) read them on the worker thread.
+    """
+    def __init__(self):
+        self._entries: Dict[Tuple[int, Hashable], Dict[str, Any]] = {}
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock() # Reentrant: a computation may read other cached statistics
+
+    def invalidate(self) -> None:
+        """Starts a new dataset version and drops all cached entries."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+        logging.debug(f"Statistics cache invalidated (dataset version {self.version}).")
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Returns the cached dictionary for key, computing and storing it on a miss.
+        A shallow copy is returned so callers cannot modify the cached entry.
+        """
+        with self._lock: # Held while computing, so concurrent callers do not compute the same entry twice
+            cache_key = (self.version, key)
+            if cache_key in self._entries:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self._entries[cache_key] = compute()
+            return dict(self._entries[cache_key])
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def info(self) -> Dict[str, Any]:
+        """Returns cache counters (hits, misses, hit rate, entries, dataset version)."""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hit_rate,
+                'entries': len(self._entries),
+                'dataset_version': self.version,
+            }
@@ -0,0 +1,124 @@
+import pandas as pd
+import numpy as np
+import math
+import logging
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ScholarshipRanking:
+    """
+    Maintained GPA order of every scholarship quota group.
+
+    Each group keeps its rows sorted by (-GPA, row position), the same order
+    ScholarshipDeterminer._select_top_k produces with a full sort. Changing one
+    GPA only moves that row inside its group (binary search + array shift), and
+    the awarded set is read off the front of each group, so what-if updates do
+    not re-sort the cohort.
+    """
+    def __init__(self, gpa: np.ndarray, groups: Optional[np.ndarray] = None):
+        """
+        Builds the ranking.
+
+        Args:
+            gpa: GPA of every row of processed_df (NaN rows are not ranked).
+            groups: Quota group key of every row, or None for one global quota.
+        """
+        self._gpa = np.asarray(gpa, dtype=np.float64).copy()
+        n = self._gpa.size
+        self._row_group = np.empty(n, dtype=object)
+        self._row_group[:] = self._normalize_keys(groups, n)
+        self._groups: Dict[Hashable, Tuple[np.ndarray, np.ndarray]] = {}
+
+        positions = np.flatnonzero(~np.isnan(self._gpa))
+        if positions.size:
+            # One sort by (group, -GPA, position), then split into groups
+            codes, uniques = pd.factorize(self._row_group[positions], use_na_sentinel=False)
+            order = np.lexsort((positions, -self._gpa[positions], codes))
+            boundaries = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+            for code, chunk in enumerate(np.split(order, boundaries)):
+                sorted_positions = positions[chunk]
+                self._groups[uniques[code]] = (-self._gpa[sorted_positions], sorted_positions)
+        logging.debug(f"Scholarship ranking built: {positions.size} ranked rows in {len(self._groups)} quota groups.")
+
+    @staticmethod
+    def _normalize_keys(groups: Optional[np.ndarray], n: int) -> np.ndarray:
+        if groups is None:
+            return np.zeros(n, dtype=np.int8)
+        keys = np.asarray(groups, dtype=object)
+        return np.where(pd.isna(keys), None, keys) # All missing groups share one quota
+
+    def __len__(self) -> int:
+        return self._gpa.size
+
+    def _find(self, neg_gpa: np.ndarray, positions: np.ndarray, neg: float, position: int) -> int:
+        """Index of (neg, position) in a group, or of its insertion point."""
+        lo = np.searchsorted(neg_gpa, neg, side='left')
+        hi = np.searchsorted(neg_gpa, neg, side='right')
+        return int(lo + np.searchsorted(positions[lo:hi], position))
+
+    def _remove_from_group(self, position: int) -> None:
+        if np.isnan(self._gpa[position]):
+            return
+        key = self._row_group[position]
+        neg_gpa, positions = self._groups[key]
+        i = self._find(neg_gpa, positions, -self._gpa[position], position)
+        self._groups[key] = (np.delete(neg_gpa, i), np.delete(positions, i))
+
+    def _insert_into_group(self, position: int) -> None:
+        if np.isnan(self._gpa[position]):
+            return
+        key = self._row_group[position]
+        neg = -self._gpa[position]
+        neg_gpa, positions = self._groups.get(key, (np.empty(0), np.empty(0, dtype=np.int64)))
+        i = self._find(neg_gpa, positions, neg, position)
+        self._groups[key] = (np.insert(neg_gpa, i, neg), np.insert(positions, i, position))
+
+    def update(self, position: int, gpa: float) -> None:
+        """Moves a row to the place of its new GPA (NaN removes it from the ranking)."""
+        self._remove_from_group(position)
+        self._gpa[position] = gpa
+        self._insert_into_group(position)
+
+    def append_rows(self, gpa: np.ndarray, groups: Optional[np.ndarray] = None) -> None:
+        """Ranks rows appended at the end of processed_df."""
+        gpa = np.asarray(gpa, dtype=np.float64)
+        start = self._gpa.size
+        self._gpa = np.concatenate((self._gpa, gpa))
+        self._row_group = np.concatenate((self._row_group, self._normalize_keys(groups, gpa.size)))
+        for position in range(start, self._gpa.size):
+            self._insert_into_group(position)
+
+    def remove_rows(self, positions: np.ndarray) -> None:
+        """Drops rows from the ranking; positions of the following rows shift down."""
+        removed = np.unique(np.asarray(positions, dtype=np.int64))
+        for position in removed.tolist():
+            self._remove_from_group(position)
+        self._gpa = np.delete(self._gpa, removed)
+        self._row_group = np.delete(self._row_group, removed)
+        for key, (neg_gpa, group_positions) in self._groups.items():
+            # Subtract the number of removed rows before each position (keeps the order)
+            self._groups[key] = (neg_gpa, group_positions - np.searchsorted(removed, group_positions))
+
+    def awarded(self, percentage: float, tie_policy: str) -> np.ndarray:
+        """
+        Returns the boolean scholarship mask for the current ranking, with the
+        same quota and tie semantics as ScholarshipDeterminer._select_top_k.
+        """
+        if tie_policy not in ('first', 'include', 'exclude'):
+            raise ValueError(f"Unknown scholarship tie policy: '{tie_policy}'. Use 'first', 'include' or 'exclude'.")
+
+        mask = np.zeros(self._gpa.size, dtype=bool)
+        for neg_gpa, positions in self._groups.values():
+            quota = min(math.ceil(positions.size * percentage), positions.size)
+            if quota == 0:
+                continue
+            end = quota
+            if tie_policy != 'first':
+                cutoff = neg_gpa[quota - 1]
+                tied_end = int(np.searchsorted(neg_gpa, cutoff, side='right'))
+                if tie_policy == 'include':
+                    end = tied_end
+                elif tied_end > quota: # 'exclude': the tied students do not all fit
+                    end = int(np.searchsorted(neg_gpa, cutoff, side='left'))
+            mask[positions[:end]] = True
+        return mask
@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+import tracemalloc
 
 from src.config import AppConfig
 from src.analysis import DataAnalyzer
@@ -168,4 +169,152 @@ def test_save_processed_data_saver_error(mocker, analyzer_with_data, test_config
     """Перевіряє прокидання помилки від ReportSaver."""
     mocker.patch('src.report_saver.ReportSaver.save_results', side_effect=ReportSaverError("Cannot write"))
     with pytest.raises(ReportSaverError, match="Cannot write"):
-        analyzer_with_data.save_processed_data()
\ No newline at end of file
+        analyzer_with_data.save_processed_data()
+
+
+@pytest.fixture
+def pipeline_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics', 'History']
+    return config
+
+def _make_synthetic_cohort(config, n_students, seed=0):
+    rng = np.random.default_rng(seed)
+    data = {
+        config.name_column: [f"Student {i}" for i in range(n_students)],
+        config.group_column: rng.choice(['G1', 'G2', 'G3', 'G4'], n_students),
+    }
+    for col in config.subject_score_columns:
+        data[col] = rng.integers(40, 101, n_students).astype(float)
+    return pd.DataFrame(data)
+
+def _pipeline_peak_memory(mocker, config, cohort):
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=cohort)
+    analyzer = DataAnalyzer(config)
+    tracemalloc.start()
+    try:
+        analyzer.process_data()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return analyzer, peak
+
+def test_process_data_inplace_matches_copy_mode(mocker, pipeline_config):
+    """Перевіряє, що режим in-place дає той самий результат, що й режим з копіюванням."""
+    cohort = _make_synthetic_cohort(pipeline_config, 1000)
+
+    copy_analyzer, _ = _pipeline_peak_memory(mocker, pipeline_config, cohort.copy())
+    pipeline_config.inplace_pipeline = True
+    inplace_analyzer, _ = _pipeline_peak_memory(mocker, pipeline_config, cohort.copy())
+
+    pd.testing.assert_frame_equal(inplace_analyzer.processed_df, copy_analyzer.processed_df)
+    assert copy_analyzer.raw_df is not None
+    assert inplace_analyzer.raw_df is None
+
+def test_process_data_inplace_peak_memory(mocker, pipeline_config):
+    """Перевіряє, що пікова пам'ять у режимі in-place не перевищує розмір набору даних."""
+    n_students = 100_000
+    dataset_bytes = _make_synthetic_cohort(pipeline_config, n_students).memory_usage(index=True, deep=True).sum()
+
+    _, copy_peak = _pipeline_peak_memory(mocker, pipeline_config, _make_synthetic_cohort(pipeline_config, n_students))
+    pipeline_config.inplace_pipeline = True
+    _, inplace_peak = _pipeline_peak_memory(mocker, pipeline_config, _make_synthetic_cohort(pipeline_config, n_students))
+
+    assert inplace_peak < copy_peak / 2
+    assert inplace_peak < dataset_bytes
+
+
+def _processed_analyzer(mocker, config, cohort):
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=cohort)
+    analyzer = DataAnalyzer(config)
+    analyzer.process_data()
+    return analyzer
+
+def _assert_matches_full_run(mocker, analyzer, config, cohort):
+    expected = _processed_analyzer(mocker, config, cohort).processed_df
+    actual = analyzer.processed_df
+    columns = [config.gpa_column, config.scholarship_column] + \
+              [config.get_national_scale_column_name(col) for col in config.subject_score_columns]
+    pd.testing.assert_frame_equal(actual[columns].reset_index(drop=True), expected[columns].reset_index(drop=True),
+                                  check_dtype=False, check_categorical=False)
+
+def test_what_if_update_score_matches_full_run(mocker, pipeline_config):
+    """Перевіряє, що зміна однієї оцінки дає той самий результат, що й повна обробка."""
+    cohort = _make_synthetic_cohort(pipeline_config, 500)
+    analyzer = _processed_analyzer(mocker, pipeline_config, cohort.copy())
+    version = analyzer.dataset_version
+
+    changed = analyzer.update_score(10, 'Math', 100)
+    analyzer.update_score(20, 'Physics', 150) # Поза діапазоном -> пропуск
+    cohort.loc[10, 'Math'] = 100
+    cohort.loc[20, 'Physics'] = np.nan
+
+    assert analyzer.dataset_version > version
+    assert all(label in analyzer.processed_df.index for label in changed)
+    _assert_matches_full_run(mocker, analyzer, pipeline_config, cohort)
+
+def test_what_if_percentage_and_group_quota(mocker, pipeline_config):
+    """Перевіряє зміну відсотка стипендій, зокрема з квотами за групами."""
+    cohort = _make_synthetic_cohort(pipeline_config, 500)
+    analyzer = _processed_analyzer(mocker, pipeline_config, cohort.copy())
+    scholars_before = analyzer.get_overall_stats()['scholarship_recipients_count']
+
+    changed = analyzer.set_scholarship_percentage(pipeline_config.scholarship_percentage + 0.1)
+    assert analyzer.get_overall_stats()['scholarship_recipients_count'] == scholars_before + len(changed)
+    _assert_matches_full_run(mocker, analyzer, pipeline_config, cohort)
+
+    pipeline_config.scholarship_quota_mode = 'group'
+    analyzer.set_scholarship_percentage(0.2)
+    _assert_matches_full_run(mocker, analyzer, pipeline_config, cohort)
+
+    with pytest.raises(ValueError):
+        analyzer.set_scholarship_percentage(1.5)
+
+def test_what_if_after_manual_in_place_edit(mocker, pipeline_config):
+    """Перевіряє, що invalidate_caches після ручного редагування скидає рейтинг GPA."""
+    cohort = _make_synthetic_cohort(pipeline_config, 200)
+    analyzer = _processed_analyzer(mocker, pipeline_config, cohort.copy())
+    analyzer.update_score(0, 'Math', 100) # Рейтинг побудовано
+    df = analyzer.processed_df
+    label = df.index[df[pipeline_config.scholarship_column] != pipeline_config.scholarship_marker][0]
+
+    df.loc[label, pipeline_config.gpa_column] = 1000.0 # Редагування на місці, повз what-if методи
+    analyzer.invalidate_caches()
+    changed = analyzer.set_scholarship_percentage(pipeline_config.scholarship_percentage)
+
+    assert label in changed
+    assert analyzer.processed_df.loc[label, pipeline_config.scholarship_column] == pipeline_config.scholarship_marker
+
+def test_what_if_add_and_remove_students(mocker, pipeline_config):
+    """Перевіряє додавання й видалення студентів без повторного запуску конвеєра."""
+    cohort = _make_synthetic_cohort(pipeline_config, 300)
+    analyzer = _processed_analyzer(mocker, pipeline_config, cohort.copy())
+
+    new_students = pd.DataFrame({
+        'Name': ['Нова Студентка', 'Student 5'], # Друге ім'я вже існує
+        'Group': ['G1', 'G2'],
+        'Math': [100.0, 90.0], 'Physics': [100.0, 90.0], 'History': [99.0, 90.0],
+    })
+    analyzer.add_students(new_students)
+    assert len(analyzer.processed_df) == 301
+    assert analyzer.find_student_by_name('Нова') is not None
+    cohort = pd.concat([cohort, new_students.iloc[:1]], ignore_index=True)
+    _assert_matches_full_run(mocker, analyzer, pipeline_config, cohort)
+
+    analyzer.remove_students([0, 1, 300])
+    cohort = cohort.drop(index=[0, 1, 300])
+    _assert_matches_full_run(mocker, analyzer, pipeline_config, cohort)
+
+    with pytest.raises(KeyError):
+        analyzer.remove_students([12345])
+
+def test_process_data_force_reprocesses(mocker, pipeline_config):
+    """Перевіряє, що force=True дозволяє повторну обробку."""
+    analyzer = _processed_analyzer(mocker, pipeline_config, _make_synthetic_cohort(pipeline_config, 10))
+    version = analyzer.dataset_version
+    analyzer.process_data()
+    assert analyzer.dataset_version == version
+    analyzer.process_data(force=True)
+    assert analyzer.dataset_version > version
@@ -0,0 +1,78 @@
+import threading
+import time
+
+import pytest
+
+from src.background import BackgroundWorker
+
+
+def _poll_until(worker, condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "background job did not finish in time"
+        worker.poll()
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def worker():
+    worker = BackgroundWorker()
+    yield worker
+    worker.shutdown(wait=True)
+
+
+def test_job_result_and_progress_delivered_by_poll(worker):
+    """Перевіряє, що результат і прогрес передаються лише через poll() у потоці, який його викликає."""
+    events = []
+    main_thread = threading.current_thread()
+
+    def job_func(job):
+        job.report_progress(0.5, "половина")
+        return 42
+
+    worker.submit("answer", job_func,
+                  on_done=lambda result: events.append(('done', result, threading.current_thread() is main_thread)),
+                  on_progress=lambda fraction, message: events.append(('progress', fraction, message)))
+    _poll_until(worker, lambda: any(event[0] == 'done' for event in events))
+
+    assert events == [('progress', 0.5, "половина"), ('done', 42, True)]
+
+def test_job_error_is_reported(worker):
+    """Перевіряє передачу винятку з фонового завдання."""
+    errors = []
+    job = worker.submit("broken", lambda job: 1 / 0, on_error=errors.append)
+    _poll_until(worker, lambda: errors)
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert job.status == 'failed'
+
+def test_cancel_running_and_queued_jobs(worker):
+    """Перевіряє скасування поточного завдання на контрольній точці та завдань у черзі."""
+    started = threading.Event()
+    cancelled = []
+
+    def long_job(job):
+        started.set()
+        while True:
+            job.check_cancelled()
+            time.sleep(0.01)
+
+    running = worker.submit("long", long_job, on_cancelled=lambda: cancelled.append('long'))
+    queued = worker.submit("queued", lambda job: pytest.fail("must not run"), on_cancelled=lambda: cancelled.append('queued'))
+    assert started.wait(5)
+    worker.cancel_all()
+    _poll_until(worker, lambda: len(cancelled) == 2)
+
+    assert cancelled == ['long', 'queued']
+    assert running.status == queued.status == 'cancelled'
+
+def test_component_exception_after_cancel_counts_as_cancelled(worker):
+    """Перевіряє, що виняток компонента після запиту скасування вважається скасуванням."""
+    outcome = []
+
+    def job_func(job):
+        job.cancel()
+        raise RuntimeError("stopped by component")
+
+    worker.submit("component", job_func, on_error=outcome.append, on_cancelled=lambda: outcome.append('cancelled'))
+    _poll_until(worker, lambda: outcome)
+    assert outcome == ['cancelled']
@@ -0,0 +1,119 @@
+import pytest
+import pandas as pd
+import numpy as np
+import json
+import threading
+from pathlib import Path
+
+from src.config import AppConfig
+from src.analysis import DataAnalyzer
+from src import batch_reports
+
+
+@pytest.fixture
+def report_config(tmp_path):
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.reports_dir = tmp_path / 'reports'
+    return config
+
+@pytest.fixture
+def processed_analyzer(mocker, report_config):
+    rng = np.random.default_rng(0)
+    cohort = pd.DataFrame({
+        'Name': [f"Студент {i}" for i in range(40)],
+        'Group': rng.choice(['536ст', '537ст', 'КН/1'], 40),
+        'Math': rng.integers(50, 101, 40).astype(float),
+        'Physics': rng.integers(50, 101, 40).astype(float),
+    })
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=cohort)
+    analyzer = DataAnalyzer(report_config)
+    analyzer.process_data()
+    return analyzer
+
+
+def test_generate_all_group_reports_in_pool(processed_analyzer, report_config):
+    """Перевіряє генерацію звітів для всіх груп у пулі процесів та маніфест."""
+    manifest = batch_reports.generate_all_group_reports(processed_analyzer, max_workers=2)
+
+    assert manifest.workers == 2
+    assert [report.group_id for report in manifest.reports] == [str(g) for g in processed_analyzer.get_group_ids()]
+    assert not manifest.failed
+    for report in manifest.reports:
+        assert report.wall_time_s > 0
+        with open(report.output_file, 'rb') as f:
+            assert f.read(4) == b'%PDF'
+
+    saved = json.loads((report_config.reports_dir / batch_reports.MANIFEST_FILENAME).read_text(encoding='utf-8'))
+    assert saved['succeeded'] == len(manifest.reports)
+    assert saved['reports'][0]['group_id'] == manifest.reports[0].group_id
+
+def test_generate_all_group_reports_pool_from_thread(mocker, processed_analyzer, report_config):
+    """Перевіряє пул процесів, запущений з фонового потоку (як у GUI), без fork."""
+    pool_spy = mocker.spy(batch_reports, 'ProcessPoolExecutor')
+    outcome = {}
+    thread = threading.Thread(target=lambda: outcome.update(
+        manifest=batch_reports.generate_all_group_reports(processed_analyzer, max_workers=2)))
+    thread.start()
+    thread.join(timeout=120)
+
+    assert not thread.is_alive()
+    assert pool_spy.call_args.kwargs['mp_context'].get_start_method() in ('forkserver', 'spawn')
+    manifest = outcome['manifest']
+    assert len(manifest.reports) == 3
+    assert not manifest.failed
+
+def test_generate_all_group_reports_keeps_ids_with_same_text(mocker, report_config, tmp_path):
+    """Перевіряє, що групи 1 і '1' дають два окремі записи й два окремі файли звітів."""
+    cohort = pd.DataFrame({
+        'Name': ['A', 'B', 'C', 'D'],
+        'Group': pd.Series([1, '1', 1, '1'], dtype=object),
+        'Math': [60.0, 70.0, 80.0, 90.0],
+        'Physics': [65.0, 75.0, 85.0, 95.0],
+    })
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=cohort)
+    analyzer = DataAnalyzer(report_config)
+    analyzer.process_data()
+
+    manifest = batch_reports.generate_all_group_reports(analyzer, tmp_path, max_workers=1)
+
+    assert [report.group_id for report in manifest.reports] == ['1', '1']
+    assert len(manifest.succeeded) == 2
+    output_files = [report.output_file for report in manifest.reports]
+    assert len(set(output_files)) == 2
+    assert all(Path(output_file).read_bytes()[:4] == b'%PDF' for output_file in output_files)
+
+def test_generate_all_group_reports_records_failures(mocker, processed_analyzer, tmp_path):
+    """Перевіряє, що помилка одного звіту фіксується в маніфесті й не зупиняє інші."""
+    def fake_report(group_df, group_stats, group_id, config, output_filepath, aggregates):
+        if group_id == '537ст':
+            raise RuntimeError("broken group")
+        return True
+    mocker.patch('src.pdf_reporter.generate_group_report_pdf', side_effect=fake_report)
+
+    manifest = batch_reports.generate_all_group_reports(processed_analyzer, tmp_path, max_workers=1)
+
+    assert [report.group_id for report in manifest.failed] == ['537ст']
+    assert manifest.failed[0].error == "broken group"
+    assert len(manifest.succeeded) == len(manifest.reports) - 1
+
+def test_report_filename_is_safe():
+    """Перевіряє, що ідентифікатор групи не ламає шлях до файлу."""
+    assert batch_reports.report_filename('КН/1') == 'group_КН_1_report.pdf'
+
+def test_generate_all_group_reports_cancellation(mocker, processed_analyzer, tmp_path):
+    """Перевіряє прогрес і скасування пакетної генерації між звітами."""
+    mocker.patch('src.pdf_reporter.generate_group_report_pdf', return_value=True)
+    progress = []
+
+    manifest = batch_reports.generate_all_group_reports(
+        processed_analyzer, tmp_path, max_workers=1,
+        on_report_complete=lambda result, completed, total: progress.append((completed, total)),
+        is_cancelled=lambda: len(progress) == 1,
+    )
+
+    assert progress == [(1, 3)]
+    assert manifest.cancelled
+    assert len(manifest.reports) == 1
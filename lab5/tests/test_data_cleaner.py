@@ -3,7 +3,7 @@ import pandas as pd
 import numpy as np
 
 from src.config import AppConfig
-from src.data_cleaner import DataCleaner
+from src.data_cleaner import DataCleaner, ScoreValidationSummary, DuplicateTracker
 
 @pytest.fixture
 def test_config():
@@ -71,4 +71,82 @@ def test_clean_data_no_changes_needed(test_config):
         'Score2': [85, 65]
     })
     cleaned_df = DataCleaner.clean_data(clean_df.copy(), test_config)
-    pd.testing.assert_frame_equal(cleaned_df, clean_df)
\ No newline at end of file
+    pd.testing.assert_frame_equal(cleaned_df, clean_df)
+
+
+@pytest.fixture
+def validation_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.subject_score_columns = ['Score1', 'Score2', 'Comment']
+    config.min_score = 60
+    config.max_score = 100
+    return config
+
+def test_invalidate_out_of_range_scores_summary(validation_config):
+    """Перевіряє єдиний векторизований прохід валідації та підсумок."""
+    df = pd.DataFrame({
+        'Score1': [90, 55, 105, 60],
+        'Score2': [59.5, np.nan, 101.0, 100.0],
+        'Comment': ['a', 'b', 'c', 'd'] # Non-numeric, skipped
+    }, index=[10, 11, 12, 13])
+
+    summary = DataCleaner.invalidate_out_of_range_scores(df, validation_config)
+
+    assert isinstance(summary, ScoreValidationSummary)
+    assert summary.columns == ['Score1', 'Score2']
+    assert summary.invalid_mask.tolist() == [[False, True], [True, False], [True, True], [False, False]]
+    assert summary.per_column.to_dict() == {'Score1': 2, 'Score2': 2}
+    assert summary.per_row.to_dict() == {10: 1, 11: 1, 12: 2}
+    assert summary.total_invalid == 4
+
+    # Modified in place
+    assert df['Score1'].isna().tolist() == [False, True, True, False]
+    assert df['Score2'].isna().tolist() == [True, True, True, False]
+
+def test_invalidate_out_of_range_scores_keeps_valid_columns_untouched(validation_config):
+    """Перевіряє, що колонки без невалідних значень не змінюють тип."""
+    df = pd.DataFrame({'Score1': [90, 70], 'Score2': [61, 50], 'Comment': ['a', 'b']})
+    summary = DataCleaner.invalidate_out_of_range_scores(df, validation_config)
+    assert df['Score1'].dtype == 'int64'
+    assert summary.per_column['Score1'] == 0
+    assert pd.isna(df.loc[1, 'Score2'])
+
+
+def test_find_duplicates_normalized_names():
+    """Перевіряє пошук дублікатів з нормалізацією імен за один прохід."""
+    names = pd.Series(['Іван Петренко', 'Олена Коваль', 'іван  петренко', 'Мар’яна Бондар', "МАР'ЯНА БОНДАР ", 'Іван Петренко', None, None],
+                      index=[5, 6, 7, 8, 9, 10, 11, 12])
+
+    report = DataCleaner.find_duplicates(names)
+
+    assert report.keep_mask.tolist() == [True, True, False, True, False, False, True, False]
+    assert report.removed_rows == 4
+    assert report.duplicate_rows == 7
+    assert report.groups['name'].tolist()[:2] == ['Іван Петренко', 'Мар’яна Бондар']
+    assert report.groups['count'].tolist() == [3, 2, 2]
+    assert report.groups['first_index'].tolist() == [5, 8, 11]
+
+def test_duplicate_tracker_across_chunks():
+    """Перевіряє потокове виявлення дублікатів між порціями даних."""
+    tracker = DuplicateTracker()
+
+    first = tracker.keep_mask(pd.Series(['Alice', 'Bob', 'alice']))
+    second = tracker.keep_mask(pd.Series(['BOB', 'Charlie', 'Charlie ']))
+
+    assert first.tolist() == [True, True, False]
+    assert second.tolist() == [False, True, False]
+    assert tracker.rows_seen == 6
+    assert tracker.duplicates_dropped == 3
+
+def test_clean_data_inplace_drops_normalized_duplicates(validation_config):
+    """Перевіряє видалення дублікатів на місці з нормалізацією імен."""
+    validation_config.subject_score_columns = ['Score1', 'Score2']
+    df = pd.DataFrame({
+        'Name': ['Alice', 'ALICE ', 'Bob'],
+        'Score1': [90, 95, 70],
+        'Score2': [80, 85, 75]
+    })
+    cleaned_df = DataCleaner.clean_data(df, validation_config, inplace=True)
+    assert cleaned_df is df
+    assert df['Name'].tolist() == ['Alice', 'Bob']
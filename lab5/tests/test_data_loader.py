@@ -70,4 +70,95 @@ def test_load_data_read_exception(mocker, test_config):
     mocker.patch('pandas.read_excel', side_effect=Exception("Cannot read file"))
 
     with pytest.raises(DataLoaderError, match="Could not read or validate data"):
-        DataLoader.load_data(test_config)
\ No newline at end of file
+        DataLoader.load_data(test_config)
+
+@pytest.fixture
+def stream_config(tmp_path):
+    config = AppConfig()
+    config.name_column = 'Student Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.input_file = tmp_path / 'students.xlsx'
+    return config
+
+@pytest.fixture
+def stream_input_dataframe():
+    return pd.DataFrame({
+        'Student Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
+        'Group': ['A', 'B', 'A', 'B', 'A'],
+        'Math': [90, 75, 'abc', 60, 100],
+        'Physics': [88, '65', 70, None, 95],
+        'Extra': ['x', 'y', 'z', 'w', 'v']
+    })
+
+def test_iter_chunks_excel_typed_batches(stream_config, stream_input_dataframe):
+    """Перевіряє потокове читання Excel порціями з приведенням до схеми."""
+    stream_input_dataframe.to_excel(stream_config.input_file, index=False)
+
+    chunks = list(DataLoader.iter_chunks(stream_config, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    for chunk in chunks:
+        assert list(chunk.columns) == ['Student Name', 'Group', 'Math', 'Physics']
+        assert chunk['Math'].dtype == 'float32'
+        assert chunk['Physics'].dtype == 'float32'
+        assert isinstance(chunk['Group'].dtype, pd.CategoricalDtype)
+        assert chunk['Student Name'].dtype == 'string'
+
+    combined = pd.concat(chunks)
+    assert combined.index.tolist() == [0, 1, 2, 3, 4]
+    assert pd.isna(combined.loc[2, 'Math'])
+    assert pd.isna(combined.loc[3, 'Physics'])
+    assert combined.loc[1, 'Physics'] == 65
+
+def test_iter_chunks_csv(stream_config, stream_input_dataframe):
+    """Перевіряє потокове читання CSV порціями."""
+    stream_config.input_file = stream_config.input_file.with_suffix('.csv')
+    stream_input_dataframe.to_csv(stream_config.input_file, index=False)
+
+    chunks = list(DataLoader.iter_chunks(stream_config, chunk_size=3))
+
+    assert [len(chunk) for chunk in chunks] == [3, 2]
+    assert chunks[1]['Math'].tolist() == [60, 100]
+    assert chunks[0]['Math'].dtype == 'float32'
+
+def test_iter_chunks_share_group_categories(stream_config, stream_input_dataframe):
+    """Перевіряє, що всі порції мають спільні категорії групи і concat лишає колонку категоріальною."""
+    stream_input_dataframe['Group'] = pd.Series([342, '345а', 342, 'B', '345а'], dtype=object)
+    stream_input_dataframe.to_excel(stream_config.input_file, index=False)
+
+    chunks = list(DataLoader.iter_chunks(stream_config, chunk_size=2))
+
+    assert all(chunk['Group'].cat.categories.tolist() == [342, '345а', 'B'] for chunk in chunks)
+    combined = pd.concat(chunks)
+    assert isinstance(combined['Group'].dtype, pd.CategoricalDtype)
+    assert combined['Group'].tolist() == [342, '345а', 342, 'B', '345а']
+
+def test_iter_chunks_declared_group_categories(stream_config, stream_input_dataframe):
+    """Перевіряє задані в конфігурації категорії групи (невідомі групи стають пропусками)."""
+    stream_config.group_categories = ['A']
+    stream_config.input_file = stream_config.input_file.with_suffix('.csv')
+    stream_input_dataframe.to_csv(stream_config.input_file, index=False)
+
+    combined = pd.concat(DataLoader.iter_chunks(stream_config, chunk_size=2))
+
+    assert combined['Group'].cat.categories.tolist() == ['A']
+    assert combined['Group'].isna().tolist() == [False, True, False, True, False]
+
+def test_iter_chunks_rejects_non_positive_chunk_size(stream_config, stream_input_dataframe):
+    """Перевіряє, що нульовий розмір порції не замінюється типовим."""
+    stream_input_dataframe.to_excel(stream_config.input_file, index=False)
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        list(DataLoader.iter_chunks(stream_config, chunk_size=0))
+
+def test_iter_chunks_missing_column(stream_config, stream_input_dataframe):
+    """Перевіряє помилку при відсутній колонці в потоковому режимі."""
+    stream_input_dataframe.drop(columns=['Group']).to_excel(stream_config.input_file, index=False)
+
+    with pytest.raises(KeyError, match=r"Missing required columns: \['Group'\]"):
+        list(DataLoader.iter_chunks(stream_config))
+
+def test_iter_chunks_file_not_found(stream_config):
+    """Перевіряє помилку, коли файл для потокового читання не знайдено."""
+    with pytest.raises(DataLoaderError, match="Input file not found"):
+        list(DataLoader.iter_chunks(stream_config))
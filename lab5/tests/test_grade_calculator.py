@@ -62,4 +62,46 @@ def test_calculate_national_scale_multiple_columns(test_config):
     assert 'Math_Score_Grade' in graded_df.columns
     assert 'Physics_Score_Grade' in graded_df.columns
     assert graded_df['Math_Score_Grade'].tolist() == ["Відмінно", "Задовільно"]
-    assert graded_df['Physics_Score_Grade'].tolist() == ["Добре", "Задовільно"]
\ No newline at end of file
+    assert graded_df['Physics_Score_Grade'].tolist() == ["Добре", "Задовільно"]
+
+@pytest.fixture
+def lookup_config():
+    config = AppConfig()
+    config.subject_score_columns = ['Math', 'Physics']
+    config.min_score = 0
+    config.max_score = 100
+    config.grade_scales = {
+        (89, 100): "Відмінно",
+        (74, 89): "Добре",
+        (59, 74): "Задовільно",
+        (-1, 59): "Незадовільно"
+    }
+    config.national_scale_suffix = '_Grade'
+    return config
+
+def test_calculate_national_scale_shared_categorical_dtype(lookup_config):
+    """Перевіряє, що всі колонки оцінок мають один спільний категоріальний тип."""
+    df = pd.DataFrame({'Math': [0, 59, 60, 100], 'Physics': [74, 75, 89, 90]})
+    graded_df = GradeCalculator.calculate_national_scale(df, lookup_config)
+
+    math_grades = graded_df['Math_Grade']
+    physics_grades = graded_df['Physics_Grade']
+    assert isinstance(math_grades.dtype, pd.CategoricalDtype)
+    assert math_grades.dtype == physics_grades.dtype
+    assert list(math_grades.dtype.categories) == ["Незадовільно", "Задовільно", "Добре", "Відмінно"]
+    assert math_grades.tolist() == ["Незадовільно", "Незадовільно", "Задовільно", "Відмінно"]
+    assert physics_grades.tolist() == ["Задовільно", "Добре", "Добре", "Відмінно"]
+
+def test_calculate_national_scale_matches_pd_cut(lookup_config):
+    """Перевіряє, що таблиця відповідностей дає ті самі оцінки, що й pd.cut, включно з дробовими балами."""
+    values = np.concatenate([np.arange(-2, 103, 0.5), [np.nan]])
+    df = pd.DataFrame({'Math': values, 'Physics': values[::-1]})
+    graded_df = GradeCalculator.calculate_national_scale(df, lookup_config)
+
+    sorted_scales = sorted(lookup_config.grade_scales.items(), key=lambda item: item[0][0])
+    bins = [lookup_config.min_score - 1] + [upper for (lower, upper), grade in sorted_scales]
+    labels = [grade for (lower, upper), grade in sorted_scales]
+    for col in ['Math', 'Physics']:
+        expected = pd.cut(df[col], bins=bins, labels=labels, right=True).astype(object)
+        actual = graded_df[f'{col}_Grade'].astype(object)
+        pd.testing.assert_series_equal(actual, expected, check_names=False)
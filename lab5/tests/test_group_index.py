@@ -0,0 +1,76 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.group_index import GroupIndex
+from src.analysis import DataAnalyzer
+
+
+@pytest.fixture
+def test_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.gpa_column = 'GPA'
+    config.scholarship_column = 'Scholarship'
+    config.scholarship_marker = '*'
+    config.target_group = 'GroupA'
+    return config
+
+@pytest.fixture
+def processed_dataframe(test_config):
+    return pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve', 'Frank'],
+        'Group': ['GroupA', 'GroupB', 'GroupA', 'GroupB', 'GroupA', 'GroupC'],
+        'Math': [100, 90, 80, 100, 70, np.nan],
+        'Physics': [90, 80, 70, 90, 60, np.nan],
+        'GPA': [95.0, 85.0, 75.0, 95.0, 65.0, np.nan],
+        'Scholarship': ['*', '*', '', '*', '', '']
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+def test_group_positions_and_frame(test_config, processed_dataframe):
+    """Перевіряє позиції рядків та вибірку групи з індексу."""
+    index = GroupIndex(processed_dataframe, test_config)
+
+    assert index.groups == ['GroupA', 'GroupB', 'GroupC']
+    assert index.get_positions('GroupA').tolist() == [0, 2, 4]
+    group_df = index.get_frame(processed_dataframe, 'GroupB')
+    assert group_df.index.tolist() == [11, 13]
+    assert index.get_frame(processed_dataframe, 'GroupX') is None
+    assert 'GroupC' in index and 'GroupX' not in index
+
+def test_group_stats_precomputed(test_config, processed_dataframe):
+    """Перевіряє агреговану статистику груп, розраховану за один прохід."""
+    index = GroupIndex(processed_dataframe, test_config)
+
+    stats_a = index.get_stats('GroupA')
+    assert stats_a['students_in_group'] == 3
+    assert stats_a['highest_gpa_student_in_group'] == 'Alice'
+    assert stats_a['lowest_gpa_student_in_group'] == 'Eve'
+    assert stats_a['scholarship_recipients_in_group'] == 1
+    assert stats_a['average_gpa_in_group'] == pytest.approx(235 / 3)
+
+    stats_c = index.get_stats('GroupC') # Only a student without GPA
+    assert stats_c['students_in_group'] == 1
+    assert stats_c['average_gpa_in_group'] is None
+    assert stats_c['highest_gpa_student_in_group'] is None
+
+def test_analyzer_uses_group_index(test_config, processed_dataframe):
+    """Перевіряє, що аналізатор перебудовує індекс лише при заміні processed_df."""
+    analyzer = DataAnalyzer(test_config)
+    analyzer.processed_df = processed_dataframe
+    analyzer._is_processed = True
+
+    assert analyzer.get_group_stats()['students_in_group'] == 3
+    first_index = analyzer._group_index
+    assert analyzer.get_group_data('GroupB')[test_config.name_column].tolist() == ['Bob', 'David']
+    assert analyzer._group_index is first_index
+
+    analyzer.processed_df = processed_dataframe.iloc[:2]
+    assert analyzer.get_group_stats('GroupA')['students_in_group'] == 1
+    assert analyzer._group_index is not first_index
+    with pytest.raises(ValueError, match="Group 'GroupC' not found"):
+        analyzer.get_group_stats('GroupC')
@@ -0,0 +1,90 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.name_index import NameSearchIndex, normalize_name
+from src.analysis import DataAnalyzer
+
+
+@pytest.fixture
+def names():
+    return pd.Series([
+        'Бенч Аріадна Любомирівна',
+        'Чепіга Артем Чеславович',
+        "Мар'яненко  Ада Жданівна",
+        'Кирієнко Анжела Жданівна',
+        None
+    ])
+
+
+def test_normalize_name():
+    """Перевіряє нормалізацію регістру, апострофів та пробілів."""
+    assert normalize_name('  МАР’ЯНЕНКО   Ада ') == "мар'яненко ада"
+    assert normalize_name('Марʼяна') == normalize_name("мар'яна")
+
+def test_search_substring(names):
+    """Перевіряє пошук за підрядком без урахування регістру."""
+    index = NameSearchIndex(names)
+
+    assert index.search('жданівна').tolist() == [2, 3]
+    assert index.search('ЧЕПІГА').tolist() == [1]
+    assert index.search('мар’ян').tolist() == [2] # Different apostrophe
+    assert index.search('мар\'яненко ада').tolist() == [2] # Collapsed whitespace
+    assert index.search('ар').tolist() == [0, 1, 2] # Shorter than a trigram
+    assert index.search('Зоя').tolist() == []
+    assert index.search('').tolist() == [0, 1, 2, 3] # Без рядка з відсутнім ім'ям
+
+def test_search_finds_names_shorter_than_trigram():
+    """Перевіряє, що імена коротші за триграму теж знаходяться."""
+    index = NameSearchIndex(pd.Series(['Ян', 'Іван Ян', 'Ли']))
+    assert index.search('ян').tolist() == [0, 1]
+    assert index.search('ли').tolist() == [2]
+    assert index.search('Л').tolist() == [2]
+    assert index.search('яна').tolist() == []
+
+def test_search_prefix(names):
+    """Перевіряє пошук за префіксом."""
+    index = NameSearchIndex(names)
+    assert index.search_prefix('кир').tolist() == [3]
+    assert index.search_prefix('Бенч Аріадна').tolist() == [0]
+    assert index.search_prefix('Аріадна').tolist() == []
+    assert index.search_prefix('').tolist() == [0, 1, 2, 3]
+
+def test_search_fuzzy(names):
+    """Перевіряє нечіткий пошук з урахуванням помилок."""
+    index = NameSearchIndex(names)
+    assert index.search('Чепига').tolist() == []
+    assert index.search_fuzzy('Чепига', max_distance=1).tolist() == [1]
+    assert index.search_fuzzy('Кириєнко Анжело', max_distance=2).tolist() == [3]
+    assert index.search_fuzzy('Кириєнко Анжело', max_distance=1).tolist() == []
+
+def test_find_student_by_name_uses_index(names):
+    """Перевіряє пошук студента через аналізатор, включно з нечітким режимом."""
+    config = AppConfig()
+    config.name_column = 'Name'
+    analyzer = DataAnalyzer(config)
+    analyzer.processed_df = pd.DataFrame({'Name': names, 'GPA': [90.0, 80.0, 70.0, 60.0, np.nan]})
+    analyzer._is_processed = True
+
+    result = analyzer.find_student_by_name('жданівна')
+    assert result['Name'].tolist() == ["Мар'яненко  Ада Жданівна", 'Кирієнко Анжела Жданівна']
+    assert analyzer.find_student_by_name('Чепига') is None
+    assert analyzer.find_student_by_name('Чепига', max_typos=1)['Name'].tolist() == ['Чепіга Артем Чеславович']
+
+def test_build_indexes_before_first_search(mocker, names):
+    """Перевіряє, що індекс імен можна побудувати заздалегідь, а пошук його використовує."""
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math']
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=pd.DataFrame({
+        'Name': names, 'Group': ['A', 'A', 'B', 'B', 'B'], 'Math': [90.0, 80.0, 70.0, 60.0, 50.0]}))
+    analyzer = DataAnalyzer(config)
+    analyzer.process_data()
+    analyzer.build_indexes()
+
+    built_index = analyzer._name_index
+    assert built_index is not None
+    assert analyzer.find_student_by_name('ада')['Name'].tolist() == ["Мар'яненко  Ада Жданівна"]
+    assert analyzer._name_index is built_index
@@ -0,0 +1,94 @@
+import subprocess
+import sys
+import weakref
+from pathlib import Path
+
+import pandas as pd
+
+from src.config import AppConfig
+from src import pdf_reporter
+
+LAB_ROOT = Path(__file__).parent.parent
+
+
+def test_import_does_not_register_font():
+    """Перевіряє, що імпорт модуля не реєструє шрифт (це відбувається лише під час першого звіту)."""
+    code = ("import src.pdf_reporter; from reportlab.pdfbase import pdfmetrics; "
+            "print('OpenSans' in pdfmetrics.getRegisteredFontNames())")
+    result = subprocess.run([sys.executable, '-c', code], cwd=LAB_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == 'False'
+
+def test_styles_are_cached():
+    """Перевіряє, що стилі створюються один раз і використовують зареєстрований шрифт."""
+    styles = pdf_reporter.get_styles()
+    assert pdf_reporter.get_styles() is styles
+    assert pdf_reporter.styles is styles
+    assert styles['H1'].fontName == pdf_reporter.get_font_name() == pdf_reporter.FONT_NAME
+
+def test_generate_group_report_pdf(tmp_path):
+    """Перевіряє генерацію звіту без попередньо обчислених агрегатів."""
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math']
+    group_df = pd.DataFrame({'Name': ['Аліна', 'Богдан'], 'Group': ['536ст', '536ст'], 'Math': [50, 99]})
+    output = tmp_path / 'report.pdf'
+
+    assert pdf_reporter.generate_group_report_pdf(group_df, {'students_in_group': 2}, '536ст', config, str(output))
+    assert output.read_bytes().startswith(b'%PDF')
+
+def test_generate_student_table_pdf_paginates(mocker, tmp_path):
+    """Перевіряє, що велика таблиця будується частинами по сторінці з простими текстовими клітинками."""
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math (бали)']
+    n_students = 500
+    df = pd.DataFrame({
+        'Name': [f"Студент {i}" for i in range(n_students - 1)] + ['Дуже ' * 40 + 'довге ім\'я'],
+        'Group': '536ст',
+        'Math (бали)': [float(i % 101) for i in range(n_students - 1)] + [float('nan')],
+        'GPA': 75.0,
+        'Scholarship': '',
+    })
+    config.scholarship_column = 'Scholarship'
+    table_spy = mocker.spy(pdf_reporter, 'Table')
+    output = tmp_path / 'students.pdf'
+
+    assert pdf_reporter.generate_student_table_pdf(df, config, str(output), rows_per_chunk=100)
+
+    chunks = [call.args[0] for call in table_spy.call_args_list]
+    assert sum(len(rows) - 1 for rows in chunks) == n_students
+    assert all(len(rows) - 1 <= 100 for rows in chunks)
+    assert all(call.kwargs['repeatRows'] == 1 for call in table_spy.call_args_list)
+    first_row = chunks[0][1]
+    assert first_row[:3] == ['1', 'Студент 0', '536ст'] and first_row[3] == '0'
+    last_row = chunks[-1][-1]
+    assert isinstance(last_row[1], pdf_reporter.Paragraph) # Задовге ім'я переноситься
+    assert last_row[3] == 'N/A'
+    assert output.read_bytes().count(b'/Type /Page\n') > 1
+
+def test_generate_student_table_pdf_streams_chunks(mocker, tmp_path):
+    """Перевіряє, що частини таблиці створюються під час побудови і не накопичуються в пам'яті."""
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math (бали)']
+    config.scholarship_column = 'Scholarship'
+    df = pd.DataFrame({'Name': [f"Студент {i}" for i in range(300)], 'Group': '536ст',
+                       'Math (бали)': 80.0, 'GPA': 80.0, 'Scholarship': ''})
+    real_table = pdf_reporter.Table
+    created = []
+    alive_at_creation = []
+
+    def tracked_table(*args, **kwargs):
+        alive_at_creation.append(sum(ref() is not None for ref in created))
+        table = real_table(*args, **kwargs)
+        created.append(weakref.ref(table))
+        return table
+    mocker.patch.object(pdf_reporter, 'Table', side_effect=tracked_table)
+
+    assert pdf_reporter.generate_student_table_pdf(df, config, str(tmp_path / 'students.pdf'), rows_per_chunk=20)
+
+    assert len(created) >= 15
+    assert max(alive_at_creation) <= 1 # Лише щойно намальована частина ще не звільнена
@@ -0,0 +1,114 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.pipeline import Pipeline, PipelineStage, PipelineReport, PipelineCancelled
+from src.analysis import DataAnalyzer
+
+
+@pytest.fixture
+def test_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.scholarship_marker = '*'
+    return config
+
+@pytest.fixture
+def loaded_dataframe():
+    return pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Alice', 'Charlie'],
+        'Group': ['A', 'B', 'A', 'A'],
+        'Math': [90.0, 70.0, 95.0, 80.0],
+        'Physics': [80.0, 60.0, 85.0, np.nan]
+    })
+
+
+def test_default_pipeline_stage_order():
+    """Перевіряє порядок стадій конвеєра за замовчуванням."""
+    assert Pipeline.default().stage_names() == ['load', 'clean', 'grade', 'scholarship']
+
+def test_run_records_stage_timings(mocker, test_config, loaded_dataframe):
+    """Перевіряє, що для кожної стадії записуються час, рядки та зміна пам'яті."""
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=loaded_dataframe)
+
+    df, report = Pipeline.default().run(test_config)
+
+    assert [stage.name for stage in report.stages] == ['load', 'clean', 'grade', 'scholarship']
+    load, clean, grade, scholarship = report.stages
+    assert (load.rows_in, load.rows_out) == (0, 4)
+    assert (clean.rows_in, clean.rows_out) == (4, 3) # One duplicate removed
+    assert scholarship.rows_out == len(df) == 3
+    assert grade.memory_delta_bytes > 0 # National scale columns added
+    for stage in report.stages:
+        assert stage.wall_time_s >= 0
+        assert stage.cpu_time_s >= 0
+    assert report.total_wall_time_s == pytest.approx(sum(s.wall_time_s for s in report.stages))
+
+def test_skip_and_add_stages(mocker, test_config, loaded_dataframe):
+    """Перевіряє пропуск і додавання стадій."""
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=loaded_dataframe)
+    pipeline = Pipeline.default()
+    pipeline.skip_stage('clean')
+    pipeline.add_stage(
+        PipelineStage('flag_top', lambda df, config, inplace: df.assign(Top=df[config.gpa_column] > 80)),
+        after='scholarship'
+    )
+
+    df, report = pipeline.run(test_config)
+
+    assert report.skipped_stages == ['clean']
+    assert [stage.name for stage in report.stages] == ['load', 'grade', 'scholarship', 'flag_top']
+    assert len(df) == 4
+    assert 'Top' in df.columns
+
+def test_replace_stage(test_config, loaded_dataframe):
+    """Перевіряє заміну реалізації стадії."""
+    pipeline = Pipeline.default()
+    pipeline.replace_stage('load', lambda df, config, inplace: loaded_dataframe.copy())
+    df, _ = pipeline.run(test_config)
+    assert len(df) == 3
+
+def test_unknown_stage_raises():
+    """Перевіряє помилку при зверненні до неіснуючої стадії."""
+    with pytest.raises(ValueError, match="Stage 'export' not found"):
+        Pipeline.default().skip_stage('export')
+    with pytest.raises(ValueError, match="already exists"):
+        Pipeline.default().add_stage(PipelineStage('load', lambda df, config, inplace: df))
+
+def test_report_prometheus_format(mocker, test_config, loaded_dataframe):
+    """Перевіряє експорт звіту у текстовому форматі Prometheus."""
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=loaded_dataframe)
+    analyzer = DataAnalyzer(test_config)
+    analyzer.process_data()
+
+    text = analyzer.get_pipeline_report(prometheus=True)
+    assert '# TYPE student_pipeline_stage_wall_seconds gauge' in text
+    assert 'student_pipeline_stage_rows_out{stage="clean"} 3' in text
+
+    report = analyzer.get_pipeline_report()
+    assert [stage['name'] for stage in report['stages']] == ['load', 'clean', 'grade', 'scholarship']
+    assert analyzer.raw_df is loaded_dataframe
+
+def test_pipeline_report_before_processing(test_config):
+    """Перевіряє помилку при запиті звіту до обробки."""
+    with pytest.raises(RuntimeError, match="Data must be processed"):
+        DataAnalyzer(test_config).get_pipeline_report()
+
+def test_process_data_progress_and_cancellation(mocker, test_config, loaded_dataframe):
+    """Перевіряє звіт про прогрес і скасування між стадіями без втрати попередніх даних."""
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=loaded_dataframe)
+    analyzer = DataAnalyzer(test_config)
+    progress = []
+    analyzer.process_data(on_progress=lambda stage, fraction: progress.append((stage, fraction)))
+    assert progress == [('load', 0.25), ('clean', 0.5), ('grade', 0.75), ('scholarship', 1.0)]
+    processed_df = analyzer.processed_df
+
+    completed = []
+    with pytest.raises(PipelineCancelled):
+        analyzer.process_data(force=True, on_progress=lambda stage, fraction: completed.append(stage),
+                              is_cancelled=lambda: len(completed) == 2)
+    assert completed == ['load', 'clean']
+    assert analyzer.processed_df is processed_df
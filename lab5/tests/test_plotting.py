@@ -0,0 +1,98 @@
+import pytest
+import pandas as pd
+import numpy as np
+import matplotlib.pyplot as plt
+
+from src.config import AppConfig
+from src import plotting
+
+
+@pytest.fixture
+def plot_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math (бали)', 'Physics (бали)']
+    return config
+
+@pytest.fixture
+def group_dataframe():
+    return pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie'],
+        'Group': ['A', 'A', 'A'],
+        'Math (бали)': [95, 80, 61],
+        'Physics (бали)': [70, np.nan, 100],
+    })
+
+
+def test_figures_are_not_registered_with_pyplot(plot_config, group_dataframe):
+    """Перевіряє, що фігури не реєструються в pyplot (їх можна кешувати без витоку пам'яті)."""
+    figures_before = plt.get_fignums()
+    pie = plotting.create_group_performance_pie(group_dataframe, 'A', plot_config)
+    bar = plotting.create_student_scores_bar(group_dataframe.iloc[0], plot_config)
+    assert pie is not None and bar is not None
+    assert plt.get_fignums() == figures_before
+
+def test_figure_cache_lru(plot_config, group_dataframe):
+    """Перевіряє, що кеш фігур повертає збережену фігуру і витісняє найдавніше використану."""
+    cache = plotting.FigureCache(maxsize=2)
+    calls = []
+    def factory(group_id):
+        def build():
+            calls.append(group_id)
+            return plotting.create_group_performance_pie(group_dataframe, group_id, plot_config)
+        return build
+
+    first = cache.get_or_create(('group', 'A', 1), factory('A'))
+    assert cache.get_or_create(('group', 'A', 1), factory('A')) is first
+    cache.get_or_create(('group', 'B', 1), factory('B'))
+    cache.get_or_create(('group', 'A', 1), factory('A')) # A стає найновішою
+    cache.get_or_create(('group', 'C', 1), factory('C')) # витісняє B
+
+    assert calls == ['A', 'B', 'C']
+    assert ('group', 'A', 1) in cache and ('group', 'B', 1) not in cache
+    assert (cache.hits, cache.misses) == (2, 3)
+
+def test_figure_cache_does_not_store_none():
+    """Перевіряє, що невдала побудова (None) не кешується."""
+    cache = plotting.FigureCache()
+    assert cache.get_or_create('empty', lambda: None) is None
+    assert len(cache) == 0
+
+def _reference_pie_counts(group_df, config):
+    """Підрахунок 3/4/5 через pd.cut по кожному стовпцю (попередня реалізація)."""
+    scores = []
+    for col in config.subject_score_columns:
+        scores += pd.cut(group_df[col], bins=plotting.BINS_345, labels=plotting.LABELS_345, right=True).dropna().astype(int).tolist()
+    if not scores:
+        return pd.Series(dtype=int)
+    counts = pd.Series(scores).value_counts().sort_index()
+    counts.index = counts.index.map(plotting.PIE_LABELS_345)
+    return counts
+
+def test_prepare_pie_chart_data_matches_pd_cut(plot_config):
+    """Перевіряє, що bincount по таблиці відповідностей дає ті самі підсумки, що й pd.cut."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'Group': rng.choice(['A', 'B', 'C'], 300),
+        'Math (бали)': rng.integers(50, 101, 300).astype(float),
+        'Physics (бали)': rng.uniform(55, 105, 300), # Дробові бали та бали поза шкалою
+    })
+    df.loc[::7, 'Math (бали)'] = np.nan
+
+    result = plotting._prepare_pie_chart_data(df, plot_config)
+    reference = _reference_pie_counts(df, plot_config)
+    assert result.index.tolist() == reference.index.tolist()
+    assert result.tolist() == reference.tolist()
+
+    matrix = plotting.prepare_pie_chart_matrix(df, plot_config)
+    assert matrix.index.tolist() == ['A', 'B', 'C']
+    for group_id, group_df in df.groupby('Group'):
+        expected = _reference_pie_counts(group_df, plot_config)
+        assert plotting.pie_chart_series(matrix.loc[group_id].to_numpy()).to_dict() == expected.to_dict()
+
+def test_prepare_pie_chart_data_without_valid_scores(plot_config):
+    """Перевіряє порожній результат, коли немає балів у межах 60-100."""
+    df = pd.DataFrame({'Group': ['A', 'A'], 'Math (бали)': [np.nan, 40], 'Physics (бали)': [59, 101]})
+    assert plotting._prepare_pie_chart_data(df, plot_config).empty
+    assert plotting.prepare_pie_chart_matrix(df, plot_config).to_numpy().sum() == 0
@@ -0,0 +1,69 @@
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.analysis import DataAnalyzer
+from src.report_aggregates import compute_group_report_aggregates, GroupReportAggregates
+
+
+@pytest.fixture
+def report_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math (бали)', 'Physics (Бали)']
+    return config
+
+@pytest.fixture
+def report_dataframe():
+    return pd.DataFrame({
+        'Name': ['Bob', 'Alice', 'Charlie', 'David', 'Eve', 'Frank'],
+        'Group': ['A', 'A', 'B', 'B', 'B', None],
+        'Math (бали)': [64, 96, 80, np.nan, 100, 10],
+        'Physics (Бали)': [50, 70, 65, 95, 99, 10],
+    })
+
+
+def test_group_report_aggregates(report_config, report_dataframe):
+    """Перевіряє середні бали та списки студентів за порогами для всіх груп за один прохід."""
+    aggregates = compute_group_report_aggregates(report_dataframe, report_config)
+
+    assert set(aggregates) == {'A', 'B'} # Рядки без групи ігноруються
+    assert aggregates['A'].subject_averages == {'Math': 80.0, 'Physics': 60.0}
+    assert aggregates['A'].low_performers == ['Bob']
+    assert aggregates['A'].high_performers == ['Alice']
+    assert aggregates['B'].subject_averages == {'Math': 90.0, 'Physics': pytest.approx(86.333, abs=1e-3)}
+    assert aggregates['B'].low_performers == [] # 65 не менше 65
+    assert aggregates['B'].high_performers == ['Eve'] # 95 не більше 95
+
+def test_group_report_aggregates_match_single_group(report_config, report_dataframe):
+    """Перевіряє, що агрегати однієї групи збігаються з агрегатами, порахованими для всіх груп."""
+    all_groups = compute_group_report_aggregates(report_dataframe, report_config)
+    single = compute_group_report_aggregates(report_dataframe[report_dataframe['Group'] == 'B'], report_config)
+    assert single == {'B': all_groups['B']}
+
+def test_group_report_aggregates_missing_scores(report_config):
+    """Перевіряє, що група без жодної оцінки отримує середній бал 0.0."""
+    df = pd.DataFrame({'Name': ['X'], 'Group': ['C'], 'Math (бали)': [np.nan], 'Physics (Бали)': [np.nan]})
+    assert compute_group_report_aggregates(df, report_config)['C'] == GroupReportAggregates(
+        subject_averages={'Math': 0.0, 'Physics': 0.0}
+    )
+
+def test_analyzer_report_aggregates_memoized_per_dataset(mocker, report_config, report_dataframe):
+    """Перевіряє, що агрегати всіх груп обчислюються раз, не чіпають кеш статистики й скидаються після змін."""
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=report_dataframe)
+    analyzer = DataAnalyzer(report_config)
+    analyzer.process_data()
+    compute = mocker.patch('src.analysis.compute_group_report_aggregates', wraps=compute_group_report_aggregates)
+    cache_stats = analyzer.get_cache_stats()
+
+    first = analyzer.get_report_aggregates('A')
+    assert analyzer.get_report_aggregates('A') is first
+    assert analyzer.get_report_aggregates('B') is not None
+    assert compute.call_count == 1
+    assert analyzer.get_cache_stats() == cache_stats
+
+    analyzer.update_score(0, 'Math (бали)', 100)
+    assert analyzer.get_report_aggregates('A') != first
+    assert compute.call_count == 2
@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+import pandas as pd
+
+from src.result_grid import ResultGridModel, format_cell
+
+
+@pytest.fixture
+def students_df():
+    return pd.DataFrame({
+        'ПІБ': ['Шевченко Тарас', 'Коваль Олена', 'Бондар Іван', 'Ковальчук Марія', 'Мельник Петро'],
+        'Група': ['КН-1', 'КН-2', 'КН-1', 'КН-2', 'КН-1'],
+        'GPA': [91.5, 78.0, np.nan, 88.25, 78.0],
+    }, index=[10, 20, 30, 40, 50])
+
+def test_format_cell():
+    """Перевіряє форматування клітинок: цілі числа без дробової частини, пропуски порожні."""
+    assert format_cell(90.0) == '90'
+    assert format_cell(88.256) == '88.26'
+    assert format_cell(np.nan) == ''
+    assert format_cell(None) == ''
+    assert format_cell('КН-1') == 'КН-1'
+
+def test_model_does_not_copy_frame(students_df):
+    """Перевіряє, що модель працює з тим самим DataFrame без копіювання."""
+    model = ResultGridModel(students_df, ['ПІБ', 'GPA'])
+    model.sort('GPA')
+    model.set_filter('ков')
+    assert model.df is students_df
+    assert len(model) == 2
+
+def test_rows_formats_only_requested_slice(students_df, mocker):
+    """Перевіряє, що rows() форматує лише запитані рядки."""
+    model = ResultGridModel(students_df, ['ПІБ', 'Група', 'GPA'])
+    spy = mocker.patch('src.result_grid.format_cell', side_effect=format_cell)
+    rows = model.rows(1, 3)
+    assert rows == [('Коваль Олена', 'КН-2', '78'), ('Бондар Іван', 'КН-1', '')]
+    assert spy.call_count == 2 * 3
+    assert model.rows(10, 20) == []
+
+def test_sort_toggles_and_keeps_missing_last(students_df):
+    """Перевіряє стабільне сортування, зміну напрямку повторним викликом і NaN в кінці."""
+    model = ResultGridModel(students_df, ['ПІБ', 'GPA'])
+    model.sort('GPA')
+    assert [row[0] for row in model.rows(0, 5)] == ['Коваль Олена', 'Мельник Петро', 'Ковальчук Марія', 'Шевченко Тарас', 'Бондар Іван']
+
+    model.sort('GPA') # Повторне сортування того ж стовпця - у зворотному порядку
+    assert model.ascending is False
+    assert [row[0] for row in model.rows(0, 5)] == ['Шевченко Тарас', 'Ковальчук Марія', 'Коваль Олена', 'Мельник Петро', 'Бондар Іван']
+
+    with pytest.raises(KeyError):
+        model.sort('Група')
+
+def test_incremental_filter_matches_full_filter(students_df):
+    """Перевіряє, що звуження фільтра дає той самий результат, що й фільтрація з нуля."""
+    model = ResultGridModel(students_df, ['ПІБ', 'Група'])
+    model.sort('ПІБ')
+    for text in ['к', 'ко', 'ков', 'кова', 'коваль', 'КН-2']:
+        model.set_filter(text)
+        fresh = ResultGridModel(students_df, ['ПІБ', 'Група'])
+        fresh.sort('ПІБ')
+        fresh.set_filter(text)
+        np.testing.assert_array_equal(model.positions, fresh.positions)
+
+    model.set_filter('кн-2')
+    assert [row[0] for row in model.rows(0, 10)] == ['Коваль Олена', 'Ковальчук Марія']
+    model.set_filter('')
+    assert len(model) == len(students_df)
+
+def test_sort_keeps_filter(students_df):
+    """Перевіряє, що сортування зберігає активний фільтр."""
+    model = ResultGridModel(students_df, ['ПІБ', 'Група', 'GPA'])
+    model.set_filter('кн-1')
+    model.sort('GPA', ascending=False)
+    assert [row[0] for row in model.rows(0, 10)] == ['Шевченко Тарас', 'Мельник Петро', 'Бондар Іван']
+
+def test_sort_mixed_int_and_str_column():
+    """Перевіряє сортування стовпця, де номери груп - і числа, і рядки."""
+    df = pd.DataFrame({'Група': pd.Series([345, '342а', None, 342, 'КН-1'], dtype=object)})
+    model = ResultGridModel(df, ['Група'])
+
+    model.sort('Група')
+    assert [row[0] for row in model.rows(0, 5)] == ['342', '342а', '345', 'КН-1', '']
+
+    model.sort('Група')
+    assert [row[0] for row in model.rows(0, 5)] == ['КН-1', '345', '342а', '342', '']
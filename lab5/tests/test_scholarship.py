@@ -87,4 +87,90 @@ def test_determine_scholarships_no_valid_gpa(test_config):
     df = pd.DataFrame({'Name': ['A'], 'Math': [np.nan], 'Physics': [np.nan]})
     result_df = ScholarshipDeterminer.determine_scholarships(df.copy(), test_config)
     assert pd.isna(result_df[test_config.gpa_column].iloc[0])
-    assert (result_df[test_config.scholarship_column] == test_config.scholarship_marker).sum() == 0
\ No newline at end of file
+    assert (result_df[test_config.scholarship_column] == test_config.scholarship_marker).sum() == 0
+
+@pytest.fixture
+def quota_config():
+    config = AppConfig()
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.gpa_column = 'GPA'
+    config.scholarship_column = 'Scholarship'
+    config.scholarship_marker = '*'
+    config.scholarship_percentage = 0.5
+    return config
+
+@pytest.fixture
+def grouped_students_dataframe():
+    return pd.DataFrame({
+        'Name':    ['A', 'B', 'C', 'D', 'E', 'F', 'G'],
+        'Group':   ['G1', 'G1', 'G1', 'G1', 'G2', 'G2', 'G2'],
+        'Math':    [90, 80, 80, 60, 70, 95, np.nan],
+        'Physics': [90, 80, 80, 60, 70, 95, np.nan]
+    })
+
+def _awarded(result_df, config):
+    return result_df.loc[result_df[config.scholarship_column] == config.scholarship_marker, 'Name'].tolist()
+
+def test_scholarship_column_is_categorical(quota_config, grouped_students_dataframe):
+    """Перевіряє, що колонка стипендії зберігається як категоріальна."""
+    result_df = ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+    assert isinstance(result_df[quota_config.scholarship_column].dtype, pd.CategoricalDtype)
+    assert list(result_df[quota_config.scholarship_column].cat.categories) == ['', '*']
+    assert _awarded(result_df, quota_config) == ['A', 'B', 'F'] # ceil(6 * 0.5) = 3 globally, G has no GPA
+
+def test_scholarship_group_quota(quota_config, grouped_students_dataframe):
+    """Перевіряє квоти стипендій всередині кожної групи."""
+    quota_config.scholarship_quota_mode = 'group'
+    result_df = ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+    # G1: ceil(4 * 0.5) = 2 -> A, B (B wins the tie with C); G2: ceil(2 * 0.5) = 1 -> F
+    assert _awarded(result_df, quota_config) == ['A', 'B', 'F']
+
+@pytest.mark.parametrize("tie_policy, expected", [
+    ('first', ['A', 'B', 'F']),
+    ('include', ['A', 'B', 'C', 'F']),
+    ('exclude', ['A', 'F']),
+])
+def test_scholarship_group_tie_policies(quota_config, grouped_students_dataframe, tie_policy, expected):
+    """Перевіряє політики розв'язання нічиїх на межі квоти."""
+    quota_config.scholarship_quota_mode = 'group'
+    quota_config.scholarship_tie_policy = tie_policy
+    result_df = ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+    assert _awarded(result_df, quota_config) == expected
+
+def test_scholarship_invalid_settings(quota_config, grouped_students_dataframe):
+    """Перевіряє помилки для невідомих режимів квот і політик нічиїх."""
+    quota_config.scholarship_quota_mode = 'faculty'
+    with pytest.raises(ValueError, match="Unknown scholarship quota mode"):
+        ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+    quota_config.scholarship_quota_mode = 'global'
+    quota_config.scholarship_tie_policy = 'random'
+    with pytest.raises(ValueError, match="Unknown scholarship tie policy"):
+        ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+
+def test_weighted_gpa_with_credits(quota_config):
+    """Перевіряє GPA, зважений кредитами, з ігноруванням пропущених оцінок."""
+    quota_config.subject_credits = {'Math': 3.0, 'Physics': 1.0}
+    df = pd.DataFrame({
+        'Name': ['A', 'B', 'C'],
+        'Group': ['G1', 'G1', 'G1'],
+        'Math':    [100, np.nan, np.nan],
+        'Physics': [60, 80, np.nan]
+    })
+    result_df = ScholarshipDeterminer.determine_scholarships(df, quota_config)
+    gpa = result_df[quota_config.gpa_column]
+    assert gpa.iloc[0] == pytest.approx((3 * 100 + 1 * 60) / 4)
+    assert gpa.iloc[1] == pytest.approx(80.0) # Only Physics present
+    assert pd.isna(gpa.iloc[2])
+
+def test_weighted_gpa_default_is_plain_mean(quota_config, grouped_students_dataframe):
+    """Перевіряє, що без кредитів GPA дорівнює звичайному середньому."""
+    result_df = ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
+    expected = grouped_students_dataframe[['Math', 'Physics']].mean(axis=1, skipna=True)
+    pd.testing.assert_series_equal(result_df[quota_config.gpa_column], expected, check_names=False)
+
+def test_negative_credits_rejected(quota_config, grouped_students_dataframe):
+    """Перевіряє помилку при від'ємних кредитах."""
+    quota_config.subject_credits = {'Math': -1.0}
+    with pytest.raises(ValueError, match="non-negative"):
+        ScholarshipDeterminer.determine_scholarships(grouped_students_dataframe, quota_config)
@@ -0,0 +1,202 @@
+import os
+import sys
+import json
+import types
+import pytest
+import pandas as pd
+import numpy as np
+
+from src.config import AppConfig
+from src.analysis import DataAnalyzer
+from src.pipeline import Pipeline
+from src import snapshot
+
+
+@pytest.fixture
+def snapshot_config(tmp_path):
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.subject_score_columns = ['Math', 'Physics']
+    config.input_file = tmp_path / 'students.xlsx'
+    config.input_file.write_bytes(b'workbook v1')
+    config.snapshot_dir = tmp_path / 'snapshot'
+    return config
+
+@pytest.fixture
+def processed_dataframe():
+    return pd.DataFrame({
+        'Name': pd.array(['Alice', 'Bob', 'Charlie'], dtype='string'),
+        'Group': pd.Categorical(['A', 'B', 'A']),
+        'Math': np.array([90.0, 70.0, np.nan], dtype=np.float32),
+        'GPA': [85.0, 65.0, np.nan],
+    }, index=[0, 2, 5]) # Мітки рядків після очищення не обов'язково підряд
+
+
+def test_snapshot_roundtrip_preserves_frame(snapshot_config, processed_dataframe):
+    """Перевіряє, що знімок відновлює DataFrame разом з типами та індексом."""
+    snapshot.save_snapshot(processed_dataframe, snapshot_config)
+    loaded = snapshot.load_snapshot(snapshot_config)
+    pd.testing.assert_frame_equal(loaded, processed_dataframe)
+
+def test_snapshot_invalidated_by_source_change(snapshot_config, processed_dataframe):
+    """Перевіряє, що зміна вмісту вихідного файлу робить знімок недійсним."""
+    snapshot.save_snapshot(processed_dataframe, snapshot_config)
+    snapshot_config.input_file.write_bytes(b'workbook v2')
+    assert snapshot.load_snapshot(snapshot_config) is None
+
+def test_snapshot_survives_mtime_only_change(snapshot_config, processed_dataframe):
+    """Перевіряє, що новий час зміни без зміни вмісту не скасовує знімок (перевірка хешем)."""
+    snapshot.save_snapshot(processed_dataframe, snapshot_config)
+    stat = snapshot_config.input_file.stat()
+    os.utime(snapshot_config.input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert snapshot.load_snapshot(snapshot_config) is not None
+
+def test_snapshot_invalidated_by_config_or_pipeline_change(snapshot_config, processed_dataframe):
+    """Перевіряє, що зміна налаштувань обробки або стадій конвеєра скасовує знімок."""
+    pipeline = Pipeline.default()
+    snapshot.save_snapshot(processed_dataframe, snapshot_config, pipeline)
+
+    snapshot_config.target_group = 'B' # Не впливає на оброблені дані
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is not None
+
+    pipeline.skip_stage('clean')
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is None
+
+    snapshot_config.scholarship_percentage = 0.4
+    assert snapshot.load_snapshot(snapshot_config, Pipeline.default()) is None
+
+def test_snapshot_invalidated_by_replaced_lambda_or_closure(snapshot_config, processed_dataframe):
+    """Перевіряє, що інша лямбда чи замикання з тим самим іменем стадії скасовує знімок."""
+    def make_stage(multiplier):
+        def stage(df, config):
+            return df * multiplier
+        return stage
+
+    pipeline = Pipeline.default()
+    pipeline.replace_stage('clean', lambda df, config: df)
+    snapshot.save_snapshot(processed_dataframe, snapshot_config, pipeline)
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is not None
+
+    pipeline.replace_stage('clean', lambda df, config: df.dropna())
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is None
+
+    pipeline.replace_stage('clean', make_stage(1))
+    snapshot.save_snapshot(processed_dataframe, snapshot_config, pipeline)
+    pipeline.replace_stage('clean', make_stage(1))
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is not None
+    pipeline.replace_stage('clean', make_stage(2))
+    assert snapshot.load_snapshot(snapshot_config, pipeline) is None
+
+def test_corrupt_or_foreign_snapshot_is_ignored(snapshot_config, processed_dataframe):
+    """Перевіряє, що пошкоджений знімок або знімок іншої версії pandas ігнорується."""
+    meta_path = snapshot.save_snapshot(processed_dataframe, snapshot_config)
+    metadata = json.loads(meta_path.read_text(encoding='utf-8'))
+
+    (snapshot_config.snapshot_dir / metadata['data_file']).write_bytes(b'garbage')
+    assert snapshot.load_snapshot(snapshot_config) is None
+
+    snapshot.save_snapshot(processed_dataframe, snapshot_config)
+    metadata['pandas_version'] = '0.0.1'
+    meta_path.write_text(json.dumps(metadata), encoding='utf-8')
+    assert snapshot.load_snapshot(snapshot_config) is None
+
+def test_resolve_format_without_pyarrow(snapshot_config, mocker):
+    """Перевіряє вибір формату: Feather лише за наявності pyarrow."""
+    mocker.patch('src.snapshot.importlib.util.find_spec', return_value=None)
+    assert snapshot.resolve_format(snapshot_config) == 'pickle'
+    snapshot_config.snapshot_format = 'feather'
+    assert snapshot.resolve_format(snapshot_config) == 'pickle'
+    snapshot_config.snapshot_format = 'parquet'
+    with pytest.raises(ValueError):
+        snapshot.resolve_format(snapshot_config)
+
+def test_process_data_warm_start(mocker, snapshot_config, processed_dataframe):
+    """Перевіряє, що process_data завантажує знімок без запуску конвеєра, а force обробляє файл знову."""
+    run = mocker.patch.object(Pipeline, 'run', return_value=(processed_dataframe, None))
+
+    cold = DataAnalyzer(snapshot_config)
+    cold.process_data(use_snapshot=True)
+    assert run.call_count == 1
+    assert not cold.loaded_from_snapshot
+
+    warm = DataAnalyzer(snapshot_config)
+    warm.process_data(use_snapshot=True)
+    assert run.call_count == 1 # Конвеєр не запускався
+    assert warm.loaded_from_snapshot
+    assert warm.raw_df is None
+    pd.testing.assert_frame_equal(warm.processed_df, processed_dataframe)
+
+    warm.process_data(force=True, use_snapshot=True)
+    assert run.call_count == 2
+    assert not warm.loaded_from_snapshot
+
+def test_process_data_without_snapshot_flag_does_not_write(mocker, snapshot_config, processed_dataframe):
+    """Перевіряє, що без use_snapshot знімок не читається і не записується."""
+    mocker.patch.object(Pipeline, 'run', return_value=(processed_dataframe, None))
+    DataAnalyzer(snapshot_config).process_data()
+    assert not snapshot_config.snapshot_dir.exists()
+
+def _mixed_group_cohort():
+    return pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie', 'David'],
+        'Group': pd.Series([342, '345а', 342, '345а'], dtype=object), # Як у робочій книзі
+        'Math': [90.0, 70.0, 60.0, 100.0],
+        'Physics': [80.0, 75.0, 65.0, 95.0],
+    })
+
+def test_feather_snapshot_with_mixed_group_column(mocker, snapshot_config):
+    """Перевіряє знімок Feather для колонки групи зі змішаними числами й рядками."""
+    pytest.importorskip('pyarrow')
+    snapshot_config.snapshot_format = 'feather'
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=_mixed_group_cohort())
+    cold = DataAnalyzer(snapshot_config)
+    cold.process_data(use_snapshot=True)
+
+    assert not list(snapshot_config.snapshot_dir.glob('*.tmp'))
+    loaded = snapshot.load_snapshot(snapshot_config, cold.pipeline)
+    pd.testing.assert_frame_equal(loaded, cold.processed_df)
+    assert loaded['Group'].tolist() == [342, '345а', 342, '345а']
+
+def test_feather_write_error_falls_back_to_pickle(mocker, snapshot_config, processed_dataframe):
+    """Перевіряє, що помилка запису Feather дає знімок у pickle без тимчасового файлу."""
+    try:
+        from pyarrow.lib import ArrowTypeError
+    except ImportError: # Без pyarrow підставляється модуль з тим самим класом винятку
+        class ArrowTypeError(Exception):
+            pass
+        mocker.patch.dict(sys.modules, {'pyarrow': types.ModuleType('pyarrow'),
+                                        'pyarrow.lib': types.SimpleNamespace(ArrowException=ArrowTypeError)})
+    mocker.patch('src.snapshot.resolve_format', return_value='feather')
+    write_frame = snapshot._write_frame
+
+    def failing_feather(df, path, data_format):
+        if data_format == 'feather':
+            path.write_bytes(b'partial')
+            raise ArrowTypeError("Expected bytes, got a 'int' object")
+        write_frame(df, path, data_format)
+    mocker.patch('src.snapshot._write_frame', side_effect=failing_feather)
+
+    meta_path = snapshot.save_snapshot(processed_dataframe, snapshot_config)
+
+    assert json.loads(meta_path.read_text(encoding='utf-8'))['data_format'] == 'pickle'
+    assert sorted(path.name for path in snapshot_config.snapshot_dir.iterdir()) == ['processed.pkl', 'snapshot.json']
+    pd.testing.assert_frame_equal(snapshot.load_snapshot(snapshot_config), processed_dataframe)
+
+@pytest.mark.parametrize('snapshot_format', ['pickle', 'feather'])
+def test_update_score_after_warm_start(mocker, snapshot_config, snapshot_format):
+    """Перевіряє, що what-if зміни працюють з даними, завантаженими зі знімка."""
+    if snapshot_format == 'feather':
+        pytest.importorskip('pyarrow')
+    snapshot_config.snapshot_format = snapshot_format
+    cohort = _mixed_group_cohort()
+    cohort['Group'] = cohort['Group'].astype(str)
+    mocker.patch('src.data_loader.DataLoader.load_data', return_value=cohort)
+    DataAnalyzer(snapshot_config).process_data(use_snapshot=True)
+
+    warm = DataAnalyzer(snapshot_config)
+    warm.process_data(use_snapshot=True)
+    assert warm.loaded_from_snapshot
+    warm.update_score(warm.processed_df.index[1], 'Math', 100)
+
+    assert warm.processed_df.iloc[1]['Math'] == 100
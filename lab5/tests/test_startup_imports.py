@@ -0,0 +1,43 @@
+import subprocess
+import sys
+from pathlib import Path
+
+LAB_ROOT = Path(__file__).parent.parent
+
+# Loaded on first use (analysis job, first chart or report), not when the window opens
+HEAVY_MODULES = ('pandas', 'numpy', 'matplotlib', 'reportlab')
+# Generous bound for a slow CI machine; locally 'import src.gui' takes about 0.06 s (about 1 s with eager imports)
+IMPORT_TIME_BUDGET_S = 0.5
+
+
+def _import_profile(module: str) -> dict:
+    """Imports a module in a fresh interpreter with -X importtime; returns {module: cumulative seconds}."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            cwd=LAB_ROOT, capture_output=True, text=True, check=True)
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative_us, name = line.split('|')
+        profile[name.strip()] = int(cumulative_us) / 1e6
+    return profile
+
+
+def test_gui_import_does_not_load_heavy_modules():
+    """Перевіряє, що імпорт GUI не завантажує pandas, matplotlib і reportlab."""
+    profile = _import_profile('src.gui')
+    loaded = sorted(name for name in profile if name.split('.')[0] in HEAVY_MODULES)
+    assert loaded == []
+
+def test_gui_import_time_budget():
+    """Перевіряє, що імпорт GUI (до появи вікна) вкладається в бюджет часу."""
+    profile = _import_profile('src.gui')
+    assert profile['src.gui'] < IMPORT_TIME_BUDGET_S, f"import src.gui took {profile['src.gui']:.3f}s"
+
+def test_preload_modules_resolve_relative_to_package():
+    """Перевіряє, що модулі для фонового завантаження імпортуються відносно пакета."""
+    code = ("import sys, types, src.gui as gui; "
+            "gui.StudentAnalysisGUI._preload_modules(types.SimpleNamespace(check_cancelled=lambda: None)); "
+            "print(all(name in sys.modules for name in ('src.plotting', 'src.pdf_reporter', 'src.batch_reports')))")
+    result = subprocess.run([sys.executable, '-c', code], cwd=LAB_ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip().splitlines()[-1] == 'True'
@@ -0,0 +1,118 @@
+import threading
+import time
+
+import pytest
+import pandas as pd
+
+from src.config import AppConfig
+from src.stats_cache import StatsCache
+from src.analysis import DataAnalyzer
+
+
+@pytest.fixture
+def test_config():
+    config = AppConfig()
+    config.name_column = 'Name'
+    config.group_column = 'Group'
+    config.gpa_column = 'GPA'
+    config.scholarship_column = 'Scholarship'
+    config.scholarship_marker = '*'
+    config.target_group = 'GroupA'
+    return config
+
+@pytest.fixture
+def analyzer(test_config):
+    analyzer = DataAnalyzer(test_config)
+    analyzer.processed_df = pd.DataFrame({
+        'Name': ['Alice', 'Bob', 'Charlie'],
+        'Group': ['GroupA', 'GroupB', 'GroupA'],
+        'GPA': [95.0, 85.0, 75.0],
+        'Scholarship': ['*', '*', '']
+    })
+    analyzer._is_processed = True
+    return analyzer
+
+
+def test_stats_cache_hits_and_invalidation():
+    """Перевіряє облік влучань і скидання кешу."""
+    cache = StatsCache()
+    calls = []
+    compute = lambda: calls.append(1) or {'value': len(calls)}
+
+    assert cache.get_or_compute('k', compute) == {'value': 1}
+    assert cache.get_or_compute('k', compute) == {'value': 1}
+    assert cache.info()['hits'] == 1 and cache.info()['misses'] == 1
+    assert cache.hit_rate == pytest.approx(0.5)
+
+    cache.invalidate()
+    assert cache.get_or_compute('k', compute) == {'value': 2}
+    assert cache.info()['dataset_version'] == 1
+
+def test_stats_cache_returns_copies():
+    """Перевіряє, що зміна повернутого словника не псує кеш."""
+    cache = StatsCache()
+    cache.get_or_compute('k', lambda: {'value': 1})['value'] = 100
+    assert cache.get_or_compute('k', lambda: {'value': 2}) == {'value': 1}
+
+def test_analyzer_memoizes_stats(analyzer):
+    """Перевіряє повторне використання обчисленої статистики."""
+    first = analyzer.get_overall_stats()
+    assert analyzer.get_overall_stats() == first
+    analyzer.get_group_stats()
+    analyzer.get_group_stats('GroupA')
+
+    info = analyzer.get_cache_stats()
+    assert info['misses'] == 2
+    assert info['hits'] == 2
+
+def test_analyzer_invalidates_on_new_processed_df(analyzer):
+    """Перевіряє автоматичне скидання кешу при заміні processed_df."""
+    assert analyzer.get_group_stats('GroupA')['students_in_group'] == 2
+    version = analyzer.dataset_version
+
+    analyzer.processed_df = analyzer.processed_df.iloc[:1]
+    assert analyzer.dataset_version == version + 1
+    assert analyzer.get_group_stats('GroupA')['students_in_group'] == 1
+    assert analyzer.get_overall_stats()['total_students'] == 1
+
+def test_analyzer_manual_invalidation_after_inplace_change(analyzer):
+    """Перевіряє ручне скидання кешу після зміни даних на місці."""
+    assert analyzer.get_overall_stats()['scholarship_recipients_count'] == 2
+    analyzer.processed_df.loc[2, 'Scholarship'] = '*'
+    analyzer.invalidate_caches()
+    assert analyzer.get_overall_stats()['scholarship_recipients_count'] == 3
+
+def test_stats_cache_concurrent_callers_compute_once():
+    """Перевіряє, що одночасні запити з кількох потоків обчислюють значення лише раз."""
+    cache = StatsCache()
+    calls = []
+
+    def slow_compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {'value': 1}
+
+    threads = [threading.Thread(target=cache.get_or_compute, args=('k', slow_compute)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert cache.info()['hits'] + cache.info()['misses'] == 8
+
+def test_analyzer_group_stats_from_two_threads(analyzer):
+    """Перевіряє статистику груп, яку одночасно читають потік GUI та фоновий потік."""
+    results = {}
+
+    def read_stats(name):
+        results[name] = [analyzer.get_group_stats(group)['students_in_group'] for group in ['GroupA', 'GroupB'] * 50]
+
+    threads = [threading.Thread(target=read_stats, args=(name,)) for name in ('tk', 'worker')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results['tk'] == results['worker'] == [2, 1] * 50
+    assert analyzer.get_cache_stats()['misses'] == 2
@@ -0,0 +1,58 @@
+import pytest
+import numpy as np
+
+from src.scholarship import ScholarshipDeterminer
+from src.what_if import ScholarshipRanking
+
+
+def _reference_mask(gpa, groups, percentage, tie_policy):
+    """Повний перерахунок через ScholarshipDeterminer._select_top_k."""
+    mask = np.zeros(gpa.size, dtype=bool)
+    valid = np.flatnonzero(~np.isnan(gpa))
+    if valid.size:
+        codes = np.unique(groups[valid], return_inverse=True)[1] if groups is not None else np.zeros(valid.size, dtype=np.intp)
+        mask[valid] = ScholarshipDeterminer._select_top_k(gpa[valid], codes, percentage, tie_policy)
+    return mask
+
+@pytest.mark.parametrize("tie_policy", ['first', 'include', 'exclude'])
+@pytest.mark.parametrize("grouped", [False, True])
+def test_ranking_matches_full_selection(tie_policy, grouped):
+    """Перевіряє, що підтримуваний рейтинг дає той самий результат, що й повне сортування."""
+    rng = np.random.default_rng(1)
+    gpa = rng.integers(60, 70, 200).astype(float) # Багато однакових GPA
+    gpa[rng.choice(200, 10, replace=False)] = np.nan
+    groups = rng.choice(np.array(['A', 'B', 'C'], dtype=object), 200) if grouped else None
+
+    ranking = ScholarshipRanking(gpa, groups)
+    for percentage in (0.0, 0.1, 0.33, 1.0):
+        np.testing.assert_array_equal(ranking.awarded(percentage, tie_policy),
+                                      _reference_mask(gpa, groups, percentage, tie_policy))
+
+def test_ranking_update_append_remove():
+    """Перевіряє інкрементальні зміни рейтингу: зміну GPA, додавання й видалення рядків."""
+    rng = np.random.default_rng(2)
+    gpa = rng.integers(60, 100, 50).astype(float)
+    groups = rng.choice(np.array(['A', 'B'], dtype=object), 50)
+    ranking = ScholarshipRanking(gpa, groups)
+
+    for position, value in [(3, 100.0), (7, np.nan), (7, 61.0), (10, gpa[11])]:
+        ranking.update(position, value)
+        gpa[position] = value
+    np.testing.assert_array_equal(ranking.awarded(0.3, 'first'), _reference_mask(gpa, groups, 0.3, 'first'))
+
+    ranking.append_rows(np.array([99.0, 60.0]), np.array(['C', 'A'], dtype=object))
+    gpa = np.concatenate((gpa, [99.0, 60.0]))
+    groups = np.concatenate((groups, np.array(['C', 'A'], dtype=object)))
+    np.testing.assert_array_equal(ranking.awarded(0.3, 'include'), _reference_mask(gpa, groups, 0.3, 'include'))
+
+    removed = np.array([0, 3, 51])
+    ranking.remove_rows(removed)
+    gpa = np.delete(gpa, removed)
+    groups = np.delete(groups, removed)
+    assert len(ranking) == gpa.size
+    np.testing.assert_array_equal(ranking.awarded(0.3, 'exclude'), _reference_mask(gpa, groups, 0.3, 'exclude'))
+
+def test_ranking_invalid_tie_policy():
+    """Перевіряє помилку для невідомої політики нічиїх."""
+    with pytest.raises(ValueError, match="tie policy"):
+        ScholarshipRanking(np.array([90.0])).awarded(0.5, 'random')